@@ -14,15 +14,35 @@ This is the foundation for the intelligent update system.
 Usage:
     python3 scripts/analyze-elevate-changes.py --from v0.36.1 --to v0.37.0
     python3 scripts/analyze-elevate-changes.py --latest  # Compare with latest
+
+Light, dark and iOS-theme-merged (.elevate-themes/ios) token tables are
+diffed together; every token change lists the modes it affects and the
+Swift call sites (ElevateUI/Sources) that reference its generated property.
+
+    # Compare git revisions of a local ELEVATE clone (no checkout/extraction)
+    python3 scripts/analyze-elevate-changes.py --git-repo ../elevate-design-tokens \
+        --from v0.36.1 --to v0.37.0
+
+    # Change matrix across several versions (each version parsed once)
+    python3 scripts/analyze-elevate-changes.py --versions v0.35.0,v0.36.1,v0.37.0 \
+        --versions-root .elevate-src --span -o matrix.json
+
+    # Stream changes as NDJSON records while they are detected
+    python3 scripts/analyze-elevate-changes.py --git-repo ../elevate-design-tokens \
+        --from v0.30.0 --to v0.37.0 --format ndjson | jq .
 """
 
 import argparse
 import json
 import re
+import subprocess
 import sys
-from dataclasses import dataclass, asdict
+import threading
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, Iterator, List, Mapping, Set, Optional, TextIO, Tuple
 from enum import Enum
 import hashlib
 
@@ -55,17 +75,22 @@ class TokenChange:
     new_value: Optional[str] = None
     component: Optional[str] = None  # Which component this affects
     risk_level: RiskLevel = RiskLevel.LOW
+    modes: List[str] = field(default_factory=list)  # Affected modes (light, dark, theme-light, ...)
+    call_sites: List[str] = field(default_factory=list)  # "File.swift:line" references in Swift sources
 
     def __str__(self):
+        modes = f" [{', '.join(self.modes)}]" if self.modes else ""
+        if self.call_sites:
+            modes += f" ({len(self.call_sites)} call sites)"
         if self.change_type == ChangeType.NEW_TOKEN:
-            return f"  + {self.token_name}: {self.new_value}"
+            return f"  + {self.token_name}: {self.new_value}{modes}"
         elif self.change_type == ChangeType.REMOVED_TOKEN:
-            return f"  - {self.token_name}: {self.old_value}"
+            return f"  - {self.token_name}: {self.old_value}{modes}"
         elif self.change_type == ChangeType.MODIFIED_TOKEN:
-            return f"  ~ {self.token_name}: {self.old_value} → {self.new_value}"
+            return f"  ~ {self.token_name}: {self.old_value} → {self.new_value}{modes}"
         elif self.change_type == ChangeType.RENAMED_TOKEN:
-            return f"  ↻ {self.old_value} → {self.token_name}"
-        return f"  ? {self.token_name}"
+            return f"  ↻ {self.old_value} → {self.token_name}{modes}"
+        return f"  ? {self.token_name}{modes}"
 
 
 @dataclass
@@ -95,15 +120,394 @@ class ChangeReport:
     summary: str
 
 
+@dataclass
+class ThemeOverlay:
+    """
+    iOS theme overlay (.elevate-themes/ios), parsed once and layered over
+    ELEVATE tokens with the same precedence as update-design-tokens-v4.py:
+    overwrite > overrides > primitives > ELEVATE > extend.
+    """
+    primitives: Dict[str, str]
+    extend: Dict[str, str]
+    overrides: Dict[str, str]
+    overwrite: Dict[str, str]
+    overwrite_dark: Dict[str, str]
+
+    def apply(self, base_tokens: Dict[str, str], dark: bool = False) -> Mapping[str, str]:
+        """Theme-merged view of base tokens (no copy of the base table)."""
+        overwrite = self.overwrite_dark if dark and self.overwrite_dark else self.overwrite
+        return ChainMap(overwrite, self.overrides, self.primitives, base_tokens, self.extend)
+
+
+@dataclass
+class ParsedVersion:
+    """Token tables of a single ELEVATE version, parsed once and reused across comparisons"""
+    version: str
+    light_tokens: Dict[str, str]
+    dark_tokens: Dict[str, str]
+    component_tokens: Dict[str, Dict[str, str]]  # Component file stem → tokens
+    theme: Optional[ThemeOverlay] = None
+
+    def token_views(self) -> Dict[str, Mapping[str, str]]:
+        """Token tables per mode, sharing the parsed light/dark data."""
+        views = {"light": self.light_tokens, "dark": self.dark_tokens}
+        if self.theme:
+            views["theme-light"] = self.theme.apply(self.light_tokens)
+            views["theme-dark"] = self.theme.apply(self.dark_tokens, dark=True)
+        return views
+
+
+@dataclass
+class VersionMatrixReport:
+    """Change reports across a sequence of ELEVATE versions"""
+    versions: List[str]
+    pair_reports: List[ChangeReport]  # Consecutive pairs: v1→v2, v2→v3, ...
+    span_report: Optional[ChangeReport]  # First → last (optional)
+    summary: str
+
+
+def _json_default(value):
+    """JSON encoder fallback for enums and paths inside report dataclasses"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ReportTotals:
+    """Running aggregates of a change report, kept without retaining the changes"""
+
+    def __init__(self):
+        self.token_changes = 0
+        self.mode_changes: Dict[str, int] = {}
+        self.new_components = 0
+        self.removed_components = 0
+        self.extended_components = 0
+        self.auto_adaptable_components = 0
+        self.component_effort_minutes = 0
+        self.token_effort_minutes = 0  # Usage-based effort of global token changes
+        self.component_risk_sum = 0.0
+
+    def add_token_change(self, change: TokenChange, effort_minutes: int = 0):
+        self.token_changes += 1
+        self.token_effort_minutes += effort_minutes
+        for mode in change.modes:
+            self.mode_changes[mode] = self.mode_changes.get(mode, 0) + 1
+
+    def add_component_change(self, change: ComponentChange):
+        self.extended_components += 1
+        self.component_effort_minutes += change.estimated_effort_minutes
+        self.component_risk_sum += change.risk_score
+        if change.auto_adaptable:
+            self.auto_adaptable_components += 1
+
+    @property
+    def estimated_total_effort_minutes(self) -> int:
+        return (
+            self.component_effort_minutes
+            + self.token_effort_minutes
+            + self.new_components * 60  # 1 hour per new component
+            + self.removed_components * 30  # 30 min per removal
+        )
+
+    @property
+    def automation_coverage_percent(self) -> int:
+        if not self.extended_components:
+            return 0
+        return int(self.auto_adaptable_components / self.extended_components * 100)
+
+    @property
+    def overall_risk_score(self) -> float:
+        if not self.extended_components:
+            return 0.0
+        return self.component_risk_sum / self.extended_components
+
+
+class NDJSONReportWriter:
+    """
+    Streams change records as newline-delimited JSON while they are detected.
+
+    Each comparison is written as a "report" header, followed by
+    "token_change", "new_component", "removed_component" and
+    "component_change" records, and closed by a "summary" trailer computed
+    from running aggregates. Nothing is buffered besides the current record.
+    """
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.totals = ReportTotals()
+        self._versions = {}
+
+    def _write(self, record_type: str, payload: Dict):
+        record = {"record": record_type, **self._versions, **payload}
+        self.stream.write(json.dumps(record, default=_json_default) + "\n")
+
+    def begin(self, from_version: str, to_version: str):
+        """Start a new comparison and reset the running aggregates."""
+        self.totals = ReportTotals()
+        self._versions = {"from_version": from_version, "to_version": to_version}
+        self._write("report", {})
+        self.stream.flush()
+
+    def token_change(self, change: TokenChange, effort_minutes: int = 0):
+        self.totals.add_token_change(change, effort_minutes)
+        self._write("token_change", asdict(change))
+        self.stream.flush()
+
+    def new_component(self, component: str):
+        self.totals.new_components += 1
+        self._write("new_component", {"component": component})
+        self.stream.flush()
+
+    def removed_component(self, component: str):
+        self.totals.removed_components += 1
+        self._write("removed_component", {"component": component})
+        self.stream.flush()
+
+    def component_change(self, change: ComponentChange):
+        self.totals.add_component_change(change)
+        self._write("component_change", asdict(change))
+        self.stream.flush()
+
+    def finish(self, summary: str) -> ReportTotals:
+        """Write the summary trailer of the current comparison."""
+        totals = self.totals
+        self._write("summary", {
+            "token_changes": totals.token_changes,
+            "mode_changes": totals.mode_changes,
+            "new_components": totals.new_components,
+            "removed_components": totals.removed_components,
+            "extended_components": totals.extended_components,
+            "overall_risk_score": totals.overall_risk_score,
+            "estimated_total_effort_minutes": totals.estimated_total_effort_minutes,
+            "automation_coverage_percent": totals.automation_coverage_percent,
+            "summary": summary,
+        })
+        self.stream.flush()
+        return totals
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+# Shared loader of update-design-tokens-v4.py (scripts/lib)
+if str(SCRIPT_DIR / "lib") not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR / "lib"))
+from elevate_token_generator import load_token_generator  # noqa: E402
+
+
+class SwiftUsageIndex:
+    """
+    Inverted index from generated token properties to Swift call sites.
+
+    All Swift files under the sources directory are scanned once for
+    references like `ButtonComponentTokens.gap_m` or
+    `ElevateAliases.Action.StrongPrimary.fill_default`. Per-file results are
+    cached by content hash, so rebuilding only rescans edited files.
+    Generated token files are skipped: they are regenerated, not adapted.
+    """
+
+    CACHE_VERSION = 1
+    REFERENCE_PATTERN = re.compile(
+        r'\b(?:Elevate(?:Aliases|Primitives)(?:\.[A-Za-z_][A-Za-z0-9_]*)+'
+        r'|[A-Z][A-Za-z0-9]*ComponentTokens\.[A-Za-z_][A-Za-z0-9_]*)'
+    )
+
+    def __init__(self, sources_dir: Path, cache_file: Optional[Path] = None):
+        self.sources_dir = sources_dir
+        self.cache_file = cache_file
+        self.references: Dict[str, List[str]] = {}
+        self.files_scanned = 0
+        self.files_cached = 0
+
+    def build(self) -> "SwiftUsageIndex":
+        """Scan the Swift sources (reusing cached per-file results) and invert them."""
+        cached_files = self._load_cache()
+        files = {}
+
+        for swift_file in sorted(self.sources_dir.rglob("*.swift")):
+            if "Generated" in swift_file.parts:
+                continue
+
+            relative_path = str(swift_file.relative_to(self.sources_dir))
+            data = swift_file.read_bytes()
+            file_hash = hashlib.md5(data).hexdigest()
+
+            cached = cached_files.get(relative_path)
+            if cached and cached["hash"] == file_hash:
+                refs = cached["refs"]
+                self.files_cached += 1
+            else:
+                refs = self._scan(data.decode('utf-8', errors='replace'))
+                self.files_scanned += 1
+
+            files[relative_path] = {"hash": file_hash, "refs": refs}
+
+        self.references = {}
+        for relative_path, entry in files.items():
+            file_name = Path(relative_path).name
+            for reference, line_numbers in entry["refs"].items():
+                self.references.setdefault(reference, []).extend(
+                    f"{file_name}:{line}" for line in line_numbers
+                )
+
+        self._save_cache(files)
+        return self
+
+    def _scan(self, content: str) -> Dict[str, List[int]]:
+        """Collect token property references with their line numbers."""
+        refs: Dict[str, List[int]] = {}
+        for line_number, line in enumerate(content.split('\n'), 1):
+            if 'Elevate' not in line and 'ComponentTokens' not in line:
+                continue
+            for match in self.REFERENCE_PATTERN.finditer(line):
+                refs.setdefault(match.group(0), []).append(line_number)
+        return refs
+
+    def lookup(self, references: List[str]) -> List[str]:
+        """Call sites of any of the given Swift property references."""
+        call_sites = []
+        for reference in references:
+            call_sites.extend(self.references.get(reference, []))
+        return call_sites
+
+    def _load_cache(self) -> Dict:
+        if not self.cache_file or not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("version") != self.CACHE_VERSION:
+            return {}
+        return cache.get("files", {})
+
+    def _save_cache(self, files: Dict):
+        if not self.cache_file:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump({"version": self.CACHE_VERSION, "files": files}, f)
+
+
+class GitObjectReader:
+    """
+    Reads objects from a git repository through one long-lived
+    `git cat-file --batch` process, so comparing revisions needs no
+    checkout or disk extraction.
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = repo_path
+        self._process = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE
+        )
+        self._lock = threading.Lock()
+
+    def read_object(self, spec: str) -> Optional[Tuple[str, str, bytes]]:
+        """
+        Read a single object.
+
+        Args:
+            spec: Object name understood by git (oid, <rev>:<path>, ...)
+
+        Returns:
+            (oid, object type, raw content) or None if the object does not exist
+        """
+        with self._lock:
+            try:
+                self._process.stdin.write(spec.encode('utf-8') + b"\n")
+                self._process.stdin.flush()
+            except (BrokenPipeError, ValueError):
+                # cat-file exited, e.g. because repo_path is not a git repository
+                return None
+
+            header = self._process.stdout.readline().decode('utf-8').split()
+            if len(header) != 3:
+                # "<spec> missing" / "<spec> ambiguous"
+                return None
+
+            oid, obj_type, size = header
+            data = self._process.stdout.read(int(size))
+            self._process.stdout.read(1)  # Trailing LF after content
+
+        return oid, obj_type, data
+
+    def resolve_commit(self, revision: str) -> Optional[str]:
+        """
+        Resolve a revision (tag, branch, commit) to its commit id.
+
+        Returns:
+            Commit oid or None if the revision does not name a commit
+        """
+        obj = self.read_object(f"{revision}^{{commit}}")
+        if obj is None or obj[1] != "commit":
+            return None
+        return obj[0]
+
+    def read_tree(self, spec: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        Read a tree object.
+
+        Returns:
+            (tree oid, dict mapping entry name to object id) or None if missing
+        """
+        obj = self.read_object(spec)
+        if obj is None or obj[1] != "tree":
+            return None
+
+        tree_oid, _, data = obj
+        oid_length = len(tree_oid) // 2  # 20 bytes for SHA-1, 32 for SHA-256
+
+        entries = {}
+        pos = 0
+        while pos < len(data):
+            space = data.index(b" ", pos)
+            nul = data.index(b"\0", space)
+            name = data[space + 1:nul].decode('utf-8')
+            entries[name] = data[nul + 1:nul + 1 + oid_length].hex()
+            pos = nul + 1 + oid_length
+
+        return tree_oid, entries
+
+    def close(self):
+        """Terminate the cat-file process."""
+        try:
+            self._process.stdin.close()
+        except BrokenPipeError:
+            pass  # cat-file already exited
+        self._process.wait()
+        self._process.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
 class ElevateChangeAnalyzer:
     """
     Analyzes changes between ELEVATE versions.
     """
 
-    def __init__(self, elevate_tokens_path: Path):
+    def __init__(self, elevate_tokens_path: Path, usage_index: Optional[SwiftUsageIndex] = None):
         self.tokens_path = elevate_tokens_path
         self.cache_dir = Path.home() / ".elevate-cache"
         self.cache_dir.mkdir(exist_ok=True)
+        self.usage_index = usage_index
+        self._token_mapper = None
+        # Parsed git objects keyed by object id; identical blobs/trees across
+        # revisions share one parsed table and are skipped when diffing
+        self._git_blob_tokens: Dict[str, Dict[str, str]] = {}
+        self._git_component_tables: Dict[str, Dict[str, Dict[str, str]]] = {}
+        # Held while filling them, so concurrent revisions never parse an
+        # object twice (re-entrant: a component table fills blob entries)
+        self._git_lock = threading.RLock()
 
     def parse_scss_tokens(self, scss_file: Path) -> Dict[str, str]:
         """
@@ -118,13 +522,20 @@ class ElevateChangeAnalyzer:
         Returns:
             Dict mapping token name to value
         """
-        tokens = {}
-
         if not scss_file.exists():
-            return tokens
+            return {}
 
         with open(scss_file, encoding='utf-8') as f:
-            content = f.read()
+            return self.parse_scss_content(f.read())
+
+    def parse_scss_content(self, content: str) -> Dict[str, str]:
+        """
+        Extract all token definitions from SCSS source text.
+
+        Returns:
+            Dict mapping token name to value
+        """
+        tokens = {}
 
         # Remove comments first
         # Remove multi-line comments /* ... */
@@ -153,46 +564,148 @@ class ElevateChangeAnalyzer:
         """
         Compare two sets of tokens and identify changes.
         """
-        changes = []
+        return list(self.iter_token_changes(old_tokens, new_tokens))
+
+    def iter_token_changes(
+        self,
+        old_tokens: Dict[str, str],
+        new_tokens: Dict[str, str]
+    ) -> Iterator[TokenChange]:
+        """
+        Yield token changes one at a time as they are detected.
+        """
+        # Shared table (same git blob in both versions): nothing changed
+        if old_tokens is new_tokens:
+            return
 
         old_names = set(old_tokens.keys())
         new_names = set(new_tokens.keys())
 
         # New tokens
         for name in new_names - old_names:
-            changes.append(TokenChange(
-                token_name=name,
-                change_type=ChangeType.NEW_TOKEN,
-                new_value=new_tokens[name],
-                risk_level=RiskLevel.LOW  # New tokens are low risk
-            ))
+            yield self._make_token_change(name, None, new_tokens[name])
 
         # Removed tokens
         for name in old_names - new_names:
-            changes.append(TokenChange(
-                token_name=name,
-                change_type=ChangeType.REMOVED_TOKEN,
-                old_value=old_tokens[name],
-                risk_level=RiskLevel.HIGH  # Removed tokens may break code
-            ))
+            yield self._make_token_change(name, old_tokens[name], None)
 
         # Modified tokens
         for name in old_names & new_names:
             if old_tokens[name] != new_tokens[name]:
-                # Calculate risk based on value change
-                risk = self._assess_token_modification_risk(
-                    name, old_tokens[name], new_tokens[name]
-                )
+                yield self._make_token_change(name, old_tokens[name], new_tokens[name])
+
+    def iter_mode_token_changes(
+        self,
+        old_views: Dict[str, Mapping[str, str]],
+        new_views: Dict[str, Mapping[str, str]]
+    ) -> Iterator[TokenChange]:
+        """
+        Diff all mode views (light, dark, theme-merged) in a single pass.
+
+        Every token name is visited once and looked up in each view; modes
+        with an identical old → new transition are reported as one change
+        listing all affected modes.
+        """
+        # Views backed by the same table on both sides cannot differ
+        modes = [
+            mode for mode in old_views
+            if mode in new_views and old_views[mode] is not new_views[mode]
+        ]
+
+        names = set()
+        for mode in modes:
+            names.update(old_views[mode])
+            names.update(new_views[mode])
+
+        for name in sorted(names):
+            transitions: Dict[Tuple[Optional[str], Optional[str]], List[str]] = {}
+            for mode in modes:
+                old_value = old_views[mode].get(name)
+                new_value = new_views[mode].get(name)
+                if old_value != new_value:
+                    transitions.setdefault((old_value, new_value), []).append(mode)
+
+            for (old_value, new_value), changed_modes in transitions.items():
+                change = self._make_token_change(name, old_value, new_value)
+                change.modes = changed_modes
+                self._attach_call_sites(change)
+                yield change
+
+    def build_usage_index(self, sources_dir: Path) -> SwiftUsageIndex:
+        """
+        Build (or refresh from cache) the token → Swift call site index.
+        """
+        cache_key = hashlib.md5(str(sources_dir.resolve()).encode('utf-8')).hexdigest()[:12]
+        self.usage_index = SwiftUsageIndex(
+            sources_dir,
+            self.cache_dir / f"swift-usage-{cache_key}.json"
+        ).build()
+        return self.usage_index
+
+    def _swift_references(self, token_name: str, component: Optional[str] = None) -> List[str]:
+        """
+        Swift property paths a token is generated as.
+
+        Component file tokens map to <Component>ComponentTokens.<name>;
+        long-form elvt-component-* names are ambiguous for hyphenated
+        components, so every split is returned (lookup filters unknown ones).
+        """
+        def struct_name(parts):
+            return ''.join(part.capitalize() for part in parts) + "ComponentTokens"
+
+        if component:
+            return [f"{struct_name(component.split('-'))}.{token_name.replace('-', '_')}"]
+
+        if token_name.startswith("elvt-component-"):
+            parts = token_name[len("elvt-component-"):].split('-')
+            return [
+                f"{struct_name(parts[:i])}.{'_'.join(parts[i:])}"
+                for i in range(1, len(parts))
+            ]
+
+        if self._token_mapper is None:
+            self._token_mapper = load_token_generator().SwiftTokenMapper()
+        path = self._token_mapper.scss_to_swift_path(token_name)
+        return [path] if path else []
+
+    def _attach_call_sites(self, change: TokenChange, component: Optional[str] = None):
+        """Record where the changed token is used in Swift sources."""
+        if self.usage_index:
+            change.call_sites = self.usage_index.lookup(
+                self._swift_references(change.token_name, component)
+            )
+
+    def _make_token_change(
+        self,
+        name: str,
+        old_value: Optional[str],
+        new_value: Optional[str]
+    ) -> TokenChange:
+        """Classify a single token transition."""
+        if old_value is None:
+            return TokenChange(
+                token_name=name,
+                change_type=ChangeType.NEW_TOKEN,
+                new_value=new_value,
+                risk_level=RiskLevel.LOW  # New tokens are low risk
+            )
 
-                changes.append(TokenChange(
-                    token_name=name,
-                    change_type=ChangeType.MODIFIED_TOKEN,
-                    old_value=old_tokens[name],
-                    new_value=new_tokens[name],
-                    risk_level=risk
-                ))
+        if new_value is None:
+            return TokenChange(
+                token_name=name,
+                change_type=ChangeType.REMOVED_TOKEN,
+                old_value=old_value,
+                risk_level=RiskLevel.HIGH  # Removed tokens may break code
+            )
 
-        return changes
+        # Calculate risk based on value change
+        return TokenChange(
+            token_name=name,
+            change_type=ChangeType.MODIFIED_TOKEN,
+            old_value=old_value,
+            new_value=new_value,
+            risk_level=self._assess_token_modification_risk(name, old_value, new_value)
+        )
 
     def _assess_token_modification_risk(
         self,
@@ -235,37 +748,90 @@ class ElevateChangeAnalyzer:
         Returns:
             (new_components, removed_components, extended_components)
         """
-        old_files = set(f.stem for f in old_component_dir.glob("_*.scss"))
-        new_files = set(f.stem for f in new_component_dir.glob("_*.scss"))
+        return self._diff_component_tables(
+            self._parse_component_dir(old_component_dir),
+            self._parse_component_dir(new_component_dir)
+        )
+
+    def _parse_component_dir(self, component_dir: Path) -> Dict[str, Dict[str, str]]:
+        """Parse every component token file in a directory, keyed by file stem."""
+        return {
+            f.stem: self.parse_scss_tokens(f)
+            for f in sorted(component_dir.glob("_*.scss"))
+        }
 
-        new_components = list(new_files - old_files)
-        removed_components = list(old_files - new_files)
-        common_components = old_files & new_files
+    def _diff_component_tables(
+        self,
+        old_components: Dict[str, Dict[str, str]],
+        new_components: Dict[str, Dict[str, str]]
+    ) -> Tuple[List[str], List[str], List[ComponentChange]]:
+        """
+        Compare already-parsed component token tables.
 
+        Returns:
+            (new_components, removed_components, extended_components)
+        """
+        added_components = []
+        removed_components = []
         extended_components = []
 
+        for change_type, item in self.iter_component_changes(old_components, new_components):
+            if change_type == ChangeType.NEW_COMPONENT:
+                added_components.append(item)
+            elif change_type == ChangeType.REMOVED_COMPONENT:
+                removed_components.append(item)
+            else:
+                extended_components.append(item)
+
+        return added_components, removed_components, extended_components
+
+    def iter_component_changes(
+        self,
+        old_components: Dict[str, Dict[str, str]],
+        new_components: Dict[str, Dict[str, str]]
+    ) -> Iterator[Tuple[ChangeType, object]]:
+        """
+        Yield component changes one at a time as they are detected.
+
+        Yields:
+            (NEW_COMPONENT, file stem), (REMOVED_COMPONENT, file stem)
+            or (EXTENDED_COMPONENT, ComponentChange)
+        """
+        # Shared table (same git tree in both versions): nothing changed
+        if old_components is new_components:
+            return
+
+        old_files = set(old_components)
+        new_files = set(new_components)
+
+        for component in sorted(new_files - old_files):
+            yield ChangeType.NEW_COMPONENT, component
+
+        for component in sorted(old_files - new_files):
+            yield ChangeType.REMOVED_COMPONENT, component
+
         # Analyze each common component for changes
-        for component in common_components:
-            old_tokens = self.parse_scss_tokens(
-                old_component_dir / f"{component}.scss"
+        for component in sorted(old_files & new_files):
+            token_changes = self.detect_token_changes(
+                old_components[component],
+                new_components[component]
             )
-            new_tokens = self.parse_scss_tokens(
-                new_component_dir / f"{component}.scss"
-            )
-
-            token_changes = self.detect_token_changes(old_tokens, new_tokens)
 
             if token_changes:
                 # This component was extended/modified
                 component_name = component.lstrip('_')
 
+                for change in token_changes:
+                    change.component = component_name
+                    self._attach_call_sites(change, component_name)
+
                 # Assess iOS impact
                 ios_impact = self._assess_ios_impact(component_name, token_changes)
                 effort = self._estimate_effort(component_name, token_changes)
                 auto_adaptable = self._can_auto_adapt(component_name, token_changes)
                 risk = self._calculate_component_risk(token_changes)
 
-                extended_components.append(ComponentChange(
+                yield ChangeType.EXTENDED_COMPONENT, ComponentChange(
                     component_name=component_name,
                     change_type=ChangeType.EXTENDED_COMPONENT,
                     token_changes=token_changes,
@@ -273,9 +839,7 @@ class ElevateChangeAnalyzer:
                     estimated_effort_minutes=effort,
                     auto_adaptable=auto_adaptable,
                     risk_score=risk
-                ))
-
-        return new_components, removed_components, extended_components
+                )
 
     def _assess_ios_impact(
         self,
@@ -300,6 +864,12 @@ class ElevateChangeAnalyzer:
                     f"📐 {change.token_name}: May require layout changes"
                 )
 
+            if change.call_sites and change.change_type != ChangeType.NEW_TOKEN:
+                files = sorted({site.rsplit(':', 1)[0] for site in change.call_sites})
+                impact_notes.append(
+                    f"🔗 {change.token_name}: {len(change.call_sites)} call sites in {', '.join(files)}"
+                )
+
         if impact_notes:
             return "\n".join(impact_notes)
         else:
@@ -312,6 +882,9 @@ class ElevateChangeAnalyzer:
     ) -> int:
         """
         Estimate manual effort in minutes.
+
+        With a usage index, removals and value changes are weighted by how
+        often the generated property is actually used in Swift sources.
         """
         # Base effort per change type
         effort = 0
@@ -320,6 +893,8 @@ class ElevateChangeAnalyzer:
             if change.change_type == ChangeType.NEW_TOKEN:
                 # New property might need iOS implementation
                 effort += 10
+            elif self.usage_index:
+                effort += self._estimate_token_effort(change)
             elif change.change_type == ChangeType.REMOVED_TOKEN:
                 # Removal requires code migration
                 effort += 15
@@ -330,6 +905,19 @@ class ElevateChangeAnalyzer:
         # Cap at reasonable maximum per component
         return min(effort, 60)
 
+    def _estimate_token_effort(self, change: TokenChange) -> int:
+        """
+        Usage-based effort in minutes for a single removed/modified token.
+        """
+        uses = len(change.call_sites)
+        if change.change_type == ChangeType.REMOVED_TOKEN:
+            # Every call site has to be migrated; unused tokens only vanish
+            return 5 * uses if uses else 1
+        if change.change_type == ChangeType.MODIFIED_TOKEN:
+            # Visual check per call site
+            return uses
+        return 0
+
     def _can_auto_adapt(
         self,
         component: str,
@@ -368,6 +956,112 @@ class ElevateChangeAnalyzer:
 
         return min(1.0, total_risk / max_risk) if max_risk > 0 else 0.0
 
+    def parse_theme_overlay(self, theme_path: Path) -> Optional[ThemeOverlay]:
+        """
+        Parse the iOS theme overlay files once.
+
+        Returns:
+            ThemeOverlay, or None if the theme directory does not exist
+        """
+        if not theme_path.is_dir():
+            return None
+
+        return ThemeOverlay(
+            primitives=self.parse_scss_tokens(theme_path / "primitives.css"),
+            extend=self.parse_scss_tokens(theme_path / "extend.css"),
+            overrides=self.parse_scss_tokens(theme_path / "overrides.css"),
+            overwrite=self.parse_scss_tokens(theme_path / "overwrite.css"),
+            overwrite_dark=self.parse_scss_tokens(theme_path / "overwrite-dark.css")
+        )
+
+    def parse_version(
+        self,
+        version: str,
+        version_path: Path,
+        theme: Optional[ThemeOverlay] = None
+    ) -> ParsedVersion:
+        """
+        Parse all token tables of one ELEVATE version.
+
+        Args:
+            version: Version label (e.g., v0.37.0)
+            version_path: ELEVATE SCSS root containing values/ and tokens/component/
+            theme: iOS theme overlay to diff theme-merged views with
+        """
+        return ParsedVersion(
+            version=version,
+            light_tokens=self.parse_scss_tokens(version_path / "values" / "_light.scss"),
+            dark_tokens=self.parse_scss_tokens(version_path / "values" / "_dark.scss"),
+            component_tokens=self._parse_component_dir(version_path / "tokens" / "component"),
+            theme=theme
+        )
+
+    def parse_git_version(
+        self,
+        reader: GitObjectReader,
+        revision: str,
+        scss_root: str = "src/scss",
+        theme: Optional[ThemeOverlay] = None
+    ) -> ParsedVersion:
+        """
+        Parse all token tables of one ELEVATE revision straight from git objects.
+
+        Blobs and component trees are cached by object id, so files that are
+        unchanged between revisions are transferred and parsed only once.
+
+        Args:
+            reader: Open cat-file reader of the ELEVATE clone
+            revision: Any git revision (tag, branch, commit)
+            scss_root: Path of the SCSS root inside the repository
+            theme: iOS theme overlay to diff theme-merged views with
+
+        Raises:
+            ValueError: If the revision does not resolve to a commit
+        """
+        commit = reader.resolve_commit(revision)
+        if commit is None:
+            raise ValueError(f"Unknown git revision: {revision} (in {reader.repo_path})")
+
+        light_tokens = {}
+        dark_tokens = {}
+        values_tree = reader.read_tree(f"{commit}:{scss_root}/values")
+        if values_tree:
+            entries = values_tree[1]
+            if "_light.scss" in entries:
+                light_tokens = self._parse_git_blob(reader, entries["_light.scss"])
+            if "_dark.scss" in entries:
+                dark_tokens = self._parse_git_blob(reader, entries["_dark.scss"])
+
+        component_tokens = {}
+        component_tree = reader.read_tree(f"{commit}:{scss_root}/tokens/component")
+        if component_tree:
+            tree_oid, entries = component_tree
+            with self._git_lock:
+                if tree_oid not in self._git_component_tables:
+                    self._git_component_tables[tree_oid] = {
+                        name[:-len(".scss")]: self._parse_git_blob(reader, oid)
+                        for name, oid in sorted(entries.items())
+                        if name.startswith("_") and name.endswith(".scss")
+                    }
+                component_tokens = self._git_component_tables[tree_oid]
+
+        return ParsedVersion(
+            version=revision,
+            light_tokens=light_tokens,
+            dark_tokens=dark_tokens,
+            component_tokens=component_tokens,
+            theme=theme
+        )
+
+    def _parse_git_blob(self, reader: GitObjectReader, oid: str) -> Dict[str, str]:
+        """Parse an SCSS blob once per object id."""
+        with self._git_lock:
+            if oid not in self._git_blob_tokens:
+                obj = reader.read_object(oid)
+                content = obj[2].decode('utf-8') if obj else ""
+                self._git_blob_tokens[oid] = self.parse_scss_content(content)
+            return self._git_blob_tokens[oid]
+
     def generate_report(
         self,
         from_version: str,
@@ -378,72 +1072,239 @@ class ElevateChangeAnalyzer:
         """
         Generate comprehensive change report.
         """
-        # Parse light mode tokens (primary comparison)
-        old_tokens = self.parse_scss_tokens(from_path / "values" / "_light.scss")
-        new_tokens = self.parse_scss_tokens(to_path / "values" / "_light.scss")
+        return self.compare_versions(
+            self.parse_version(from_version, from_path),
+            self.parse_version(to_version, to_path)
+        )
 
-        token_changes = self.detect_token_changes(old_tokens, new_tokens)
+    def compare_versions(self, old: ParsedVersion, new: ParsedVersion) -> ChangeReport:
+        """
+        Generate a change report from two already-parsed versions.
+        """
+        # Light, dark and theme-merged tokens in one pass
+        token_changes = list(self.iter_mode_token_changes(old.token_views(), new.token_views()))
 
         # Analyze component changes
         new_components, removed_components, extended_components = \
-            self.analyze_component_files(
-                from_path / "tokens" / "component",
-                to_path / "tokens" / "component"
-            )
+            self._diff_component_tables(old.component_tokens, new.component_tokens)
 
         # Calculate overall metrics
-        total_effort = sum(c.estimated_effort_minutes for c in extended_components)
-        total_effort += len(new_components) * 60  # 1 hour per new component
-        total_effort += len(removed_components) * 30  # 30 min per removal
-
-        auto_adaptable_count = sum(1 for c in extended_components if c.auto_adaptable)
-        automation_coverage = int(
-            (auto_adaptable_count / len(extended_components) * 100)
-            if extended_components else 0
-        )
-
-        overall_risk = sum(c.risk_score for c in extended_components) / len(extended_components) \
-            if extended_components else 0.0
-
-        # Generate summary
-        summary = self._generate_summary(
-            token_changes,
-            new_components,
-            removed_components,
-            extended_components
-        )
+        totals = ReportTotals()
+        for change in token_changes:
+            totals.add_token_change(change, self._estimate_token_effort(change) if self.usage_index else 0)
+        totals.new_components = len(new_components)
+        totals.removed_components = len(removed_components)
+        for change in extended_components:
+            totals.add_component_change(change)
 
         return ChangeReport(
-            from_version=from_version,
-            to_version=to_version,
+            from_version=old.version,
+            to_version=new.version,
             token_changes=token_changes,
             component_changes=extended_components,
             new_components=new_components,
             removed_components=removed_components,
-            overall_risk_score=overall_risk,
-            estimated_total_effort_minutes=total_effort,
-            automation_coverage_percent=automation_coverage,
-            summary=summary
+            overall_risk_score=totals.overall_risk_score,
+            estimated_total_effort_minutes=totals.estimated_total_effort_minutes,
+            automation_coverage_percent=totals.automation_coverage_percent,
+            summary=self._generate_summary(totals)
         )
 
-    def _generate_summary(
+    def stream_report(
         self,
-        token_changes: List[TokenChange],
-        new_components: List[str],
-        removed_components: List[str],
-        extended_components: List[ComponentChange]
-    ) -> str:
+        old: ParsedVersion,
+        new: ParsedVersion,
+        writer: NDJSONReportWriter
+    ) -> ReportTotals:
+        """
+        Stream a change report record by record instead of building a ChangeReport.
+
+        Memory stays flat regardless of diff size: only running aggregates
+        are kept, and consumers can read records while the diff is running.
+        """
+        writer.begin(old.version, new.version)
+
+        # Light, dark and theme-merged tokens in one pass
+        for change in self.iter_mode_token_changes(old.token_views(), new.token_views()):
+            writer.token_change(change, self._estimate_token_effort(change) if self.usage_index else 0)
+
+        for change_type, item in self.iter_component_changes(
+            old.component_tokens, new.component_tokens
+        ):
+            if change_type == ChangeType.NEW_COMPONENT:
+                writer.new_component(item)
+            elif change_type == ChangeType.REMOVED_COMPONENT:
+                writer.removed_component(item)
+            else:
+                writer.component_change(item)
+
+        return writer.finish(self._generate_summary(writer.totals))
+
+    def parse_versions(
+        self,
+        versions: List[Tuple[str, Path]],
+        max_workers: Optional[int] = None,
+        theme: Optional[ThemeOverlay] = None
+    ) -> List[ParsedVersion]:
+        """
+        Parse several extracted versions concurrently, each exactly once.
+
+        Args:
+            versions: Ordered (version label, SCSS root) pairs, oldest first
+            max_workers: Parser thread count (default: one per version)
+            theme: iOS theme overlay shared by all versions
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or len(versions)) as pool:
+            return list(pool.map(
+                lambda entry: self.parse_version(entry[0], entry[1], theme),
+                versions
+            ))
+
+    def parse_git_versions(
+        self,
+        reader: GitObjectReader,
+        revisions: List[str],
+        max_workers: Optional[int] = None,
+        scss_root: str = "src/scss",
+        theme: Optional[ThemeOverlay] = None
+    ) -> List[ParsedVersion]:
+        """
+        Parse several git revisions concurrently; shared objects are parsed once.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or len(revisions)) as pool:
+            return list(pool.map(
+                lambda revision: self.parse_git_version(reader, revision, scss_root, theme),
+                revisions
+            ))
+
+    def generate_matrix_report(
+        self,
+        versions: List[Tuple[str, Path]],
+        include_span: bool = False,
+        max_workers: Optional[int] = None,
+        theme: Optional[ThemeOverlay] = None
+    ) -> VersionMatrixReport:
+        """
+        Generate change reports for a sequence of versions in one run.
+
+        Each version is parsed exactly once (concurrently), then all
+        consecutive pairs are diffed against the shared parsed tables.
+
+        Args:
+            versions: Ordered (version label, SCSS root) pairs, oldest first
+            include_span: Also compare the first version with the last one
+            max_workers: Parser thread count (default: one per version)
+            theme: iOS theme overlay shared by all versions
+        """
+        if len(versions) < 2:
+            raise ValueError("At least two versions are required for a change matrix")
+
+        parsed = self.parse_versions(versions, max_workers, theme)
+        return self.build_matrix_report(parsed, include_span)
+
+    def generate_git_matrix_report(
+        self,
+        reader: GitObjectReader,
+        revisions: List[str],
+        include_span: bool = False,
+        max_workers: Optional[int] = None,
+        scss_root: str = "src/scss",
+        theme: Optional[ThemeOverlay] = None
+    ) -> VersionMatrixReport:
+        """
+        Generate a version matrix from git revisions of an ELEVATE clone.
+
+        See generate_matrix_report(); objects shared between revisions are
+        parsed once and skipped when diffing.
+        """
+        if len(revisions) < 2:
+            raise ValueError("At least two versions are required for a change matrix")
+
+        parsed = self.parse_git_versions(reader, revisions, max_workers, scss_root, theme)
+        return self.build_matrix_report(parsed, include_span)
+
+    @staticmethod
+    def iter_version_pairs(
+        parsed: List[ParsedVersion],
+        include_span: bool = False
+    ) -> Iterator[Tuple[ParsedVersion, ParsedVersion]]:
+        """Yield consecutive version pairs, then first → last if requested."""
+        yield from zip(parsed, parsed[1:])
+        if include_span and len(parsed) > 2:
+            yield parsed[0], parsed[-1]
+
+    def build_matrix_report(
+        self,
+        parsed: List[ParsedVersion],
+        include_span: bool
+    ) -> VersionMatrixReport:
+        """Diff consecutive parsed versions (and optionally first → last)."""
+        reports = [
+            self.compare_versions(old, new)
+            for old, new in self.iter_version_pairs(parsed, include_span)
+        ]
+
+        pair_reports = reports[:len(parsed) - 1]
+        span_report = reports[-1] if len(reports) > len(pair_reports) else None
+
+        return VersionMatrixReport(
+            versions=[p.version for p in parsed],
+            pair_reports=pair_reports,
+            span_report=span_report,
+            summary=self._generate_matrix_summary(pair_reports, span_report)
+        )
+
+    def _generate_summary(self, totals: ReportTotals) -> str:
         """Generate human-readable summary."""
         lines = []
 
         lines.append(f"📊 Change Summary:")
-        lines.append(f"  • {len(token_changes)} token changes")
-        lines.append(f"  • {len(new_components)} new components")
-        lines.append(f"  • {len(removed_components)} removed components")
-        lines.append(f"  • {len(extended_components)} extended components")
+        if totals.mode_changes:
+            per_mode = ", ".join(f"{mode}: {count}" for mode, count in totals.mode_changes.items())
+            lines.append(f"  • {totals.token_changes} token changes ({per_mode})")
+        else:
+            lines.append(f"  • {totals.token_changes} token changes")
+        lines.append(f"  • {totals.new_components} new components")
+        lines.append(f"  • {totals.removed_components} removed components")
+        lines.append(f"  • {totals.extended_components} extended components")
 
         return "\n".join(lines)
 
+    def _generate_matrix_summary(
+        self,
+        pair_reports: List[ChangeReport],
+        span_report: Optional[ChangeReport]
+    ) -> str:
+        """Generate human-readable summary for a version matrix."""
+        lines = [f"📊 Change Matrix ({len(pair_reports)} version steps):"]
+
+        for report in pair_reports + ([span_report] if span_report else []):
+            lines.append(
+                f"  • {report.from_version} → {report.to_version}: "
+                f"{len(report.token_changes)} token changes, "
+                f"{len(report.new_components)} new / "
+                f"{len(report.removed_components)} removed / "
+                f"{len(report.component_changes)} extended components, "
+                f"~{report.estimated_total_effort_minutes} min"
+            )
+
+        total_effort = sum(r.estimated_total_effort_minutes for r in pair_reports)
+        lines.append(f"  Total estimated effort (step by step): ~{total_effort} min")
+
+        return "\n".join(lines)
+
+
+def resolve_version_path(versions_root: Path, version: str) -> Path:
+    """
+    Locate the SCSS root of an extracted ELEVATE version.
+
+    Accepts both <root>/<version>/ and the full source layout
+    <root>/<version>/src/scss/.
+    """
+    version_path = versions_root / version
+    scss_path = version_path / "src" / "scss"
+    return scss_path if scss_path.is_dir() else version_path
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -474,12 +1335,72 @@ def main():
         type=Path,
         help="Path to target ELEVATE tokens"
     )
+    parser.add_argument(
+        "--git-repo",
+        type=Path,
+        help="Local ELEVATE clone; --from/--to/--versions are then git revisions"
+    )
+    parser.add_argument(
+        "--scss-root",
+        default="src/scss",
+        help="With --git-repo: SCSS root inside the repository (default: src/scss)"
+    )
+    parser.add_argument(
+        "--theme-path",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent / ".elevate-themes" / "ios",
+        help="iOS theme overlay directory for theme-merged diffs (default: .elevate-themes/ios)"
+    )
+    parser.add_argument(
+        "--no-theme",
+        action="store_true",
+        help="Only diff light and dark tokens, without the iOS theme overlay"
+    )
+    parser.add_argument(
+        "--sources",
+        type=Path,
+        default=PROJECT_ROOT / "ElevateUI" / "Sources",
+        help="Swift sources indexed for token call sites (default: ElevateUI/Sources)"
+    )
+    parser.add_argument(
+        "--no-usage-index",
+        action="store_true",
+        help="Skip the Swift call site index (flat effort estimates)"
+    )
+    parser.add_argument(
+        "--versions",
+        help="Comma-separated version list, oldest first (e.g., v0.35.0,v0.36.1,v0.37.0)"
+    )
+    parser.add_argument(
+        "--versions-root",
+        type=Path,
+        default=Path(".elevate-src"),
+        help="Directory containing one extracted ELEVATE tree per version (default: .elevate-src)"
+    )
+    parser.add_argument(
+        "--span",
+        action="store_true",
+        help="With --versions: also compare the first version with the last"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="With --versions: number of versions parsed in parallel"
+    )
     parser.add_argument(
         "--output",
         "-o",
         type=Path,
         help="Output JSON file for report"
     )
+    parser.add_argument(
+        "--format",
+        choices=["json", "ndjson"],
+        default="json",
+        help="Report format: json (complete report) or ndjson (streamed records, "
+             "written to stdout unless --output is given)"
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -545,22 +1466,139 @@ def main():
 
         return 0
 
-    # Normal mode: Require from/to parameters
-    if not args.from_version or not args.to_version:
+    # Matrix mode compares a whole sequence of versions in one run,
+    # normal mode a single --from/--to pair
+    if args.versions:
+        versions = [v.strip() for v in args.versions.split(',') if v.strip()]
+        if len(versions) < 2:
+            print("❌ Error: --versions needs at least two versions")
+            return 1
+    elif args.from_version and args.to_version:
+        versions = [args.from_version, args.to_version]
+    else:
         print("❌ Error: --from and --to versions required (or use --test)")
         parser.print_help()
         return 1
 
+    # Parse every version (and the shared theme overlay) once
+    if args.git_repo:
+        if not args.git_repo.is_dir():
+            print(f"❌ Git repository not found: {args.git_repo}")
+            return 1
+
+        analyzer = ElevateChangeAnalyzer(args.git_repo)
+        theme = None if args.no_theme else analyzer.parse_theme_overlay(args.theme_path)
+        with GitObjectReader(args.git_repo) as reader:
+            try:
+                parsed = analyzer.parse_git_versions(
+                    reader, versions, max_workers=args.jobs, scss_root=args.scss_root, theme=theme
+                )
+            except ValueError as e:
+                print(f"❌ {e}")
+                return 1
+    elif args.versions or (args.from_path and args.to_path):
+        if args.versions:
+            version_paths = [
+                (version, resolve_version_path(args.versions_root, version))
+                for version in versions
+            ]
+        else:
+            version_paths = [(args.from_version, args.from_path), (args.to_version, args.to_path)]
+
+        for _, version_path in version_paths:
+            if not version_path.exists():
+                print(f"❌ Version not found: {version_path}")
+                return 1
+
+        analyzer = ElevateChangeAnalyzer(version_paths[0][1])
+        theme = None if args.no_theme else analyzer.parse_theme_overlay(args.theme_path)
+        parsed = analyzer.parse_versions(version_paths, max_workers=args.jobs, theme=theme)
+    else:
+        parsed = None
+
+    if parsed and not args.no_usage_index and args.sources.is_dir():
+        index = analyzer.build_usage_index(args.sources)
+        if args.format != "ndjson" or args.output:
+            print(f"🔗 Indexed {len(index.references)} token references "
+                  f"({index.files_scanned} files scanned, {index.files_cached} cached)")
+
+    # Streaming mode: NDJSON records are written while the diff runs
+    if parsed and args.format == "ndjson":
+        stream = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+        try:
+            writer = NDJSONReportWriter(stream)
+            for old, new in analyzer.iter_version_pairs(parsed, include_span=args.span):
+                analyzer.stream_report(old, new, writer)
+        finally:
+            if args.output:
+                stream.close()
+
+        if args.output:
+            print(f"📝 Report streamed to: {args.output}")
+        return 0
+
+    if parsed and args.versions:
+        matrix = analyzer.build_matrix_report(parsed, include_span=args.span)
+
+        print("🔍 ELEVATE Change Analyzer - Version Matrix")
+        print("=" * 50)
+        print()
+        print(matrix.summary)
+
+        if args.verbose:
+            for report in matrix.pair_reports + ([matrix.span_report] if matrix.span_report else []):
+                print(f"\n{report.from_version} → {report.to_version}")
+                for change in report.token_changes:
+                    print(change)
+
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(asdict(matrix), f, indent=2, default=_json_default)
+            print(f"\n📝 Report saved to: {args.output}")
+
+        return 0
+
+    if parsed:
+        report = analyzer.compare_versions(*parsed)
+
+        print("🔍 ELEVATE Change Analyzer")
+        print("=" * 50)
+        print()
+        print(f"Comparing: {report.from_version} → {report.to_version}")
+        print()
+        print(report.summary)
+        print(f"  Risk score: {report.overall_risk_score:.2f}")
+        print(f"  Estimated effort: ~{report.estimated_total_effort_minutes} min")
+        print(f"  Automation coverage: {report.automation_coverage_percent}%")
+
+        if args.verbose:
+            for change in report.token_changes:
+                print(change)
+            for component in report.component_changes:
+                print(f"\n📦 {component.component_name} (risk {component.risk_score:.2f})")
+                print(component.ios_impact)
+
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(asdict(report), f, indent=2, default=_json_default)
+            print(f"\n📝 Report saved to: {args.output}")
+
+        return 0
+
     print(f"""
 🔍 ELEVATE Change Analyzer
 ==========================
 
 Comparing: {args.from_version} → {args.to_version}
 
-⚠️  Version comparison not yet implemented.
+⚠️  No version sources given.
+
+Provide one of:
+- --git-repo <ELEVATE clone> (versions are git revisions)
+- --from-path and --to-path (extracted ELEVATE trees)
 
-To complete implementation:
-1. Add git clone/download logic for ELEVATE versions
+Implementation status:
+1. Read ELEVATE versions from git objects ✅ DONE
 2. Implement full SCSS token parsing ✅ DONE
 3. Add component file analysis ✅ DONE
 4. Implement risk assessment algorithms ✅ DONE
@@ -10,17 +10,186 @@ Usage:
     python3 scripts/extract-patterns-from-history.py
     python3 scripts/extract-patterns-from-history.py --component Button
     python3 scripts/extract-patterns-from-history.py --since "2024-08-01"
+    python3 scripts/extract-patterns-from-history.py --full  # Ignore watermarks
+
+Patterns are declared in PATTERN_REGISTRY. All history patterns are matched
+in one pass over `git log -p`, all tree patterns in one pass over the
+component sources, with a combined literal prefilter in front of the
+per-pattern regexes.
+
+History-based patterns are mined incrementally: the last processed commit
+per pattern is kept in .elevate-knowledge/watermarks.json and the next run
+only scans <watermark>..HEAD (falling back to the merge base after rebases).
 """
 
 import argparse
+import io
 import json
+import mmap
+import os
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Set, Optional
-from collections import defaultdict
+from typing import Iterator, List, Dict, Set, Optional, Tuple
+from collections import defaultdict, deque
+
+# Prefix of commit header lines in `git log -p` output (never starts a diff line)
+COMMIT_MARKER = "\x1e"
+
+# Porcelain blame line header: <sha> <original line> <final line> [<group size>]
+BLAME_HEADER = re.compile(r'^([0-9a-f]{40,64}) \d+ (\d+)')
+
+# Concurrent `git blame` processes in tree scans
+MAX_BLAME_WORKERS = 8
+
+# Concurrent file readers in tree scans
+MAX_SCAN_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class PatternDefinition:
+    """Declarative matcher for one knowledge base pattern"""
+    pattern_id: str  # Pattern id in patterns.json
+    source: str  # "history" (commit diffs) or "tree" (current component files)
+    literals: Tuple[str, ...]  # Prefilter: a matching line contains at least one
+    regex: Optional[str] = None  # Confirms a prefiltered line (None: literal is enough)
+    commit_grep: Optional[str] = None  # History only: commit message filter
+    context_before: int = 2
+    context_after: int = 3
+    description: str = ""  # Commit message recorded for tree occurrences
+
+
+PATTERN_REGISTRY = [
+    PatternDefinition(
+        pattern_id="hover-state-removal",
+        source="history",
+        literals=("@GestureState",),
+        regex=r"@GestureState.*isPressed|isPressed.*@GestureState",
+        commit_grep="hover",
+        context_before=5,
+        context_after=14
+    ),
+    PatternDefinition(
+        pattern_id="touch-target-expansion",
+        source="tree",
+        literals=("minWidth: 44", "minHeight: 44"),
+        description="Touch target implementation"
+    ),
+    PatternDefinition(
+        pattern_id="icon-positioning",
+        source="tree",
+        literals=("IconPosition", "iconPosition"),
+        description="Enum-based icon positioning"
+    ),
+    PatternDefinition(
+        pattern_id="typography-scaling",
+        source="tree",
+        literals=("ElevateTypographyiOS.",),
+        regex=r"ElevateTypographyiOS\.[a-z]\w*",
+        description="iOS-scaled typography"
+    ),
+    PatternDefinition(
+        pattern_id="dropdown-native-picker",
+        source="tree",
+        literals=("Picker(",),
+        description="Native picker instead of custom dropdown"
+    ),
+]
+
+
+class PatternScanner:
+    """
+    Evaluates many patterns against a line in one step.
+
+    All pattern literals are combined into a single alternation regex, so
+    the vast majority of lines are rejected by one C-level search; only
+    lines that hit the prefilter are dispatched to the owning patterns.
+    """
+
+    def __init__(self, patterns: List[PatternDefinition]):
+        self.patterns = patterns
+        self._regexes = {
+            p.pattern_id: re.compile(p.regex) for p in patterns if p.regex
+        }
+        literals = sorted({lit for p in patterns for lit in p.literals}, key=len, reverse=True)
+        self._prefilter = re.compile('|'.join(map(re.escape, literals))) if literals else None
+        # Same alternation over raw bytes, to skip whole files without decoding
+        self._file_prefilter = re.compile(
+            b'|'.join(re.escape(lit.encode('utf-8')) for lit in literals)
+        ) if literals else None
+
+    def match_buffer(self, buffer) -> bool:
+        """Whether a raw (bytes or mmap) buffer can contain any match."""
+        return self._file_prefilter is not None and self._file_prefilter.search(buffer) is not None
+
+    def match_line(self, line: str) -> List[PatternDefinition]:
+        """Patterns matching a single line."""
+        if self._prefilter is None or not self._prefilter.search(line):
+            return []
+
+        matches = []
+        for pattern in self.patterns:
+            if not any(lit in line for lit in pattern.literals):
+                continue
+            regex = self._regexes.get(pattern.pattern_id)
+            if regex is None or regex.search(line):
+                matches.append(pattern)
+        return matches
+
+
+class SourceTreeScanner:
+    """
+    Scans source files concurrently for a set of patterns.
+
+    Each file is memory-mapped and checked against the combined literal
+    prefilter first; only files with a hit are decoded and walked line by
+    line. Results stream back in input order as files finish.
+    """
+
+    def __init__(self, scanner: PatternScanner, max_workers: int = MAX_SCAN_WORKERS):
+        self.scanner = scanner
+        self.max_workers = max_workers
+
+    def scan_file(self, path: Path) -> List[Tuple[PatternDefinition, int, str]]:
+        """
+        Match one file.
+
+        Returns:
+            List of (pattern, 1-based line number, context snippet)
+        """
+        with open(path, 'rb') as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty file
+                return []
+
+        with buffer:
+            if not self.scanner.match_buffer(buffer):
+                return []
+            # Split on "\n" only, so line numbers agree with `git blame`
+            lines = io.StringIO(buffer[:].decode('utf-8')).readlines()
+
+        matches = []
+        for i, line in enumerate(lines, 1):
+            for pattern in self.scanner.match_line(line):
+                # Get context
+                start = max(0, i - 1 - pattern.context_before)
+                end = min(len(lines), i + pattern.context_after)
+                matches.append((pattern, i, ''.join(lines[start:end])))
+        return matches
+
+    def iter_matches(self, paths: List[Path]) -> Iterator[Tuple[Path, List[Tuple[PatternDefinition, int, str]]]]:
+        """Yield (path, matches) for every path with at least one match, in input order."""
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(paths) or 1)) as pool:
+            for path, matches in zip(paths, pool.map(self.scan_file, paths)):
+                if matches:
+                    yield path, matches
 
 
 @dataclass
@@ -34,6 +203,33 @@ class PatternOccurrence:
     code_snippet: str
 
 
+def write_json_atomic(path: Path, data, **dump_kwargs):
+    """
+    Write JSON via a temporary file and rename, so readers never observe
+    a half-written file and an interrupted run leaves the old one intact.
+    An existing file keeps its permissions.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2, **dump_kwargs)
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def get_pattern(pattern_id: str) -> PatternDefinition:
+    """Look up a registered pattern by id."""
+    for pattern in PATTERN_REGISTRY:
+        if pattern.pattern_id == pattern_id:
+            return pattern
+    raise KeyError(pattern_id)
+
+
 class PatternExtractor:
     """
     Extracts patterns from git history to build knowledge base.
@@ -42,6 +238,7 @@ class PatternExtractor:
     def __init__(self, repo_path: Path):
         self.repo_path = repo_path
         self.knowledge_base_path = repo_path / ".elevate-knowledge" / "patterns.json"
+        self.watermarks_path = repo_path / ".elevate-knowledge" / "watermarks.json"
 
     def run_git_command(self, args: List[str]) -> str:
         """Execute git command and return output"""
@@ -58,6 +255,105 @@ class PatternExtractor:
             print(f"Git command failed: {e}")
             return ""
 
+    def git_succeeds(self, args: List[str]) -> bool:
+        """Run a git command used as a predicate (exit status only)."""
+        result = subprocess.run(
+            ["git"] + args,
+            cwd=self.repo_path,
+            capture_output=True
+        )
+        return result.returncode == 0
+
+    def load_watermarks(self) -> Dict[str, Dict]:
+        """Load the last processed commit per pattern."""
+        if not self.watermarks_path.exists():
+            return {}
+        try:
+            with open(self.watermarks_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_watermarks(self, watermarks: Dict[str, Dict]):
+        """Persist the last processed commit per pattern."""
+        write_json_atomic(self.watermarks_path, watermarks, sort_keys=True)
+
+    def resolve_history_range(self, pattern_id: str, head: str, watermarks: Dict[str, Dict]) -> Optional[str]:
+        """
+        Revision range still to be scanned for a history-based pattern.
+
+        Returns:
+            "<watermark>..<head>" when the watermark is an ancestor of HEAD,
+            "<merge-base>..<head>" when history was rewritten (rebase, force
+            push) since the last run, or None for a full history scan.
+        """
+        entry = watermarks.get(pattern_id)
+        if not entry or not entry.get('commit'):
+            return None
+
+        last = entry['commit']
+        if self.git_succeeds(["merge-base", "--is-ancestor", last, head]):
+            return f"{last}..{head}"
+
+        # Watermark is no longer part of HEAD's history: rescan from the merge base
+        if self.git_succeeds(["cat-file", "-e", f"{last}^{{commit}}"]):
+            merge_base = self.run_git_command(["merge-base", last, head]).strip()
+            if merge_base:
+                print(f"  ↻ History rewritten since {last[:8]}, rescanning from merge base {merge_base[:8]}")
+                return f"{merge_base}..{head}"
+
+        print(f"  ↻ Watermark {last[:8]} not found, rescanning full history")
+        return None
+
+    def iter_log_patch(self, args: List[str]) -> Iterator[Tuple[Dict, Optional[str]]]:
+        """
+        Stream `git log -p` output in a single process.
+
+        Yields (commit, None) at every commit header and (commit, line) for
+        each diff line, so callers can match patterns while the history is
+        still being read instead of materializing per-commit diffs.
+
+        Raises:
+            subprocess.CalledProcessError: If git exits with an error after
+                the output was read to the end
+        """
+        process = subprocess.Popen(
+            ["git", "log", "-p", f"--pretty=format:{COMMIT_MARKER}%H|%ai|%s"] + args,
+            cwd=self.repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace"
+        )
+
+        commit = None
+        completed = False
+        try:
+            for line in process.stdout:
+                line = line.rstrip('\n')
+                if line.startswith(COMMIT_MARKER):
+                    parts = line[len(COMMIT_MARKER):].split('|', 2)
+                    if len(parts) == 3:
+                        commit = {'hash': parts[0], 'date': parts[1], 'message': parts[2]}
+                        yield commit, None
+                        continue
+                if commit:
+                    yield commit, line
+            completed = True
+        finally:
+            if process.poll() is None:
+                process.terminate()
+            process.stdout.close()
+            stderr = process.stderr.read()
+            process.stderr.close()
+            returncode = process.wait()
+            if returncode not in (0, -15) and stderr:
+                print(f"Git command failed: {stderr.strip()}")
+
+        # Only reached when the caller consumed the whole log
+        if completed and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, process.args, stderr=stderr)
+
     def get_component_commits(self, component: Optional[str] = None, since: Optional[str] = None) -> List[Dict]:
         """
         Get commits that modified component files.
@@ -103,172 +399,355 @@ class PatternExtractor:
 
         return commits
 
-    def extract_hover_to_press_pattern(self) -> List[PatternOccurrence]:
+    def extract_hover_to_press_pattern(
+        self,
+        revision_range: Optional[str] = None,
+        since: Optional[str] = None
+    ) -> List[PatternOccurrence]:
         """
         Find instances where hover states were converted to press states.
         """
-        occurrences = []
+        pattern = get_pattern("hover-state-removal")
+        return self.scan_history([pattern], revision_range, since)[pattern.pattern_id]
+
+    def scan_history(
+        self,
+        patterns: List[PatternDefinition],
+        revision_range: Optional[str] = None,
+        since: Optional[str] = None
+    ) -> Dict[str, List[PatternOccurrence]]:
+        """
+        Match all history patterns in one streaming `git log -p` pass.
 
-        # Search for commits with "hover" in message
-        args = [
-            "log",
-            "--pretty=format:%H|%ai|%s",
-            "--grep=hover",
-            "-i",
-            "-- ElevateUI/Sources/SwiftUI/Components/"
-        ]
+        Every pattern reports at most one occurrence per commit: the first
+        matching diff line with its surrounding context.
 
-        output = self.run_git_command(args)
-        for line in output.split('\n'):
-            if not line:
+        Args:
+            patterns: History patterns to evaluate
+            revision_range: Only scan these commits (e.g., "<watermark>..HEAD")
+            since: Only scan commits since this date (YYYY-MM-DD)
+
+        Returns:
+            Dict mapping pattern id to occurrences
+
+        Raises:
+            subprocess.CalledProcessError: If `git log` failed
+        """
+        occurrences = {p.pattern_id: [] for p in patterns}
+        if not patterns:
+            return occurrences
+
+        scanner = PatternScanner(patterns)
+        message_filters = {
+            p.pattern_id: re.compile(re.escape(p.commit_grep), re.IGNORECASE)
+            for p in patterns if p.commit_grep
+        }
+
+        # --full-diff: match against the whole commit, not just component files
+        args = ["-i", "--full-diff"]
+        if all(p.commit_grep for p in patterns):
+            # Let git pre-select commits (multiple --grep are OR-ed)
+            args += [f"--grep={p.commit_grep}" for p in patterns]
+        if since:
+            args.append(f"--since={since}")
+        if revision_range:
+            args.append(revision_range)
+        args += ["--", "ElevateUI/Sources/SwiftUI/Components/"]
+
+        max_before = max(p.context_before for p in patterns)
+        context_before = deque(maxlen=max_before or 1)
+        pending = []  # [pattern, commit, file, snippet lines, remaining lines]
+        active = []  # Patterns whose message filter accepts the current commit
+        current_file = ""
+
+        def emit(entry):
+            pattern, commit, file_path, snippet_lines, _ = entry
+            snippet = '\n'.join(snippet_lines)
+            occurrences[pattern.pattern_id].append(PatternOccurrence(
+                file_path=file_path or "Multiple components",
+                line_range="N/A",
+                commit_hash=commit['hash'][:8],
+                commit_date=commit['date'].split()[0],
+                commit_message=commit['message'],
+                code_snippet=snippet[:500]  # Limit size
+            ))
+
+        for commit, line in self.iter_log_patch(args):
+            if line is None:
+                for entry in pending:
+                    emit(entry)
+                pending = []
+                context_before.clear()
+                current_file = ""
+                active = [
+                    p for p in patterns
+                    if p.pattern_id not in message_filters
+                    or message_filters[p.pattern_id].search(commit['message'])
+                ]
                 continue
 
-            parts = line.split('|', 2)
-            if len(parts) == 3:
-                commit_hash, commit_date, commit_message = parts
-
-                # Get the diff for this commit
-                diff = self.run_git_command(["show", "--format=", commit_hash])
-
-                # Look for pattern: @GestureState + isPressed
-                if '@GestureState' in diff and 'isPressed' in diff:
-                    # Extract the relevant code snippet
-                    lines = diff.split('\n')
-                    for i, diffline in enumerate(lines):
-                        if '@GestureState' in diffline and 'isPressed' in diffline:
-                            # Get context (10 lines)
-                            snippet_lines = lines[max(0, i-5):min(len(lines), i+15)]
-                            snippet = '\n'.join(snippet_lines)
-
-                            occurrences.append(PatternOccurrence(
-                                file_path="Multiple components",
-                                line_range="N/A",
-                                commit_hash=commit_hash[:8],
-                                commit_date=commit_date.split()[0],
-                                commit_message=commit_message,
-                                code_snippet=snippet[:500]  # Limit size
-                            ))
-                            break
+            if line.startswith('+++ b/'):
+                current_file = Path(line[len('+++ b/'):]).name
+
+            still_pending = []
+            for entry in pending:
+                entry[3].append(line)
+                entry[4] -= 1
+                if entry[4] == 0:
+                    emit(entry)
+                else:
+                    still_pending.append(entry)
+            pending = still_pending
+
+            if active:
+                for pattern in scanner.match_line(line):
+                    if pattern not in active:
+                        continue
+                    # First match per commit and pattern
+                    active.remove(pattern)
+                    before = list(context_before)[-pattern.context_before:] if pattern.context_before else []
+                    entry = [pattern, commit, current_file, before + [line], pattern.context_after]
+                    if pattern.context_after:
+                        pending.append(entry)
+                    else:
+                        emit(entry)
+
+            context_before.append(line)
+
+        for entry in pending:
+            emit(entry)
 
         return occurrences
 
+    def blame_file(self, relative_path: str) -> Dict[int, Tuple[str, str]]:
+        """
+        Blame a whole file with a single `git blame --porcelain` call.
+
+        Returns:
+            Dict mapping line number to (commit hash, author date YYYY-MM-DD)
+        """
+        output = self.run_git_command(["blame", "--porcelain", "--", relative_path])
+
+        commit_dates = {}
+        line_commits = {}
+        current = None
+
+        for blame_line in output.split('\n'):
+            if blame_line.startswith('\t'):
+                continue  # Line content
+
+            header = BLAME_HEADER.match(blame_line)
+            if header:
+                current = header.group(1)
+                line_commits[int(header.group(2))] = current
+                commit_dates.setdefault(current, "")
+            elif blame_line.startswith('author-time ') and current:
+                # Only present the first time a commit appears
+                timestamp = int(blame_line.split()[1])
+                commit_dates[current] = datetime.fromtimestamp(
+                    timestamp, tz=timezone.utc
+                ).strftime('%Y-%m-%d')
+
+        return {
+            line_number: (commit_hash, commit_dates[commit_hash])
+            for line_number, commit_hash in line_commits.items()
+        }
+
     def extract_touch_target_pattern(self) -> List[PatternOccurrence]:
         """
         Find instances where 44pt touch targets were implemented.
         """
-        occurrences = []
+        pattern = get_pattern("touch-target-expansion")
+        return self.scan_tree([pattern])[pattern.pattern_id]
 
-        # Search current codebase for touch target implementations
-        components_dir = self.repo_path / "ElevateUI" / "Sources" / "SwiftUI" / "Components"
+    def scan_tree(self, patterns: List[PatternDefinition]) -> Dict[str, List[PatternOccurrence]]:
+        """
+        Match all tree patterns in one pass over the current component sources.
 
-        if not components_dir.exists():
-            return occurrences
+        Returns:
+            Dict mapping pattern id to occurrences
+        """
+        occurrences = {p.pattern_id: [] for p in patterns}
+        for pattern_id, occurrence in self.iter_tree_occurrences(patterns):
+            occurrences[pattern_id].append(occurrence)
+        return occurrences
 
-        for swift_file in components_dir.glob("*.swift"):
-            with open(swift_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            for i, line in enumerate(lines, 1):
-                if 'minWidth: 44' in line or 'minHeight: 44' in line:
-                    # Found a touch target implementation
-                    # Get context
-                    start = max(0, i - 3)
-                    end = min(len(lines), i + 3)
-                    snippet = ''.join(lines[start:end])
-
-                    # Get last commit that touched this line
-                    blame = self.run_git_command([
-                        "blame",
-                        "-L", f"{i},{i}",
-                        "--porcelain",
-                        swift_file.name
-                    ])
-
-                    commit_hash = ""
-                    commit_date = ""
-                    for blame_line in blame.split('\n'):
-                        if blame_line.startswith('author-time'):
-                            # Convert timestamp to date
-                            timestamp = blame_line.split()[1]
-                            commit_date = timestamp
-                        elif not blame_line.startswith((' ', '\t')) and not '-' in blame_line:
-                            commit_hash = blame_line.split()[0]
-                            break
-
-                    occurrences.append(PatternOccurrence(
-                        file_path=str(swift_file.name),
-                        line_range=f"{i}",
-                        commit_hash=commit_hash[:8],
-                        commit_date=commit_date,
-                        commit_message="Touch target implementation",
-                        code_snippet=snippet
-                    ))
+    def iter_tree_occurrences(self, patterns: List[PatternDefinition]) -> Iterator[Tuple[str, PatternOccurrence]]:
+        """
+        Stream (pattern id, occurrence) records for the current component sources.
 
-        return occurrences
+        Files are scanned concurrently by SourceTreeScanner; each file with
+        matches is blamed once (shared by all patterns) in a bounded pool,
+        and its records are yielded as soon as its blame is available.
+        """
+        # Search current codebase for pattern implementations
+        components_dir = self.repo_path / "ElevateUI" / "Sources" / "SwiftUI" / "Components"
 
-    def update_knowledge_base(self, pattern_id: str, occurrences: List[PatternOccurrence]):
+        if not patterns or not components_dir.exists():
+            return
+
+        tree_scanner = SourceTreeScanner(PatternScanner(patterns))
+        files = sorted(components_dir.glob("*.swift"))
+
+        def occurrences_for(swift_file, matches, blame):
+            for pattern, i, snippet in matches:
+                commit_hash, commit_date = blame.get(i, ("", ""))
+                yield pattern.pattern_id, PatternOccurrence(
+                    file_path=str(swift_file.name),
+                    line_range=f"{i}",
+                    commit_hash=commit_hash[:8],
+                    commit_date=commit_date,
+                    commit_message=pattern.description,
+                    code_snippet=snippet
+                )
+
+        # Get last commit that touched each line: one blame per file
+        with ThreadPoolExecutor(max_workers=MAX_BLAME_WORKERS) as pool:
+            pending = deque()
+            for swift_file, matches in tree_scanner.iter_matches(files):
+                relative_path = swift_file.relative_to(self.repo_path).as_posix()
+                pending.append((swift_file, matches, pool.submit(self.blame_file, relative_path)))
+                while pending and pending[0][2].done():
+                    swift_file, matches, blame = pending.popleft()
+                    yield from occurrences_for(swift_file, matches, blame.result())
+
+            while pending:
+                swift_file, matches, blame = pending.popleft()
+                yield from occurrences_for(swift_file, matches, blame.result())
+
+    def update_knowledge_base(self, updates: Dict[str, List[PatternOccurrence]]) -> bool:
         """
         Update the patterns.json knowledge base with new examples.
+
+        The file is loaded once, every pattern is updated in memory and the
+        result is written back once, atomically.
+
+        Args:
+            updates: Dict mapping pattern id to its new occurrences
+
+        Returns:
+            True if the knowledge base holds every update (nothing to write
+            counts as success), False if the updates were not stored
         """
+        if not updates:
+            return True
+
         if not self.knowledge_base_path.exists():
             print(f"Knowledge base not found: {self.knowledge_base_path}")
-            return
+            return False
 
         with open(self.knowledge_base_path, 'r') as f:
             kb = json.load(f)
 
-        # Find the pattern
-        pattern = None
-        for p in kb['patterns']:
-            if p['id'] == pattern_id:
-                pattern = p
-                break
+        patterns = {p['id']: p for p in kb['patterns']}
+        changed = False
 
-        if not pattern:
-            print(f"Pattern '{pattern_id}' not found in knowledge base")
-            return
+        for pattern_id, occurrences in updates.items():
+            pattern = patterns.get(pattern_id)
+            if not pattern:
+                print(f"Pattern '{pattern_id}' not found in knowledge base")
+                continue
+            changed |= self._apply_occurrences(pattern, occurrences)
+
+        # Write back
+        if changed:
+            write_json_atomic(self.knowledge_base_path, kb)
+        return True
+
+    @staticmethod
+    def _apply_occurrences(pattern: Dict, occurrences: List[PatternOccurrence]) -> bool:
+        """Merge occurrences into one knowledge base pattern; True if it changed."""
+        examples = pattern.setdefault('examples', [])
+        known = set(examples)
+        changed = False
 
         # Add occurrences as examples
         for occ in occurrences[:5]:  # Limit to 5 examples
             example = f"{occ.file_path}:{occ.line_range} ({occ.commit_hash})"
-            if example not in pattern.get('examples', []):
-                if 'examples' not in pattern:
-                    pattern['examples'] = []
-                pattern['examples'].append(example)
-
-        # Update last_seen date
-        if occurrences:
-            latest_date = max(occ.commit_date for occ in occurrences if occ.commit_date)
-            if latest_date:
+            if example not in known:
+                known.add(example)
+                examples.append(example)
+                changed = True
+
+        # Update last_seen date (incremental runs only see new occurrences)
+        dates = [occ.commit_date for occ in occurrences if occ.commit_date]
+        if dates:
+            latest_date = max(dates)
+            if latest_date > pattern.get('last_seen', ''):
                 pattern['last_seen'] = latest_date
+                changed = True
 
-        # Write back
-        with open(self.knowledge_base_path, 'w') as f:
-            json.dump(kb, f, indent=2)
-
-        print(f"✅ Updated pattern '{pattern_id}' with {len(occurrences)} examples")
+        return changed
 
-    def analyze_patterns(self, component: Optional[str] = None, since: Optional[str] = None):
+    def analyze_patterns(
+        self,
+        component: Optional[str] = None,
+        since: Optional[str] = None,
+        full: bool = False
+    ):
         """
         Analyze git history and extract all patterns.
+
+        Args:
+            full: Ignore the persisted watermarks and rescan all history
         """
         print("🔍 Pattern Extraction from Git History")
         print("=" * 50)
         print()
 
-        # Extract hover-to-press pattern
-        print("Searching for hover-to-press conversions...")
-        hover_occurrences = self.extract_hover_to_press_pattern()
-        print(f"  Found {len(hover_occurrences)} occurrences")
-        if hover_occurrences:
-            self.update_knowledge_base("hover-state-removal", hover_occurrences)
+        # Pin HEAD before scanning so commits landing mid-run are picked up next time
+        head = self.run_git_command(["rev-parse", "HEAD"]).strip()
+        watermarks = self.load_watermarks()
+        updates = {}
+
+        # History patterns: one `git log -p` pass per distinct scan range
+        # (normally one, since all watermarks advance together)
+        history_patterns = [p for p in PATTERN_REGISTRY if p.source == "history"]
+        ranges = {}
+        for pattern in history_patterns:
+            revision_range = None
+            if head and not full:
+                revision_range = self.resolve_history_range(pattern.pattern_id, head, watermarks)
+            ranges.setdefault(revision_range, []).append(pattern)
+
+        print(f"Scanning history for {len(history_patterns)} patterns...")
+        for revision_range, patterns in ranges.items():
+            if revision_range:
+                print(f"  Scanning {revision_range[:8]}..{head[:8]} (incremental)")
+            try:
+                results = self.scan_history(patterns, revision_range or head or None, since)
+            except subprocess.CalledProcessError:
+                print("  ⚠️  History scan failed, watermarks not advanced")
+                continue
+            for pattern in patterns:
+                print(f"  {pattern.pattern_id}: {len(results[pattern.pattern_id])} occurrences")
+                if results[pattern.pattern_id]:
+                    updates[pattern.pattern_id] = results[pattern.pattern_id]
+                # A --since scan skips older commits; advancing the watermark
+                # would hide them from every later incremental run
+                if head and not since:
+                    watermarks[pattern.pattern_id] = {
+                        "commit": head,
+                        "updated": date.today().isoformat()
+                    }
+
+        # Tree patterns: one pass over the current component sources
+        tree_patterns = [p for p in PATTERN_REGISTRY if p.source == "tree"]
+        print(f"\nScanning component sources for {len(tree_patterns)} patterns...")
+        results = self.scan_tree(tree_patterns)
+        for pattern in tree_patterns:
+            print(f"  {pattern.pattern_id}: {len(results[pattern.pattern_id])} occurrences")
+            if results[pattern.pattern_id]:
+                updates[pattern.pattern_id] = results[pattern.pattern_id]
+
+        # One knowledge base write for all patterns, then advance the
+        # watermarks so a failed write rescans the same commits next time
+        if not self.update_knowledge_base(updates):
+            print("\n⚠️  Occurrences not stored, watermarks not advanced")
+            return
 
-        # Extract touch target pattern
-        print("\nSearching for 44pt touch target implementations...")
-        touch_occurrences = self.extract_touch_target_pattern()
-        print(f"  Found {len(touch_occurrences)} occurrences")
-        if touch_occurrences:
-            self.update_knowledge_base("touch-target-expansion", touch_occurrences)
+        if head:
+            self.save_watermarks(watermarks)
 
         print("\n✅ Pattern extraction complete")
         print(f"📝 Knowledge base updated: {self.knowledge_base_path}")
@@ -286,6 +765,11 @@ def main():
         "--since",
         help="Only analyze commits since this date (YYYY-MM-DD)"
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore persisted watermarks and rescan all history"
+    )
 
     args = parser.parse_args()
 
@@ -294,7 +778,8 @@ def main():
 
     extractor.analyze_patterns(
         component=args.component,
-        since=args.since
+        since=args.since,
+        full=args.full
     )
 
     return 0
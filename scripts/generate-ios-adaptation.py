@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+iOS Adaptation Generator
+========================
+
+Renders the Swift code templates in .elevate-knowledge/templates/ to
+scaffold iOS adaptations for ELEVATE components.
+
+Every template is compiled once per run and its compiled form is cached on
+disk (.elevate-knowledge/cache/templates/), keyed by a hash of the template
+source, so repeated runs skip Jinja parsing and compilation entirely. Many
+component instances are rendered in one batch.
+
+Usage:
+    python3 scripts/generate-ios-adaptation.py --list
+    python3 scripts/generate-ios-adaptation.py --template touch-target-44pt \\
+        --component Chip --context '{"visual_size": {"width": 24, "height": 24}, "content_view": "icon"}'
+
+    # Batch: one JSON file describing many component instances
+    python3 scripts/generate-ios-adaptation.py --batch adaptations.json -o Generated/
+
+Batch file format:
+    {
+      "defaults": {"enable_haptics": true},
+      "jobs": [
+        {"template": "hover-to-press", "component": "Button", "context": {...}},
+        {"template": "touch-target-44pt", "component": "Chip", "context": {...}}
+      ]
+    }
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import jinja2
+    from jinja2.bccache import Bucket
+except ImportError as e:
+    # Only the CLI exits; importers get an ImportError they can handle
+    if __name__ == "__main__":
+        print("❌ jinja2 is required: pip3 install jinja2")
+        sys.exit(1)
+    raise ImportError("jinja2 is required: pip3 install jinja2") from e
+
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+KNOWLEDGE_DIR = PROJECT_ROOT / ".elevate-knowledge"
+TEMPLATES_DIR = KNOWLEDGE_DIR / "templates"
+TEMPLATE_CACHE_DIR = KNOWLEDGE_DIR / "cache" / "templates"
+TEMPLATE_SUFFIX = ".swift.jinja2"
+
+# Environment options that change the compiled template; part of the cache key
+RENDER_OPTIONS = {
+    "trim_blocks": True,
+    "lstrip_blocks": True,
+    "keep_trailing_newline": True,
+}
+
+
+class TemplateBytecodeCache(jinja2.FileSystemBytecodeCache):
+    """
+    On-disk cache of compiled templates keyed by template content.
+
+    Jinja keys its file cache by template name and only validates the source
+    checksum on load; keying by content hash instead lets renamed or copied
+    templates share an entry and makes stale entries impossible to pick up.
+    """
+
+    def __init__(self, directory: Path):
+        directory.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(directory), "%s.cache")
+        self._salt = json.dumps([jinja2.__version__, RENDER_OPTIONS], sort_keys=True)
+
+    def get_bucket(self, environment, name, filename, source):
+        key = hashlib.sha1((self._salt + source).encode("utf-8")).hexdigest()
+        bucket = Bucket(environment, key, self.get_source_checksum(source))
+        self.load_bytecode(bucket)
+        return bucket
+
+
+@dataclass
+class RenderJob:
+    """One template rendered for one component"""
+    template: str  # Template name without suffix (e.g., "touch-target-44pt")
+    component: str
+    context: Dict = field(default_factory=dict)
+
+
+@dataclass
+class RenderResult:
+    """Rendered code (or the error) for a RenderJob"""
+    job: RenderJob
+    code: Optional[str] = None
+    error: Optional[str] = None
+
+
+class AdaptationRenderer:
+    """Renders adaptation templates in batches"""
+
+    def __init__(self, templates_dir: Path = TEMPLATES_DIR, cache_dir: Optional[Path] = TEMPLATE_CACHE_DIR):
+        """
+        Args:
+            templates_dir: Directory with *.swift.jinja2 templates
+            cache_dir: Compiled template cache (None disables the disk cache)
+        """
+        self.templates_dir = templates_dir
+        self.env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(str(templates_dir)),
+            bytecode_cache=TemplateBytecodeCache(cache_dir) if cache_dir else None,
+            undefined=jinja2.StrictUndefined,  # Missing inputs are errors, not empty strings
+            auto_reload=False,
+            **RENDER_OPTIONS
+        )
+
+    def list_templates(self) -> List[str]:
+        """Available template names (without suffix)."""
+        return sorted(
+            path.name[:-len(TEMPLATE_SUFFIX)]
+            for path in self.templates_dir.glob(f"*{TEMPLATE_SUFFIX}")
+        )
+
+    def get_template(self, name: str) -> "jinja2.Template":
+        """Compiled template; compiled at most once per renderer."""
+        return self.env.get_template(f"{name}{TEMPLATE_SUFFIX}")
+
+    def render(self, job: RenderJob) -> RenderResult:
+        """Render a single job."""
+        try:
+            template = self.get_template(job.template)
+            code = template.render({"component_name": job.component, **job.context})
+            return RenderResult(job=job, code=code)
+        except jinja2.TemplateError as e:
+            return RenderResult(job=job, error=f"{type(e).__name__}: {e}")
+
+    def render_batch(self, jobs: List[RenderJob]) -> List[RenderResult]:
+        """
+        Render many jobs; each distinct template is loaded (from the disk
+        cache or by compiling it) once for the whole batch.
+
+        Returns:
+            Results in job order
+        """
+        return [self.render(job) for job in jobs]
+
+
+def load_batch(path: Path) -> List[RenderJob]:
+    """
+    Load render jobs from a batch file.
+
+    Args:
+        path: JSON file with "jobs" (and optional shared "defaults" context),
+              or a plain list of jobs
+
+    Returns:
+        List of RenderJob
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    if isinstance(data, list):
+        data = {"jobs": data}
+
+    defaults = data.get("defaults", {})
+    return [
+        RenderJob(
+            template=entry["template"],
+            component=entry["component"],
+            context={**defaults, **entry.get("context", {})}
+        )
+        for entry in data.get("jobs", [])
+    ]
+
+
+def write_results(results: List[RenderResult], output_dir: Path) -> int:
+    """
+    Write rendered code to <output_dir>/<Component>/<template>.swift.
+
+    Returns:
+        Number of files written
+    """
+    written = 0
+    for result in results:
+        if result.code is None:
+            continue
+        target = output_dir / result.job.component / f"{result.job.template}.swift"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(result.code)
+        written += 1
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render iOS adaptation templates for ELEVATE components"
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List available templates"
+    )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        help="JSON file with many render jobs"
+    )
+    parser.add_argument(
+        "--template",
+        help="Template name (e.g., touch-target-44pt)"
+    )
+    parser.add_argument(
+        "--component",
+        help="Component name for --template"
+    )
+    parser.add_argument(
+        "--context",
+        default="{}",
+        help="Template inputs as JSON for --template"
+    )
+    parser.add_argument(
+        "--output-dir", "-o",
+        type=Path,
+        help="Write <Component>/<template>.swift files here instead of stdout"
+    )
+    parser.add_argument(
+        "--templates-dir",
+        type=Path,
+        default=TEMPLATES_DIR,
+        help="Template directory (default: .elevate-knowledge/templates)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the compiled template cache"
+    )
+
+    args = parser.parse_args()
+
+    renderer = AdaptationRenderer(
+        templates_dir=args.templates_dir,
+        cache_dir=None if args.no_cache else TEMPLATE_CACHE_DIR
+    )
+
+    if args.list:
+        for name in renderer.list_templates():
+            print(name)
+        return
+
+    if args.batch:
+        jobs = load_batch(args.batch)
+    elif args.template and args.component:
+        jobs = [RenderJob(args.template, args.component, json.loads(args.context))]
+    else:
+        parser.error("either --batch or --template with --component is required")
+
+    results = renderer.render_batch(jobs)
+    failed = [r for r in results if r.error]
+
+    for result in failed:
+        print(f"❌ {result.job.component} ({result.job.template}): {result.error}", file=sys.stderr)
+
+    if args.output_dir:
+        written = write_results(results, args.output_dir)
+        print(f"✅ Rendered {written}/{len(results)} adaptations to {args.output_dir}")
+    else:
+        for result in results:
+            if result.code is not None:
+                print(f"// {result.job.component}: {result.job.template}")
+                print(result.code)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+Shared loader for the v4 token generator.
+
+update-design-tokens-v4.py has a hyphenated name and cannot be imported
+directly. The scripts that reuse its parser, paths and mode-token loading
+(analyze-elevate-changes.py, validate-ios-compliance.py) all go through
+load_token_generator(), so they agree on ELEVATE_TOKENS_PATH and
+load_mode_tokens and the module is executed once per process.
+"""
+
+import functools
+import importlib.util
+import sys
+from pathlib import Path
+
+MODULE_NAME = "update_design_tokens_v4"
+GENERATOR_PATH = Path(__file__).resolve().parent.parent / "update-design-tokens-v4.py"
+
+
+@functools.lru_cache(maxsize=None)
+def load_token_generator():
+    """The update-design-tokens-v4.py module, loaded on first use."""
+    module = sys.modules.get(MODULE_NAME)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(MODULE_NAME, GENERATOR_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[MODULE_NAME] = module
+        spec.loader.exec_module(module)
+    return module
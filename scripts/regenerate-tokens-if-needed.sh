@@ -6,6 +6,10 @@
 # Automatically regenerates design tokens if source files have changed.
 # Uses MD5 caching for fast incremental builds.
 #
+# No-op builds never start Python: the generator writes a stamp manifest
+# (mtime, size and path of every source and output) and this script exits
+# as soon as a single `stat` call reproduces it.
+#
 # Usage:
 #   ./scripts/regenerate-tokens-if-needed.sh        # Normal build
 #   ./scripts/regenerate-tokens-if-needed.sh --force # Force regeneration
@@ -37,6 +41,33 @@ if [ ! -d "$ELEVATE_TOKENS_PATH" ]; then
     exit 0
 fi
 
+STAMP_FILE="$PROJECT_ROOT/ElevateUI/Sources/DesignTokens/.token_stamp"
+
+# Succeeds when every file listed in the stamp still has the recorded
+# mtime and size (format written by update-design-tokens-v4.py)
+stamp_is_current() {
+    local header line expected="" paths=() current
+    [ -f "$STAMP_FILE" ] || return 1
+    {
+        IFS= read -r header
+        while IFS= read -r line; do
+            expected+="$line"$'\n'
+            paths+=("${line#* * }")
+        done
+    } < "$STAMP_FILE"
+    [ "$header" == "# elevate-token-stamp 1 ${ELEVATE_TOKENS_PATH%/}" ] || return 1
+    [ ${#paths[@]} -gt 0 ] || return 1
+    # GNU stat first, BSD/macOS stat otherwise; a missing file fails both
+    current=$(stat -c '%Y %s %n' "${paths[@]}" 2>/dev/null ||
+              stat -f '%m %z %N' "${paths[@]}" 2>/dev/null) || return 1
+    [ "$current" == "${expected%$'\n'}" ]
+}
+
+if [ "$1" != "--force" ] && stamp_is_current; then
+    echo -e "${GREEN}✅ Design tokens up to date${NC}"
+    exit 0
+fi
+
 # Run the Python script (which has built-in caching)
 cd "$PROJECT_ROOT"
 
@@ -10,6 +10,7 @@ Complete token extraction system supporting:
 - Component-specific tokens (colors + spacing)
 - MD5 caching for performance
 - Theme composition support
+- Stamp manifest so no-op builds skip Python entirely
 
 Key improvements over v3.2:
 - Parses ALL token types (not just colors)
@@ -33,6 +34,7 @@ import os
 import sys
 import hashlib
 import json
+import time
 from dataclasses import dataclass
 from typing import Optional, Dict, Tuple, Union, List
 from pathlib import Path
@@ -63,6 +65,9 @@ THEME_OVERWRITE_DARK_FILE = THEME_PATH / "overwrite-dark.css"
 OUTPUT_BASE = PROJECT_ROOT / "ElevateUI" / "Sources" / "DesignTokens"
 GENERATED_DIR = OUTPUT_BASE / "Generated"
 CACHE_FILE = OUTPUT_BASE / ".token_cache.json"
+# Read by regenerate-tokens-if-needed.sh before it launches Python
+STAMP_FILE = OUTPUT_BASE / ".token_stamp"
+STAMP_HEADER = "# elevate-token-stamp 1"
 
 
 class TokenType(Enum):
@@ -240,6 +245,57 @@ class SCSSUniversalParser:
         return tokens
 
 
+def stamp_header(tokens_path: Path) -> str:
+    """First stamp line; a different ELEVATE source path invalidates the stamp."""
+    return f"{STAMP_HEADER} {tokens_path}"
+
+
+def write_token_stamp(stamp_file: Path, tokens_path: Path,
+                      inputs: List[Path], outputs: List[Path]) -> bool:
+    """
+    Write the stamp manifest checked by regenerate-tokens-if-needed.sh.
+
+    One "<mtime> <size> <path>" line per file, in the format of
+    `stat -c '%Y %s %n'` (GNU) and `stat -f '%m %z %N'` (macOS), so the
+    build phase compares it with a single stat call. Directories are listed
+    too: their mtime changes when a source file is added or removed.
+
+    Args:
+        stamp_file: Manifest to write
+        tokens_path: ELEVATE SCSS root the outputs were generated from
+        inputs: Source files and directories
+        outputs: Generated files
+
+    Returns:
+        False if no stamp was written because an input changed within the
+        current second (mtimes have one-second resolution, so a later edit in
+        the same second would go unnoticed); the next build runs Python again
+    """
+    now = int(time.time())
+    lines = [stamp_header(tokens_path)]
+    for index, path in enumerate(inputs + outputs):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        if index < len(inputs) and int(stat.st_mtime) >= now:
+            stamp_file.unlink(missing_ok=True)
+            return False
+        lines.append(f"{int(stat.st_mtime)} {stat.st_size} {os.path.abspath(path)}")
+
+    tmp_file = stamp_file.with_name(stamp_file.name + ".tmp")
+    tmp_file.write_text("\n".join(lines) + "\n")
+    os.replace(tmp_file, stamp_file)
+    return True
+
+
+def nearest_directory(path: Path) -> Path:
+    """Closest existing directory at or above path (watched for new files)."""
+    while not path.is_dir() and path != path.parent:
+        path = path.parent
+    return path
+
+
 class TokenCacheManager:
     """Manages MD5 cache for incremental builds"""
 
@@ -420,7 +476,7 @@ def merge_theme_tokens(
     merged = base_tokens.copy()
 
     # Parse extend tokens (add missing)
-    if extend_file.exists():
+    if extend_file and extend_file.exists():
         extend_parser = SCSSUniversalParser(extend_file)
         extend_tokens = extend_parser.extract_all_tokens()
 
@@ -430,7 +486,7 @@ def merge_theme_tokens(
                 merged[name] = token
 
     # Parse overwrite tokens (replace existing)
-    if overwrite_file.exists():
+    if overwrite_file and overwrite_file.exists():
         overwrite_parser = SCSSUniversalParser(overwrite_file)
         overwrite_tokens = overwrite_parser.extract_all_tokens()
 
@@ -441,6 +497,87 @@ def merge_theme_tokens(
     return merged
 
 
+def apply_ios_theme(
+    light_tokens: Dict[str, TokenReference],
+    dark_tokens: Dict[str, TokenReference]
+) -> Tuple[Dict[str, TokenReference], Dict[str, TokenReference]]:
+    """
+    Apply the .elevate-themes/ios overlay to light and dark mode tokens.
+
+    Order: primitives.css overrides both modes, then extend.css (adds
+    missing), overrides.css, and the legacy overwrite.css /
+    overwrite-dark.css per mode.
+
+    Returns:
+        (light_tokens, dark_tokens) merged with the iOS theme
+    """
+    light_tokens = dict(light_tokens)
+    dark_tokens = dict(dark_tokens)
+
+    # iOS primitive overrides (touch targets, spacing, etc.)
+    if THEME_PRIMITIVES_FILE.exists():
+        primitives_overrides = SCSSUniversalParser(THEME_PRIMITIVES_FILE).extract_all_tokens()
+        light_tokens.update(primitives_overrides)
+        dark_tokens.update(primitives_overrides)
+
+    # Light mode: use extend.css + overrides.css (new) + overwrite.css (legacy)
+    light_tokens = merge_theme_tokens(light_tokens, THEME_EXTEND_FILE, THEME_OVERRIDES_FILE)
+    if THEME_OVERWRITE_FILE.exists():
+        light_tokens = merge_theme_tokens(light_tokens, None, THEME_OVERWRITE_FILE)
+
+    # Dark mode: use extend.css + overrides.css (new) + overwrite-dark.css (legacy)
+    dark_overwrite_file = THEME_OVERWRITE_DARK_FILE if THEME_OVERWRITE_DARK_FILE.exists() else THEME_OVERWRITE_FILE
+    dark_tokens = merge_theme_tokens(dark_tokens, THEME_EXTEND_FILE, THEME_OVERRIDES_FILE)
+    if dark_overwrite_file.exists():
+        dark_tokens = merge_theme_tokens(dark_tokens, None, dark_overwrite_file)
+
+    return light_tokens, dark_tokens
+
+
+def load_mode_tokens(
+    tokens_path: Path = ELEVATE_TOKENS_PATH,
+    theme: bool = True
+) -> Tuple[Dict[str, TokenReference], Dict[str, TokenReference]]:
+    """
+    Parse light and dark mode tokens as the generator sees them.
+
+    Args:
+        tokens_path: ELEVATE SCSS root (contains values/_light.scss, values/_dark.scss)
+        theme: Merge the iOS theme overlay
+
+    Returns:
+        (light_tokens, dark_tokens)
+    """
+    light_tokens = SCSSUniversalParser(tokens_path / "values" / "_light.scss").extract_all_tokens()
+    dark_tokens = SCSSUniversalParser(tokens_path / "values" / "_dark.scss").extract_all_tokens()
+    if theme:
+        light_tokens, dark_tokens = apply_ios_theme(light_tokens, dark_tokens)
+    return light_tokens, dark_tokens
+
+
+def resolve_token_value(
+    name: str,
+    tokens: Dict[str, TokenReference]
+) -> Optional[Union[str, float, Tuple[float, float, float, float]]]:
+    """
+    Resolve a token through its var() reference chain within one mode.
+
+    A referenced token present in the table (e.g. a primitive overridden by
+    the iOS theme) wins over the token's own fallback.
+
+    Returns:
+        Resolved value, or None if the token is unknown
+    """
+    seen = set()
+    token = tokens.get(name)
+    value = token.fallback.value if token else None
+    while token and token.reference in tokens and token.reference not in seen:
+        seen.add(token.name)
+        token = tokens[token.reference]
+        value = token.fallback.value
+    return value
+
+
 class ComprehensiveComponentGenerator:
     """Generates complete component token files (colors + spacing + dimensions)"""
 
@@ -1045,24 +1182,11 @@ def main():
     )
 
     if has_theme_files:
-        # iOS primitive overrides (touch targets, spacing, etc.)
-        if THEME_PRIMITIVES_FILE.exists():
-            primitives_parser = SCSSUniversalParser(THEME_PRIMITIVES_FILE)
-            primitives_overrides = primitives_parser.extract_all_tokens()
-            light_tokens.update(primitives_overrides)
-            dark_tokens.update(primitives_overrides)
-            print(f"  + {len(primitives_overrides)} primitive overrides from {THEME_PRIMITIVES_FILE.name}")
-
-        # Light mode: use extend.css + overrides.css (new) + overwrite.css (legacy)
-        light_tokens = merge_theme_tokens(light_tokens, THEME_EXTEND_FILE, THEME_OVERRIDES_FILE)
-        if THEME_OVERWRITE_FILE.exists():
-            light_tokens = merge_theme_tokens(light_tokens, None, THEME_OVERWRITE_FILE)
+        light_tokens, dark_tokens = apply_ios_theme(light_tokens, dark_tokens)
 
-        # Dark mode: use extend.css + overrides.css (new) + overwrite-dark.css (legacy)
-        dark_overwrite_file = THEME_OVERWRITE_DARK_FILE if THEME_OVERWRITE_DARK_FILE.exists() else THEME_OVERWRITE_FILE
-        dark_tokens = merge_theme_tokens(dark_tokens, THEME_EXTEND_FILE, THEME_OVERRIDES_FILE)
-        if dark_overwrite_file.exists():
-            dark_tokens = merge_theme_tokens(dark_tokens, None, dark_overwrite_file)
+        if THEME_PRIMITIVES_FILE.exists():
+            primitives_count = len(SCSSUniversalParser(THEME_PRIMITIVES_FILE).extract_all_tokens())
+            print(f"  + {primitives_count} primitive overrides from {THEME_PRIMITIVES_FILE.name}")
 
         # Report counts
         extend_count = 0
@@ -1222,6 +1346,16 @@ def main():
     else:
         print(f"  ⏭️  ElevateTypographyiOS.swift (cached)")
 
+    # Stamp every input and output so the next no-op build exits in the shell
+    stamp_inputs = all_source_files + sorted(component_files) + [
+        Path(__file__),
+        COMPONENT_TOKENS_PATH,
+        nearest_directory(THEME_PATH),
+    ]
+    stamp_outputs = [GENERATED_DIR] + sorted(GENERATED_DIR.glob("*.swift")) + [typography_file]
+    if not write_token_stamp(STAMP_FILE, ELEVATE_TOKENS_PATH, stamp_inputs, stamp_outputs):
+        print("  ⚠️  Sources changed during generation; build stamp not written")
+
     print("\n✅ Token extraction complete!")
     print(f"\nGenerated files: {GENERATED_DIR}")
 
@@ -12,17 +12,67 @@ Validates Swift UI components against Apple HIG requirements:
 Usage:
     python3 scripts/validate-ios-compliance.py
     python3 scripts/validate-ios-compliance.py --component Button
-    python3 scripts/validate-ios-compliance.py --fix
+    python3 scripts/validate-ios-compliance.py --fix  # Apply auto-fixes, then report what is left
+
+    # Validate a whole app tree with 8 worker processes
+    python3 scripts/validate-ios-compliance.py --paths App/Sources --jobs 8
+
+    # WCAG contrast of every text/fill token pair, light and dark mode
+    python3 scripts/validate-ios-compliance.py --contrast
+
+    # Pre-push hook: only files and hunks changed since a revision
+    python3 scripts/validate-ios-compliance.py --paths . --changed-since origin/main
+
+    # Editor integration: long-running process, JSON requests on stdin
+    python3 scripts/validate-ios-compliance.py --server
+
+    # Which rules are slow? Per-rule timing and a cProfile dump
+    python3 scripts/validate-ios-compliance.py --paths App --stats --profile hig.prof
+
+    # CI: SARIF for PR annotations, or NDJSON (one issue per line), streamed
+    python3 scripts/validate-ios-compliance.py --paths App --format sarif -o hig.sarif
+
+Results are cached per file in ~/.elevate-cache/hig-validation.json, keyed by
+file content hash and rule-set version, so only edited files are revalidated
+(--no-cache disables this). Symbolic font sizes such as
+`ElevateTypography.Sizes.bodySmall * iosScaleFactor` are evaluated against
+the typography token table, resolved once and cached in
+~/.elevate-cache/typography-table.json.
 """
 
+import abc
 import argparse
+import ast
+import bisect
+import cProfile
+import functools
+import hashlib
+import inspect
+import json
+import os
 import re
+import shutil
+import subprocess
 import sys
-from dataclasses import dataclass
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import IO, FrozenSet, Iterator, List, NamedTuple, Dict, Optional, Tuple
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:  # Pure-Python contrast math is used instead
+    np = None
+
+SCRIPT_DIR = Path(__file__).parent
+# Shared loader of update-design-tokens-v4.py (scripts/lib)
+if str(SCRIPT_DIR / "lib") not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR / "lib"))
+from elevate_token_generator import load_token_generator  # noqa: E402
+
 
 class ComplianceLevel(Enum):
     """HIG compliance levels"""
@@ -31,6 +81,13 @@ class ComplianceLevel(Enum):
     FAIL = "fail"
 
 
+class TextEdit(NamedTuple):
+    """Replace text[start:end] of a file (character offsets) with `text`"""
+    start: int
+    end: int
+    text: str
+
+
 @dataclass
 class ComplianceIssue:
     """Represents a single HIG compliance issue"""
@@ -42,211 +99,1480 @@ class ComplianceIssue:
     current_value: str
     recommended_value: str
     auto_fixable: bool = False
+    edits: Tuple[TextEdit, ...] = ()  # Applied by --fix when auto_fixable
 
     def __str__(self):
         icon = "✅" if self.level == ComplianceLevel.PASS else "⚠️" if self.level == ComplianceLevel.WARNING else "❌"
         return f"{icon} {self.file_path.name}:{self.line_number} - {self.description}\n   Current: {self.current_value}\n   Recommended: {self.recommended_value}"
 
+    def to_dict(self) -> Dict:
+        """Issue fields without the file path (JSON serializable)."""
+        return {
+            "line_number": self.line_number,
+            "rule": self.rule,
+            "level": self.level.value,
+            "description": self.description,
+            "current_value": self.current_value,
+            "recommended_value": self.recommended_value,
+            "auto_fixable": self.auto_fixable,
+            "edits": [list(edit) for edit in self.edits],
+        }
 
-class iOSHIGValidator:
+
+@dataclass
+class RuleStats:
+    """Cost of one rule over one file or a whole run"""
+    seconds: float = 0.0  # Trigger checks, check_line and finish
+    lines: int = 0  # Lines passed to check_line
+    issues: int = 0
+
+    def add(self, other: "RuleStats"):
+        self.seconds += other.seconds
+        self.lines += other.lines
+        self.issues += other.issues
+
+
+@dataclass
+class ValidationStats:
+    """Throughput of a validation run"""
+    files: int = 0
+    lines: int = 0
+    issues: int = 0
+    seconds: float = 0.0
+    jobs: int = 1
+    cached: int = 0  # Files answered from the result cache
+    # Per-rule cost, totals and per file (only with rule timing enabled; cached files are not timed)
+    rules: Dict[str, RuleStats] = field(default_factory=dict)
+    file_rules: Dict[Path, Dict[str, RuleStats]] = field(default_factory=dict)
+
+    def add_rule_stats(self, path: Path, rule_stats: Dict[str, RuleStats]):
+        self.file_rules[path] = rule_stats
+        for name, stats in rule_stats.items():
+            self.rules.setdefault(name, RuleStats()).add(stats)
+
+    def rule_report(self, top_files: int = 10) -> str:
+        """Per-rule totals and the slowest files, most expensive first."""
+        lines = [f"📊 Rule timing ({len(self.file_rules)} files timed, {self.cached} cached files not timed)"]
+        lines.append(f"  {'Rule':<24} {'Time (ms)':>10} {'Lines':>9} {'Issues':>7} {'µs/line':>8}")
+        for name, stats in sorted(self.rules.items(), key=lambda item: -item[1].seconds):
+            per_line = stats.seconds / stats.lines * 1e6 if stats.lines else 0.0
+            lines.append(f"  {name:<24} {stats.seconds * 1000:>10.2f} {stats.lines:>9} {stats.issues:>7} {per_line:>8.1f}")
+
+        slowest = sorted(
+            self.file_rules.items(),
+            key=lambda item: -sum(stats.seconds for stats in item[1].values())
+        )[:top_files]
+        if slowest:
+            lines.append("  Slowest files:")
+        for path, rule_stats in slowest:
+            total = sum(stats.seconds for stats in rule_stats.values())
+            worst = max(rule_stats, key=lambda name: rule_stats[name].seconds)
+            lines.append(f"    {total * 1000:8.2f} ms  {path.name} (mostly {worst})")
+        return "\n".join(lines)
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.seconds if self.seconds else 0.0
+
+    @property
+    def lines_per_second(self) -> float:
+        return self.lines / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (f"⚡ Validated {self.files} files ({self.lines} lines, {self.cached} cached) "
+                f"in {self.seconds:.2f}s with {self.jobs} job(s): {self.files_per_second:.0f} files/s, "
+                f"{self.lines_per_second:.0f} lines/s")
+
+
+def apply_edits(text: str, edits) -> Tuple[str, int]:
     """
-    Validates Swift/SwiftUI components against iOS HIG.
+    Apply edits to text in one pass, in offset order.
+
+    Edits overlapping an earlier edit are skipped; insertions at the same
+    offset are applied in the given order.
+
+    Returns:
+        (new text, number of edits applied)
     """
+    pieces = []
+    position = 0
+    applied = 0
+    for edit in sorted(edits, key=lambda edit: (edit.start, edit.end)):
+        if edit.start < position:
+            continue
+        pieces.append(text[position:edit.start])
+        pieces.append(edit.text)
+        position = edit.end
+        applied += 1
+    pieces.append(text[position:])
+    return ''.join(pieces), applied
 
-    def __init__(self, elevate_ui_path: Path):
-        self.elevate_ui_path = elevate_ui_path
-        self.components_dir = elevate_ui_path / "Sources" / "SwiftUI" / "Components"
-        self.typography_file = elevate_ui_path / "Sources" / "Typography" / "ElevateTypographyiOS.swift"
 
-    def validate_touch_targets(self, file_path: Path) -> List[ComplianceIssue]:
+@dataclass
+class FixResult:
+    """Outcome of auto-fixing one file"""
+    path: Path
+    fixed: int = 0  # Issues whose edits were applied
+    skipped: int = 0  # Fixable issues whose edits overlapped another fix
+
+
+@dataclass
+class IssueSummary:
+    """Issue counters, updated as results stream in"""
+    total: int = 0
+    failures: int = 0
+    warnings: int = 0
+    files: int = 0  # Files with at least one issue
+    rules: Dict[str, int] = field(default_factory=dict)  # Issues per rule
+
+    def add(self, issues: List[ComplianceIssue]):
+        if issues:
+            self.files += 1
+        for issue in issues:
+            self.total += 1
+            self.failures += issue.level == ComplianceLevel.FAIL
+            self.warnings += issue.level == ComplianceLevel.WARNING
+            self.rules[issue.rule] = self.rules.get(issue.rule, 0) + 1
+
+    def to_dict(self) -> Dict:
+        return {"total": self.total, "failures": self.failures, "warnings": self.warnings,
+                "files": self.files, "rules": dict(sorted(self.rules.items()))}
+
+
+class ValidationCache:
+    """
+    Persisted per-file validation results.
+
+    Entries are keyed by file path and validated against the file's content
+    hash; the whole cache is discarded when the rule set version changes.
+    """
+
+    CACHE_VERSION = 2
+
+    def __init__(self, cache_file: Path, ruleset_version: str):
+        self.cache_file = cache_file
+        self.ruleset_version = ruleset_version
+        self.files: Dict[str, Dict] = {}
+        self._dirty = False
+
+    def load(self) -> "ValidationCache":
+        if not self.cache_file.exists():
+            return self
+        try:
+            with open(self.cache_file, encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if cache.get("version") != self.CACHE_VERSION or cache.get("ruleset") != self.ruleset_version:
+            return self
+        self.files = cache.get("files", {})
+        return self
+
+    def get(self, path: Path, file_hash: str) -> Optional[Tuple[List[ComplianceIssue], int]]:
+        """Cached (issues, line count) for this exact file content, if any."""
+        entry = self.files.get(str(path))
+        if not entry or entry["hash"] != file_hash:
+            return None
+        issues = [
+            ComplianceIssue(
+                file_path=path,
+                level=ComplianceLevel(issue.pop("level")),
+                edits=tuple(TextEdit(*edit) for edit in issue.pop("edits")),
+                **issue
+            )
+            for issue in map(dict, entry["issues"])
+        ]
+        return issues, entry["lines"]
+
+    def put(self, path: Path, file_hash: str, issues: List[ComplianceIssue], line_count: int):
+        self.files[str(path)] = {
+            "hash": file_hash,
+            "lines": line_count,
+            "issues": [issue.to_dict() for issue in issues],
+        }
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic: an interrupted or concurrent run never leaves a truncated cache
+        write_text_atomic(self.cache_file, json.dumps(
+            {"version": self.CACHE_VERSION, "ruleset": self.ruleset_version, "files": self.files}
+        ))
+        self._dirty = False
+
+
+def ruleset_version(rules: List["ValidationRule"]) -> str:
+    """
+    Version of a rule set: changes whenever this script, the set of rules
+    or a rule's declared `version` changes.
+    """
+    digest = hashlib.md5(Path(__file__).read_bytes())
+    for rule in rules:
+        digest.update(f"{type(rule).__module__}.{type(rule).__qualname__}:{rule.version}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class LineIndex:
+    """
+    Sorted line numbers containing each indexed token, for O(log n)
+    "does TOKEN occur within lines first..last" window queries.
+    """
+
+    def __init__(self, tokens):
+        self.positions = {token: [] for token in tokens}
+
+    def add(self, line_number: int, line):
+        """Record the tokens found in line (a set of identifiers, or text to search)."""
+        for token, positions in self.positions.items():
+            if token in line:
+                positions.append(line_number)
+
+    def any_between(self, token: str, first: int, last: int) -> bool:
+        """Whether token occurs on any line in [first, last] (1-based, inclusive)."""
+        positions = self.positions[token]
+        return bisect.bisect_left(positions, first) < bisect.bisect_right(positions, last)
+
+
+class Token(NamedTuple):
+    """A lexical token on one line"""
+    kind: str  # comment, string, identifier, number, punct
+    text: str
+    column: int
+
+
+class SwiftLexer:
+    """
+    Line-at-a-time Swift lexer for validator rules.
+
+    Recognizes comments (line and nested block), string literals (single and
+    multi-line), identifiers, numbers and punctuation; enough for rules to
+    ignore comments and string contents and to match whole identifiers.
+    Lexing state (open block comment depth, open multi-line string) carries
+    from one line to the next, which lets TokenStream re-lex only from the
+    first edited line. Interpolations inside strings are not tokenized.
+    """
+
+    INITIAL = (0, False)  # (block comment depth, inside multi-line string)
+
+    TOKEN_PATTERN = re.compile(r'''
+        (?P<space>\s+)
+      | (?P<comment>//.*)
+      | (?P<block>/\*)
+      | (?P<multiline>""")
+      | (?P<string>"(?:[^"\\]|\\.)*"?)
+      | (?P<identifier>[A-Za-z_]\w*|`[^`]+`)
+      | (?P<number>\d[\d_]*(?:\.\d[\d_]*)?)
+      | (?P<punct>.)
+    ''', re.VERBOSE)
+    BLOCK_DELIMITER = re.compile(r'/\*|\*/')
+    MULTILINE_END = re.compile(r'(?<!\\)"""')
+
+    def lex_line(self, text: str, state: Tuple[int, bool] = INITIAL) -> Tuple[List[Token], str, Tuple[int, bool]]:
         """
-        Validate that interactive elements have ≥ 44pt touch targets.
+        Tokenize one line.
+
+        Args:
+            text: Line without its newline
+            state: Lexing state at the start of the line
 
-        Looks for:
-        - frame(width:height:) with values < 44
-        - Missing .frame(minWidth: 44, minHeight: 44)
-        - Button/Toggle/etc without explicit sizing
+        Returns:
+            (tokens, code, state at the start of the next line); code is the
+            line with comments and string contents replaced by spaces, so
+            columns are unchanged
         """
-        issues = []
+        depth, in_string = state
+        tokens = []
+        code = []
+        pos = 0
+        end = len(text)
 
-        with open(file_path, encoding='utf-8') as f:
-            lines = f.readlines()
-
-        for i, line in enumerate(lines, 1):
-            # Check for small frame sizes
-            frame_match = re.search(r'\.frame\((?:width|height):\s*(\d+(?:\.\d+)?)', line)
-            if frame_match:
-                size = float(frame_match.group(1))
-                if size < 44:
-                    issues.append(ComplianceIssue(
-                        file_path=file_path,
-                        line_number=i,
-                        rule="HIG Touch Target Size",
-                        level=ComplianceLevel.FAIL,
-                        description=f"Touch target too small ({size}pt < 44pt minimum)",
-                        current_value=line.strip(),
-                        recommended_value=f".frame(minWidth: 44, minHeight: 44)",
-                        auto_fixable=False
-                    ))
-
-            # Check for buttons without minWidth/minHeight
-            if any(keyword in line for keyword in ['Button', 'Toggle', 'Picker']) and 'minWidth' not in line:
-                # Look ahead to see if minWidth appears in next 5 lines
-                has_min_frame = any('minWidth' in lines[j] for j in range(i, min(i+5, len(lines))))
-                if not has_min_frame:
-                    issues.append(ComplianceIssue(
-                        file_path=file_path,
-                        line_number=i,
-                        rule="HIG Touch Target Size",
-                        level=ComplianceLevel.WARNING,
-                        description="Interactive element may not have 44pt minimum touch target",
-                        current_value=line.strip(),
-                        recommended_value="Add .frame(minWidth: 44, minHeight: 44)",
-                        auto_fixable=False
-                    ))
+        while pos < end:
+            if depth:
+                match = self.BLOCK_DELIMITER.search(text, pos)
+                stop = match.end() if match else end
+                if match:
+                    depth += 1 if match.group() == '/*' else -1
+                tokens.append(Token('comment', text[pos:stop], pos))
+                code.append(' ' * (stop - pos))
+                pos = stop
+                continue
 
-        return issues
+            if in_string:
+                match = self.MULTILINE_END.search(text, pos)
+                stop = match.end() if match else end
+                in_string = match is None
+                tokens.append(Token('string', text[pos:stop], pos))
+                code.append(' ' * (stop - pos - 3) + '"""' if match else ' ' * (stop - pos))
+                pos = stop
+                continue
 
-    def validate_typography(self, file_path: Path) -> List[ComplianceIssue]:
+            match = self.TOKEN_PATTERN.match(text, pos)
+            kind, value = match.lastgroup, match.group()
+            if kind == 'space':
+                code.append(value)
+            elif kind == 'comment':
+                tokens.append(Token(kind, value, pos))
+                code.append(' ' * len(value))
+            elif kind == 'block':
+                depth = 1
+                tokens.append(Token('comment', value, pos))
+                code.append('  ')
+            elif kind == 'multiline':
+                in_string = True
+                tokens.append(Token('string', value, pos))
+                code.append(value)
+            elif kind == 'string':
+                tokens.append(Token(kind, value, pos))
+                closed = len(value) > 1 and value.endswith('"')
+                code.append('"' + ' ' * (len(value) - 1 - closed) + '"' * closed)
+            else:
+                tokens.append(Token(kind, value, pos))
+                code.append(value)
+            pos = match.end()
+
+        return tokens, ''.join(code), (depth, in_string)
+
+
+class TokenStream:
+    """
+    Lexed view of a whole file, per line (0-based line indexes).
+
+    Each line's code text (see SwiftLexer.lex_line) and lexing state are
+    computed up front; lines without comment or string characters are their
+    own code and skip the lexer. Identifiers, call names and full tokens of
+    a line are derived from those on demand.
+    """
+
+    lexer = SwiftLexer()
+    IDENTIFIER = re.compile(r'(?<![\w$])[A-Za-z_]\w*')
+    CALL = re.compile(r'(?<![\w$])([A-Za-z_]\w*)\s*\(')
+    BRACKETS = {'(': ')', '{': '}', '[': ']'}
+    LABELED_CLOSURE = re.compile(r'[A-Za-z_]\w*\s*:\s*\{')
+    MODIFIER = re.compile(r'\.([A-Za-z_]\w*)\s*(?=\()')
+
+    def __init__(self, lines: List[str]):
+        self.lines: List[str] = []
+        self.states: List[Tuple[int, bool]] = [SwiftLexer.INITIAL]  # State at the start of each line
+        self.code: List[str] = []
+        self._identifiers: List[Optional[FrozenSet[str]]] = []
+        self.update(lines)
+
+    def line_identifiers(self, index: int) -> FrozenSet[str]:
+        """Identifiers in the code of a line (not in comments or strings)."""
+        identifiers = self._identifiers[index]
+        if identifiers is None:
+            identifiers = self._identifiers[index] = frozenset(self.IDENTIFIER.findall(self.code[index]))
+        return identifiers
+
+    def find_identifiers(self, index: int, names) -> FrozenSet[str]:
+        """Which of `names` occur as whole identifiers in the code of a line."""
+        code = self.code[index]
+        if not any(name in code for name in names):
+            return frozenset()
+        return self.line_identifiers(index).intersection(names)
+
+    def line_calls(self, index: int) -> Tuple[str, ...]:
+        """Names called on a line: identifiers followed by "(" (e.g. "frame" for `.frame(...)`)."""
+        code = self.code[index]
+        return tuple(self.CALL.findall(code)) if '(' in code else ()
+
+    def next_char(self, index: int, column: int, cross_lines: bool = True) -> Optional[Tuple[int, int]]:
+        """Position of the first non-space code character at or after (index, column)."""
+        while index < len(self.code):
+            line = self.code[index]
+            while column < len(line) and line[column].isspace():
+                column += 1
+            if column < len(line):
+                return index, column
+            if not cross_lines:
+                return None
+            index, column = index + 1, 0
+        return None
+
+    def match_bracket(self, index: int, column: int) -> Optional[Tuple[int, int]]:
+        """Position just after the bracket closing the one at (index, column)."""
+        opening = self.code[index][column]
+        closing = self.BRACKETS[opening]
+        depth = 0
+        while index < len(self.code):
+            line = self.code[index]
+            while column < len(line):
+                if line[column] == opening:
+                    depth += 1
+                elif line[column] == closing:
+                    depth -= 1
+                    if depth == 0:
+                        return index, column + 1
+                column += 1
+            index, column = index + 1, 0
+        return None
+
+    def call_end(self, index: int, column: int) -> Optional[Tuple[int, int]]:
         """
-        Validate typography sizes meet HIG requirements.
+        End of a call expression whose callee ends at (index, column): the
+        argument list and any trailing closures, including labeled ones
+        (`} label: {`).
 
-        - Body text ≥ 17pt
-        - Smallest text ≥ 11pt
-        - Uses Dynamic Type when possible
+        Returns:
+            Position just after the expression, or None if it is not a call
+            or is unterminated
         """
+        end = None
+        position = self.next_char(index, column, cross_lines=False)
+        if position and self.code[position[0]][position[1]] == '(':
+            end = self.match_bracket(*position)
+            position = end and self.next_char(*end, cross_lines=False)
+
+        while position and self.code[position[0]][position[1]] == '{':
+            end = self.match_bracket(*position)
+            position = end and self.next_char(*end)
+            label = position and self.LABELED_CLOSURE.match(self.code[position[0]], position[1])
+            if not label:
+                break
+            position = (position[0], label.end() - 1)
+        return end
+
+    def modifiers(self, index: int, column: int) -> Iterator[Tuple[str, str]]:
+        """(name, argument code) of each `.modifier(...)` chained after (index, column)."""
+        position = self.next_char(index, column)
+        while position:
+            modifier = self.MODIFIER.match(self.code[position[0]], position[1])
+            if not modifier:
+                return
+            end = self.call_end(position[0], modifier.end())
+            if end is None:
+                return
+            lines = self.code[position[0]:end[0] + 1]
+            lines[-1] = lines[-1][:end[1]]
+            lines[0] = lines[0][modifier.end():]  # Same line when the call fits on one
+            yield modifier.group(1), '\n'.join(lines)
+            position = self.next_char(*end)
+
+    def line_tokens(self, index: int) -> List[Token]:
+        """Tokens of a line."""
+        return self.lexer.lex_line(self.lines[index].rstrip('\r\n'), self.states[index])[0]
+
+    def _lex(self, text: str, state: Tuple[int, bool]) -> Tuple[str, Tuple[int, bool]]:
+        # Fast path: without strings or block comments, only a "//" comment can hide code
+        if state == SwiftLexer.INITIAL and '"' not in text and '/*' not in text:
+            cut = text.find('//')
+            return (text, state) if cut < 0 else (text[:cut] + ' ' * (len(text) - cut), state)
+        _, code, state = self.lexer.lex_line(text, state)
+        return code, state
+
+    def update(self, lines: List[str]) -> int:
+        """
+        Re-lex after an edit: lines before the first changed line are kept,
+        and lexing stops as soon as it is back in sync with unchanged
+        trailing lines (same line text and same state).
+
+        Returns:
+            Number of lines lexed
+        """
+        old_count, new_count = len(self.lines), len(lines)
+        start = 0
+        while start < min(old_count, new_count) and self.lines[start] == lines[start]:
+            start += 1
+        if start == old_count == new_count:
+            return 0
+        suffix = 0
+        while (suffix < min(old_count, new_count) - start
+               and self.lines[old_count - 1 - suffix] == lines[new_count - 1 - suffix]):
+            suffix += 1
+
+        state = self.states[start]
+        code, states = [], []
+        resume = None
+        for j in range(start, new_count):
+            old_j = j - new_count + old_count
+            if j >= new_count - suffix and state == self.states[old_j]:
+                resume = old_j
+                break
+            text, state = self._lex(lines[j].rstrip('\r\n'), state)
+            code.append(text)
+            states.append(state)
+
+        # Unchanged trailing lines (if lexing got back in sync) keep their results
+        tail = slice(resume, None) if resume is not None else slice(old_count, None)
+        self.code[start:] = code + self.code[tail]
+        self._identifiers[start:] = [None] * len(code) + self._identifiers[tail]
+        self.states[start + 1:] = states + (self.states[resume + 1:] if resume is not None else [])
+        self.lines = list(lines)
+        return len(code)
+
+
+@dataclass
+class SourceFile:
+    """A Swift file read once and shared by all rules"""
+    path: Path
+    lines: List[str]
+    state: Dict[str, object] = field(default_factory=dict)  # Per-file scratch space of rules
+    index: LineIndex = field(default_factory=lambda: LineIndex(()))  # Filled during the line walk
+    stream: Optional[TokenStream] = field(default=None, repr=False)
+
+    @classmethod
+    def read(cls, path: Path) -> "SourceFile":
+        # Line endings are kept as they are, so fixes can rewrite the file faithfully
+        with open(path, encoding='utf-8', newline='') as f:
+            return cls(path=path, lines=f.readlines())
+
+    @property
+    def text(self) -> str:
+        return ''.join(self.lines)
+
+    def offset(self, index: int, column: int) -> int:
+        """Character offset in text of (0-based line index, column)."""
+        offsets = self.state.get('offsets')
+        if offsets is None:
+            offsets = self.state['offsets'] = [0]
+            for line in self.lines:
+                offsets.append(offsets[-1] + len(line))
+        return offsets[index] + column
+
+    @property
+    def tokens(self) -> TokenStream:
+        """Token stream of the file, lexed on first use and shared by all rules."""
+        if self.stream is None:
+            self.stream = TokenStream(self.lines)
+        return self.stream
+
+
+class ValidationRule:
+    """
+    A HIG check evaluated during the single line walk over a file.
+
+    Subclasses declare `triggers` (substrings of the line's code, i.e.
+    outside comments and string literals) and `trigger_identifiers` (whole
+    identifiers): check_line is only called for lines containing at least
+    one of them. Identifiers in `indexed_tokens` are recorded in
+    source.index during the walk; window checks that need lines after the
+    current one are deferred to finish(), when the index is complete.
+    Tokens of the file are available as source.tokens.
+    """
+    name = ""
+    version = "1"  # Bump to invalidate cached results after changing a rule
+    triggers: Tuple[str, ...] = ()
+    trigger_identifiers: Tuple[str, ...] = ()
+    indexed_tokens: Tuple[str, ...] = ()
+
+    def applies_to(self, code: str, identifiers: FrozenSet[str] = frozenset()) -> bool:
+        # identifiers: the rule set's trigger and indexed identifiers present on the line
+        return (any(trigger in code for trigger in self.triggers)
+                or not identifiers.isdisjoint(self.trigger_identifiers))
+
+    def check_line(self, source: SourceFile, line_number: int, line: str) -> List[ComplianceIssue]:
+        return []
+
+    def finish(self, source: SourceFile) -> List[ComplianceIssue]:
+        return []
+
+
+class TouchTargetRule(ValidationRule):
+    """
+    Validate that interactive elements have ≥ 44pt touch targets.
+
+    Looks for:
+    - frame(width:height:) with values < 44
+    - Missing .frame(minWidth: 44, minHeight: 44)
+    - Button/Toggle/etc without explicit sizing
+    """
+    name = "touch-targets"
+    version = "4"
+    triggers = ('.frame(',)
+    trigger_identifiers = ('Button', 'Toggle', 'Picker')
+    indexed_tokens = ('minWidth',)
+
+    FRAME_PATTERN = re.compile(r'\.frame\((?:width|height):\s*(\d+(?:\.\d+)?)')
+    ELEMENT_PATTERN = re.compile(r'(?<![\w$.])(?:Button|Toggle|Picker)\b')
+    VIEW_POSITION = re.compile(r'(?:^|[{(,=;]|\breturn|\bin)\s*$')
+    MIN_FRAME = ".frame(minWidth: 44, minHeight: 44)"
+
+    def check_line(self, source, i, line):
         issues = []
+        identifiers = source.tokens.line_identifiers(i - 1)
 
-        with open(file_path, encoding='utf-8') as f:
-            lines = f.readlines()
-
-        for i, line in enumerate(lines, 1):
-            # Check for custom font sizes
-            font_match = re.search(r'Font\.custom\([^,]+,\s*size:\s*(\d+(?:\.\d+)?)', line)
-            if font_match:
-                size = float(font_match.group(1))
-
-                # Check for body text that's too small
-                if 'body' in line.lower() and size < 17:
-                    issues.append(ComplianceIssue(
-                        file_path=file_path,
-                        line_number=i,
-                        rule="HIG Typography - Body Text",
-                        level=ComplianceLevel.FAIL,
-                        description=f"Body text too small ({size}pt < 17pt minimum)",
-                        current_value=line.strip(),
-                        recommended_value=f"Use size: 17 or larger",
-                        auto_fixable=False
-                    ))
-
-                # Check for any text smaller than 11pt
-                elif size < 11:
-                    issues.append(ComplianceIssue(
-                        file_path=file_path,
-                        line_number=i,
-                        rule="HIG Typography - Minimum Size",
-                        level=ComplianceLevel.FAIL,
-                        description=f"Text too small ({size}pt < 11pt absolute minimum)",
-                        current_value=line.strip(),
-                        recommended_value=f"Use size: 11 or larger",
-                        auto_fixable=False
-                    ))
-
-            # Check for hardcoded font sizes (should use ElevateTypography)
-            if '.font(.system(size:' in line:
+        # Check for small frame sizes
+        frame_match = self.FRAME_PATTERN.search(source.tokens.code[i - 1])
+        if frame_match:
+            size = float(frame_match.group(1))
+            if size < 44:
                 issues.append(ComplianceIssue(
-                    file_path=file_path,
+                    file_path=source.path,
                     line_number=i,
-                    rule="Typography Token Usage",
-                    level=ComplianceLevel.WARNING,
-                    description="Using hardcoded system font instead of ElevateTypographyiOS",
+                    rule="HIG Touch Target Size",
+                    level=ComplianceLevel.FAIL,
+                    description=f"Touch target too small ({size}pt < 44pt minimum)",
                     current_value=line.strip(),
-                    recommended_value="Use ElevateTypographyiOS.bodyMedium or similar",
+                    recommended_value=f".frame(minWidth: 44, minHeight: 44)",
                     auto_fixable=False
                 ))
 
+        # Check for buttons without minWidth/minHeight (resolved in finish)
+        if not identifiers.isdisjoint(self.trigger_identifiers):
+            elements = self.elements(source, i - 1)
+            pending = source.state.setdefault(self.name, [])
+            if len(elements) > 1:
+                # A frame on the line may size only one of them: check each element's own chain
+                pending.extend((i, name, end, True) for name, end in elements)
+            elif 'minWidth' not in identifiers:
+                name, end = elements[0] if elements else (None, None)
+                pending.append((i, name, end, False))
+
         return issues
 
-    def validate_color_contrast(self, file_path: Path) -> List[ComplianceIssue]:
+    def finish(self, source):
+        issues = []
+
+        for i, element, end, shared_line in source.state.get(self.name, []):
+            # Look ahead to see if minWidth appears in next 5 lines
+            if not shared_line and source.index.any_between('minWidth', i + 1, i + 5):
+                continue
+            if end and any(name == 'frame' and 'minWidth' in arguments
+                           for name, arguments in source.tokens.modifiers(*end)):
+                continue  # Sized further down the element's modifier chain
+
+            edits = (self.frame_edit(source, i - 1, end),) if end else ()
+            subject = f"Interactive element ({element})" if shared_line else "Interactive element"
+            issues.append(ComplianceIssue(
+                file_path=source.path,
+                line_number=i,
+                rule="HIG Touch Target Size",
+                level=ComplianceLevel.WARNING,
+                description=f"{subject} may not have 44pt minimum touch target",
+                current_value=source.lines[i - 1].strip(),
+                recommended_value=f"Add {self.MIN_FRAME}",
+                auto_fixable=bool(edits),
+                edits=edits
+            ))
+
+        return issues
+
+    def elements(self, source, index: int) -> List[Tuple[str, Tuple[int, int]]]:
+        """
+        (name, end) of every Button/Toggle/Picker call expression starting on
+        a line where a view is expected (start of the line or after "{", "(",
+        ",", "=", ";", "return", "in").
         """
-        Validate color contrast meets WCAG AAA (7:1 for text, 3:1 for UI).
+        code = source.tokens.code[index]
+        elements = []
+        for match in self.ELEMENT_PATTERN.finditer(code):
+            if not self.VIEW_POSITION.search(code[:match.start()]):
+                continue
+            end = source.tokens.call_end(index, match.end())
+            if end:
+                elements.append((match.group(), end))
+        return elements
+
+    def frame_edit(self, source, index: int, end: Tuple[int, int]) -> TextEdit:
+        """Insert the minimum frame after an element ending at `end` (which starts on line `index`)."""
+        end_index, end_column = end
+        line = source.lines[end_index]
+        content = line.rstrip('\r\n')
+        if source.tokens.code[end_index][end_column:].strip():
+            # More code follows on the line: chain inline
+            offset = source.offset(end_index, end_column)
+            return TextEdit(offset, offset, self.MIN_FRAME)
+
+        # Modifier on its own line, indented like the element
+        indent = source.lines[index][:len(source.lines[index]) - len(source.lines[index].lstrip())]
+        newline = line[len(content):] or '\n'
+        offset = source.offset(end_index, len(content))
+        return TextEdit(offset, offset, f"{newline}{indent}{self.MIN_FRAME}")
 
-        This is a simplified check - full implementation would calculate actual contrast ratios.
+
+class TypographyTable:
+    """
+    Resolved typography sizes for evaluating symbolic Swift size expressions
+    such as `ElevateTypography.Sizes.bodyMedium * iosScaleFactor`.
+
+    Built once from the v4 parser's tokens: web base sizes come from the
+    ELEVATE light tokens (`elvt-typography-*`), the scale factor and any sizes
+    missing there from the iOS theme primitives (which hold the already
+    scaled sizes). The table can be persisted, keyed by a hash of its sources.
+    """
+
+    DEFAULT_SCALE = 1.25
+    SCALE_TOKEN = "ios-typography-scale"
+    SIZE_PREFIX = "elvt-typography-"
+    IDENTIFIER = re.compile(r'[A-Za-z_][\w.]*')
+    OPERATORS = {ast.Add: float.__add__, ast.Sub: float.__sub__, ast.Mult: float.__mul__, ast.Div: float.__truediv__}
+
+    def __init__(self, sizes: Dict[str, float], scale: float = DEFAULT_SCALE, digest: str = ""):
+        """
+        Args:
+            sizes: Web base size in pt by Swift name, lowercased (e.g., "bodymedium")
+            scale: iosScaleFactor
+            digest: Hash of the token sources the table was built from
         """
+        self.sizes = sizes
+        self.scale = scale
+        self.digest = digest
+
+    _shared: Optional["TypographyTable"] = None
+    _shared_sources: Tuple[Optional[Path], Optional[Path]] = (None, None)
+
+    @classmethod
+    def configure(cls, tokens_path: Optional[Path] = None, cache_file: Optional[Path] = None):
+        """Set the sources shared() loads from (arguments as for load); loads nothing yet."""
+        cls._shared = None
+        cls._shared_sources = (tokens_path, cache_file)
+
+    @classmethod
+    def shared(cls) -> "TypographyTable":
+        """The table of this process, loaded on first use from the configured sources."""
+        if cls._shared is None:
+            tokens_path, cache_file = cls._shared_sources
+            cls._shared = cls.load(tokens_path, cache_file=cache_file)
+        return cls._shared
+
+    @classmethod
+    def load(cls, tokens_path: Optional[Path] = None, theme_file: Optional[Path] = None,
+             cache_file: Optional[Path] = None) -> "TypographyTable":
+        """
+        Build the table from token sources (or the cache file if still valid).
+
+        Args:
+            tokens_path: ELEVATE SCSS root (default: the v4 generator's)
+            theme_file: iOS theme primitives (default: the v4 generator's)
+            cache_file: Persisted table (None disables persistence)
+        """
+        generator = load_token_generator()
+        tokens_path = tokens_path or generator.ELEVATE_TOKENS_PATH
+        theme_file = theme_file or generator.THEME_PRIMITIVES_FILE
+        base_file = tokens_path / "values" / "_light.scss"
+        sources = [path for path in (base_file, theme_file) if path.exists()]
+
+        digest = hashlib.md5()
+        for path in sources:
+            digest.update(str(path).encode('utf-8') + b'\0' + path.read_bytes())
+        digest = digest.hexdigest()
+
+        if cache_file and cache_file.exists():
+            try:
+                with open(cache_file, encoding='utf-8') as f:
+                    cached = json.load(f)
+                if cached.get("digest") == digest:
+                    return cls(cached["sizes"], cached["scale"], digest)
+            except (OSError, ValueError, KeyError):
+                pass
+
+        theme_tokens = generator.SCSSUniversalParser(theme_file).extract_all_tokens() if theme_file.exists() else {}
+        base_tokens = generator.SCSSUniversalParser(base_file).extract_all_tokens() if base_file.exists() else {}
+
+        scale = cls._points(theme_tokens.get(cls.SCALE_TOKEN)) or cls.DEFAULT_SCALE
+        sizes = {}
+        for tokens, divisor in ((theme_tokens, scale), (base_tokens, 1.0)):
+            for name, token in tokens.items():
+                points = cls._points(token)
+                if name.startswith(cls.SIZE_PREFIX) and points:
+                    sizes[name[len(cls.SIZE_PREFIX):].replace('-', '')] = points / divisor
+
+        table = cls(sizes, scale, digest)
+        if cache_file:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(cache_file, json.dumps({"digest": digest, "scale": scale, "sizes": sizes}))
+        return table
+
+    @staticmethod
+    def _points(token) -> Optional[float]:
+        """Numeric token value in points (1rem = 16pt), if it has one."""
+        if token is None or not isinstance(token.fallback.value, (int, float)):
+            return None
+        value = float(token.fallback.value)
+        return value * 16 if token.fallback.unit == "rem" else value
+
+    def size(self, name: str) -> Optional[float]:
+        """Web base size of `ElevateTypography.Sizes.<name>`."""
+        return self.sizes.get(name.lower())
+
+    def evaluate(self, expression: str) -> Optional[float]:
+        """
+        Evaluate a Swift size expression of numbers, `Sizes.<name>`,
+        `iosScaleFactor` and + - * / with parentheses.
+
+        Returns:
+            Size in pt, or None if the expression uses anything else
+        """
+        def substitute(match):
+            parts = match.group(0).split('.')
+            if parts[-1] == 'iosScaleFactor':
+                return repr(self.scale)
+            if len(parts) >= 2 and parts[-2] == 'Sizes' and self.size(parts[-1]) is not None:
+                return repr(self.size(parts[-1]))
+            raise ValueError(match.group(0))
+
+        try:
+            tree = ast.parse(self.IDENTIFIER.sub(substitute, expression), mode='eval')
+            return self._evaluate_node(tree.body)
+        except (ValueError, SyntaxError, ZeroDivisionError):
+            return None
+
+    def _evaluate_node(self, node) -> float:
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            return float(node.value)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            value = self._evaluate_node(node.operand)
+            return -value if isinstance(node.op, ast.USub) else value
+        if isinstance(node, ast.BinOp) and type(node.op) in self.OPERATORS:
+            return self.OPERATORS[type(node.op)](self._evaluate_node(node.left), self._evaluate_node(node.right))
+        raise ValueError(ast.dump(node))
+
+
+class TypographyRule(ValidationRule):
+    """
+    Validate typography sizes meet HIG requirements.
+
+    - Body text ≥ 17pt
+    - Smallest text ≥ 11pt
+    - Uses Dynamic Type when possible
+
+    Symbolic sizes (`ElevateTypography.Sizes.bodySmall * iosScaleFactor`)
+    are evaluated against the resolved TypographyTable.
+    """
+    name = "typography"
+    triggers = ('Font.custom(', '.font(.system(size:')
+
+    # A literal only counts when it is the whole argument; `10 * iosScaleFactor`
+    # is an expression and is evaluated
+    FONT_PATTERN = re.compile(r'Font\.custom\([^,]+,\s*size:\s*(\d+(?:\.\d+)?)\s*[,)]')
+    SIZE_EXPRESSION_PATTERN = re.compile(r'Font\.custom\([^,]+,\s*size:\s*([^,)]+?)\s*[,)]')
+
+    def __init__(self, table: Optional[TypographyTable] = None):
+        """
+        Args:
+            table: Resolved typography sizes (default: TypographyTable.shared(),
+                   loaded when the rule first needs it)
+        """
+        self._table = table
+
+    @property
+    def table(self) -> TypographyTable:
+        if self._table is None:
+            self._table = TypographyTable.shared()
+        return self._table
+
+    def __getstate__(self):
+        # Worker processes receive the resolved table, not the default sources
+        return {**self.__dict__, "_table": self.table}
+
+    @property
+    def version(self) -> str:
+        # Cached results depend on the token sizes, not just this rule
+        return f"4:{self.table.digest}"
+
+    def font_size(self, line: str) -> Optional[float]:
+        """Literal or evaluated size of a Font.custom(...) call on the line."""
+        font_match = self.FONT_PATTERN.search(line)
+        if font_match:
+            return float(font_match.group(1))
+        expression_match = self.SIZE_EXPRESSION_PATTERN.search(line)
+        if expression_match:
+            return self.table.evaluate(expression_match.group(1))
+        return None
+
+    def check_line(self, source, i, line):
         issues = []
 
-        with open(file_path, encoding='utf-8') as f:
-            content = f.read()
+        # Check for custom font sizes (in code; the "body" hint may be in a comment)
+        size = self.font_size(source.tokens.code[i - 1])
+        if size is not None:
 
-        # Check for hardcoded colors (should use tokens)
-        if re.search(r'Color\(red:|Color\.init\(red:', content):
+            # Check for body text that's too small
+            if 'body' in line.lower() and size < 17:
+                issues.append(ComplianceIssue(
+                    file_path=source.path,
+                    line_number=i,
+                    rule="HIG Typography - Body Text",
+                    level=ComplianceLevel.FAIL,
+                    description=f"Body text too small ({size}pt < 17pt minimum)",
+                    current_value=line.strip(),
+                    recommended_value=f"Use size: 17 or larger",
+                    auto_fixable=False
+                ))
+
+            # Check for any text smaller than 11pt
+            elif size < 11:
+                issues.append(ComplianceIssue(
+                    file_path=source.path,
+                    line_number=i,
+                    rule="HIG Typography - Minimum Size",
+                    level=ComplianceLevel.FAIL,
+                    description=f"Text too small ({size}pt < 11pt absolute minimum)",
+                    current_value=line.strip(),
+                    recommended_value=f"Use size: 11 or larger",
+                    auto_fixable=False
+                ))
+
+        # Check for hardcoded font sizes (should use ElevateTypography)
+        if '.font(.system(size:' in source.tokens.code[i - 1]:
             issues.append(ComplianceIssue(
-                file_path=file_path,
-                line_number=0,
-                rule="Color Token Usage",
+                file_path=source.path,
+                line_number=i,
+                rule="Typography Token Usage",
                 level=ComplianceLevel.WARNING,
-                description="Using hardcoded colors instead of design tokens",
-                current_value="Color(red:green:blue:) or Color.init()",
-                recommended_value="Use component tokens (ButtonComponentTokens.text_default)",
+                description="Using hardcoded system font instead of ElevateTypographyiOS",
+                current_value=line.strip(),
+                recommended_value="Use ElevateTypographyiOS.bodyMedium or similar",
                 auto_fixable=False
             ))
 
         return issues
 
-    def validate_accessibility(self, file_path: Path) -> List[ComplianceIssue]:
+
+class ColorTokenRule(ValidationRule):
+    """
+    Flag hardcoded colors in Swift sources.
+
+    Contrast ratios of the design tokens themselves are computed by
+    ContrastEngine (--contrast); hardcoded colors bypass that check.
+    """
+    name = "color-contrast"
+    version = "2"
+    triggers = ('Color(red:', 'Color.init(red:')
+
+    def check_line(self, source, i, line):
+        # Check for hardcoded colors (should use tokens); reported once per file
+        source.state[self.name] = True
+        return []
+
+    def finish(self, source):
+        if not source.state.get(self.name):
+            return []
+
+        return [ComplianceIssue(
+            file_path=source.path,
+            line_number=0,
+            rule="Color Token Usage",
+            level=ComplianceLevel.WARNING,
+            description="Using hardcoded colors instead of design tokens",
+            current_value="Color(red:green:blue:) or Color.init()",
+            recommended_value="Use component tokens (ButtonComponentTokens.text_default)",
+            auto_fixable=False
+        )]
+
+
+class AccessibilityLabelRule(ValidationRule):
+    """
+    Check for basic accessibility support.
+
+    - .accessibilityLabel() for icon-only buttons
+    - .accessibilityHint() for complex interactions
+    - Semantic elements (Button, Toggle, not just Text + TapGesture)
+    """
+    name = "accessibility"
+    version = "2"
+    triggers = ('Image(', 'Icon(')
+    indexed_tokens = ('Button', 'accessibilityLabel')
+
+    def check_line(self, source, i, line):
+        # Detect icon-only buttons (resolved in finish)
+        source.state.setdefault(self.name, []).append(i)
+        return []
+
+    def finish(self, source):
+        issues = []
+
+        for i in source.state.get(self.name, []):
+            # Check if there's a Button wrapper nearby, then for accessibilityLabel
+            if not source.index.any_between('Button', i - 2, i + 3):
+                continue
+            if source.index.any_between('accessibilityLabel', i - 4, i + 5):
+                continue
+
+            issues.append(ComplianceIssue(
+                file_path=source.path,
+                line_number=i,
+                rule="Accessibility Label",
+                level=ComplianceLevel.WARNING,
+                description="Icon button missing .accessibilityLabel()",
+                current_value=source.lines[i - 1].strip(),
+                recommended_value="Add .accessibilityLabel(\"descriptive label\")",
+                auto_fixable=False
+            ))
+
+        return issues
+
+
+@dataclass
+class ContrastPair:
+    """WCAG contrast of one text token over its fill token in one mode"""
+    mode: str
+    text_token: str
+    fill_token: str
+    ratio: float
+    minimum: float
+
+    @property
+    def passes(self) -> bool:
+        return self.ratio >= self.minimum
+
+    def __str__(self):
+        icon = "✅" if self.passes else "❌"
+        return f"{icon} [{self.mode}] {self.text_token} on {self.fill_token}: {self.ratio:.2f}:1 (minimum {self.minimum}:1)"
+
+
+class ContrastEngine:
+    """
+    WCAG 2.x contrast ratios for all text/fill pairs of alias and component tokens.
+
+    Colors are resolved per mode through their var() reference chains (so
+    iOS theme overrides apply), translucent colors are composited (text over
+    fill over the app background) and all pairs of a mode are evaluated in
+    one vectorized NumPy pass, or in pure Python when NumPy is unavailable.
+    Disabled states are exempt, as in WCAG 1.4.3.
+    """
+
+    MIN_TEXT_CONTRAST = 4.5  # WCAG AA for normal text (AAA: 7.0)
+    BACKGROUND_TOKEN = "elvt-alias-layout-layer-appBackground"
+    DEFAULT_BACKGROUNDS = {"light": (1.0, 1.0, 1.0), "dark": (0.0, 0.0, 0.0)}
+    LUMINANCE_WEIGHTS = (0.2126, 0.7152, 0.0722)
+    TOKEN_PREFIXES = ("elvt-alias-", "elvt-component-")
+
+    def __init__(self, modes: Dict[str, Dict], minimum: float = MIN_TEXT_CONTRAST):
+        """
+        Args:
+            modes: Mode name ("light", "dark") → parsed token table (name → TokenReference)
+            minimum: Required contrast ratio
+        """
+        self.modes = modes
+        self.minimum = minimum
+        self._generator = load_token_generator()
+
+    @classmethod
+    def from_scss(cls, tokens_path: Path, theme: bool = True, minimum: float = MIN_TEXT_CONTRAST) -> "ContrastEngine":
+        """Load light/dark tokens with the v4 parser (and iOS theme overlay)."""
+        light_tokens, dark_tokens = load_token_generator().load_mode_tokens(tokens_path, theme)
+        return cls({"light": light_tokens, "dark": dark_tokens}, minimum)
+
+    @staticmethod
+    def text_fill_pairs(token_names) -> List[Tuple[str, str]]:
+        """
+        Pair every text token with the fill token of the same element and state:
+        `<element>-text-<state>` → `<element>-fill-<state>`
+        (`-text-color-<state>` → `-fill-<state>` as well).
+        """
+        names = set(token_names)
+        pairs = []
+        for name in sorted(names):
+            if not name.startswith(ContrastEngine.TOKEN_PREFIXES) or '-text-' not in name or 'disabled' in name:
+                continue
+            element, state = name.split('-text-', 1)
+            candidates = [f"{element}-fill-{state}"]
+            if state.startswith('color-'):
+                candidates.append(f"{element}-fill-{state[len('color-'):]}")
+            fill = next((c for c in candidates if c in names), None)
+            if fill:
+                pairs.append((name, fill))
+        return pairs
+
+    def evaluate(self) -> Dict[str, List[ContrastPair]]:
+        """
+        Contrast of every resolvable text/fill pair.
+
+        Returns:
+            Mode → pairs (sorted by token name)
+        """
+        results = {}
+        for mode, tokens in self.modes.items():
+            text_colors, fill_colors, names = [], [], []
+            for text, fill in self.text_fill_pairs(tokens):
+                text_rgba = self._color(text, tokens)
+                fill_rgba = self._color(fill, tokens)
+                if text_rgba and fill_rgba:
+                    names.append((text, fill))
+                    text_colors.append(text_rgba)
+                    fill_colors.append(fill_rgba)
+
+            background = self._color(self.BACKGROUND_TOKEN, tokens)
+            background = background[:3] if background else self.DEFAULT_BACKGROUNDS.get(mode, (1.0, 1.0, 1.0))
+
+            ratios = self.contrast_ratios(text_colors, fill_colors, background)
+            results[mode] = [
+                ContrastPair(mode, text, fill, round(float(ratio), 2), self.minimum)
+                for (text, fill), ratio in zip(names, ratios)
+            ]
+        return results
+
+    def failing_pairs(self) -> Dict[str, List[ContrastPair]]:
+        """Pairs below the minimum ratio, per mode."""
+        return {
+            mode: [pair for pair in pairs if not pair.passes]
+            for mode, pairs in self.evaluate().items()
+        }
+
+    def _color(self, name: str, tokens: Dict) -> Optional[Tuple[float, float, float, float]]:
+        value = self._generator.resolve_token_value(name, tokens)
+        return value if isinstance(value, tuple) and len(value) == 4 else None
+
+    @classmethod
+    def contrast_ratios(cls, text_colors: List[Tuple], fill_colors: List[Tuple], background: Tuple) -> List[float]:
         """
-        Check for basic accessibility support.
+        WCAG contrast ratios of RGBA text colors over RGBA fill colors.
+
+        Args:
+            text_colors: RGBA tuples (0-1)
+            fill_colors: RGBA tuples (0-1), same length
+            background: RGB the fills are composited over
 
-        - .accessibilityLabel() for icon-only buttons
-        - .accessibilityHint() for complex interactions
-        - Semantic elements (Button, Toggle, not just Text + TapGesture)
+        Returns:
+            Contrast ratio per pair
         """
+        if not text_colors:
+            return []
+        if np is not None:
+            return cls._contrast_ratios_numpy(text_colors, fill_colors, background).tolist()
+        return [cls._contrast_ratio(text, fill, background) for text, fill in zip(text_colors, fill_colors)]
+
+    @classmethod
+    def _contrast_ratios_numpy(cls, text_colors, fill_colors, background):
+        text = np.asarray(text_colors, dtype=float)
+        fill = np.asarray(fill_colors, dtype=float)
+        background = np.asarray(background, dtype=float)
+
+        fill_rgb = fill[:, :3] * fill[:, 3:] + background * (1 - fill[:, 3:])
+        text_rgb = text[:, :3] * text[:, 3:] + fill_rgb * (1 - text[:, 3:])
+
+        def luminance(rgb):
+            linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+            return linear @ np.asarray(cls.LUMINANCE_WEIGHTS)
+
+        l_text, l_fill = luminance(text_rgb), luminance(fill_rgb)
+        return (np.maximum(l_text, l_fill) + 0.05) / (np.minimum(l_text, l_fill) + 0.05)
+
+    @classmethod
+    def _contrast_ratio(cls, text, fill, background) -> float:
+        fill_rgb = [c * fill[3] + b * (1 - fill[3]) for c, b in zip(fill[:3], background)]
+        text_rgb = [c * text[3] + f * (1 - text[3]) for c, f in zip(text[:3], fill_rgb)]
+
+        def luminance(rgb):
+            linear = [c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in rgb]
+            return sum(w * c for w, c in zip(cls.LUMINANCE_WEIGHTS, linear))
+
+        l_text, l_fill = luminance(text_rgb), luminance(fill_rgb)
+        return (max(l_text, l_fill) + 0.05) / (min(l_text, l_fill) + 0.05)
+
+
+def generate_contrast_report(results: Dict[str, List[ContrastPair]]) -> str:
+    """
+    Human-readable report of failing text/fill pairs per mode.
+    """
+    lines = []
+
+    lines.append("=" * 70)
+    lines.append("Token Contrast Report (WCAG)")
+    lines.append("=" * 70)
+    lines.append("")
+
+    for mode, pairs in results.items():
+        failing = [pair for pair in pairs if not pair.passes]
+        lines.append(f"🎨 {mode}: {len(pairs)} text/fill pairs, {len(failing)} failing")
+        for pair in sorted(failing, key=lambda p: p.ratio):
+            lines.append(f"  {pair}")
+        lines.append("")
+
+    if not any(not pair.passes for pairs in results.values() for pair in pairs):
+        lines.append("✅ All text/fill token pairs meet the contrast minimum!")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+@functools.lru_cache(maxsize=None)
+def _trigger_pattern(triggers: Tuple[str, ...]) -> "re.Pattern":
+    """One regex matching any of the triggers (never matches if there are none)."""
+    return re.compile('|'.join(map(re.escape, triggers)) or r'(?!)')
+
+
+# Rules run by default, in report order
+DEFAULT_RULES = (TouchTargetRule, TypographyRule, ColorTokenRule, AccessibilityLabelRule)
+
+
+class iOSHIGValidator:
+    """
+    Validates Swift/SwiftUI components against iOS HIG.
+
+    Each file is read once and its lines are walked once; every line is
+    dispatched to all registered rules whose triggers it contains.
+    """
+
+    def __init__(
+        self,
+        elevate_ui_path: Path,
+        rules: Optional[List[ValidationRule]] = None,
+        cache_file: Optional[Path] = None,
+        time_rules: bool = False
+    ):
+        """
+        Args:
+            elevate_ui_path: ElevateUI package root
+            rules: Rules to run (default: DEFAULT_RULES)
+            cache_file: Persisted result cache (None disables caching)
+            time_rules: Record per-rule time, lines and issues in self.stats
+        """
+        self.elevate_ui_path = elevate_ui_path
+        self.components_dir = elevate_ui_path / "Sources" / "SwiftUI" / "Components"
+        self.typography_file = elevate_ui_path / "Sources" / "Typography" / "ElevateTypographyiOS.swift"
+        self.rules = list(rules) if rules is not None else [rule() for rule in DEFAULT_RULES]
+        self.stats = ValidationStats()
+        self.cache = ValidationCache(cache_file, ruleset_version(self.rules)).load() if cache_file else None
+        self.time_rules = time_rules
+
+    def validate_source(
+        self,
+        source: SourceFile,
+        rules: Optional[List[ValidationRule]] = None,
+        rule_stats: Optional[Dict[str, RuleStats]] = None
+    ) -> List[ComplianceIssue]:
+        """
+        Run rules over an already loaded file in a single line walk.
+
+        Args:
+            rule_stats: If given, filled with the cost of each rule (by rule name)
+        """
+        rules = self.rules if rules is None else rules
+        if rule_stats is not None:
+            return self._validate_source_timed(source, rules, rule_stats)
+
         issues = []
+        source.index = LineIndex({token for rule in rules for token in rule.indexed_tokens})
+
+        stream = source.tokens
+        watched = tuple({name for rule in rules for name in (*rule.trigger_identifiers, *rule.indexed_tokens)})
+        any_trigger = _trigger_pattern(tuple(sorted({trigger for rule in rules for trigger in rule.triggers})))
+        for i, line in enumerate(source.lines, 1):
+            code, identifiers = stream.code[i - 1], stream.find_identifiers(i - 1, watched)
+            if identifiers:
+                source.index.add(i, identifiers)
+            elif not any_trigger.search(code):
+                continue  # No rule applies to this line
+            for rule in rules:
+                if rule.applies_to(code, identifiers):
+                    issues.extend(rule.check_line(source, i, line))
 
-        with open(file_path, encoding='utf-8') as f:
-            lines = f.readlines()
-
-        icon_buttons = []
-        for i, line in enumerate(lines, 1):
-            # Detect icon-only buttons
-            if 'Image(' in line or 'Icon(' in line:
-                # Check if there's a Button wrapper nearby
-                context = ''.join(lines[max(0, i-3):min(len(lines), i+3)])
-                if 'Button' in context:
-                    # Check for accessibilityLabel
-                    has_label = any('accessibilityLabel' in lines[j]
-                                    for j in range(max(0, i-5), min(i+5, len(lines))))
-                    if not has_label:
-                        issues.append(ComplianceIssue(
-                            file_path=file_path,
-                            line_number=i,
-                            rule="Accessibility Label",
-                            level=ComplianceLevel.WARNING,
-                            description="Icon button missing .accessibilityLabel()",
-                            current_value=line.strip(),
-                            recommended_value="Add .accessibilityLabel(\"descriptive label\")",
-                            auto_fixable=False
-                        ))
+        for rule in rules:
+            issues.extend(rule.finish(source))
 
         return issues
 
+    def _validate_source_timed(self, source, rules, rule_stats) -> List[ComplianceIssue]:
+        # Same walk as validate_source, with every rule's work on the clock
+        clock = time.perf_counter
+        issues = []
+        source.index = LineIndex({token for rule in rules for token in rule.indexed_tokens})
+        timed = [(rule, rule_stats.setdefault(rule.name or type(rule).__name__, RuleStats())) for rule in rules]
+
+        stream = source.tokens
+        watched = tuple({name for rule in rules for name in (*rule.trigger_identifiers, *rule.indexed_tokens)})
+        for i, line in enumerate(source.lines, 1):
+            code, identifiers = stream.code[i - 1], stream.find_identifiers(i - 1, watched)
+            source.index.add(i, identifiers)
+            for rule, stats in timed:
+                started = clock()
+                if rule.applies_to(code, identifiers):
+                    found = rule.check_line(source, i, line)
+                    stats.lines += 1
+                    stats.issues += len(found)
+                    issues.extend(found)
+                stats.seconds += clock() - started
+
+        for rule, stats in timed:
+            started = clock()
+            found = rule.finish(source)
+            stats.seconds += clock() - started
+            stats.issues += len(found)
+            issues.extend(found)
+
+        return issues
+
+    def _validate_with(self, rule_type, file_path: Path) -> List[ComplianceIssue]:
+        rules = [rule for rule in self.rules if isinstance(rule, rule_type)] or [rule_type()]
+        return self.validate_source(SourceFile.read(file_path), rules)
+
+    def validate_touch_targets(self, file_path: Path) -> List[ComplianceIssue]:
+        """Validate that interactive elements have ≥ 44pt touch targets."""
+        return self._validate_with(TouchTargetRule, file_path)
+
+    def validate_typography(self, file_path: Path) -> List[ComplianceIssue]:
+        """Validate typography sizes meet HIG requirements."""
+        return self._validate_with(TypographyRule, file_path)
+
+    def validate_color_contrast(self, file_path: Path) -> List[ComplianceIssue]:
+        """Validate colors come from design tokens."""
+        return self._validate_with(ColorTokenRule, file_path)
+
+    def validate_accessibility(self, file_path: Path) -> List[ComplianceIssue]:
+        """Check for basic accessibility support."""
+        return self._validate_with(AccessibilityLabelRule, file_path)
+
     def validate_component(self, file_path: Path) -> List[ComplianceIssue]:
         """
         Run all validation rules on a component file.
         """
-        issues = []
+        return self.validate_source(SourceFile.read(file_path))
 
-        issues.extend(self.validate_touch_targets(file_path))
-        issues.extend(self.validate_typography(file_path))
-        issues.extend(self.validate_color_contrast(file_path))
-        issues.extend(self.validate_accessibility(file_path))
+    def validate_files(self, paths: List[Path], jobs: int = 1) -> Dict[Path, List[ComplianceIssue]]:
+        """
+        Validate many files, optionally in a process pool.
 
-        return issues
+        Args:
+            paths: Swift files to validate
+            jobs: Worker processes (1 validates in this process)
+
+        Returns:
+            Dict mapping each path to its issues (in input order)
+        """
+        return dict(self.iter_files(paths, jobs))
+
+    def iter_files(self, paths: List[Path], jobs: int = 1) -> Iterator[Tuple[Path, List[ComplianceIssue]]]:
+        """
+        Validate many files, yielding (path, issues) as soon as each file's
+        result is available.
+
+        Results are yielded in input order regardless of which worker finished
+        first, so output is identical for any number of jobs. Throughput of
+        the run is recorded in self.stats.
+
+        Args:
+            paths: Swift files to validate
+            jobs: Worker processes (1 validates in this process)
+        """
+        started = time.perf_counter()
+        self.stats = ValidationStats()
+
+        # Unchanged files are answered from the cache
+        cached = {}
+        hashes = {}
+        if self.cache:
+            for path in paths:
+                hashes[path] = hashlib.md5(path.read_bytes()).hexdigest()
+                entry = self.cache.get(path, hashes[path])
+                if entry is not None:
+                    cached[path] = entry
+
+        misses = [path for path in paths if path not in cached]
+        jobs = max(1, min(jobs, len(misses)))
+        self.stats.jobs = jobs
+        self.stats.cached = sum(1 for path in paths if path in cached)
+
+        pool = None
+        try:
+            if jobs == 1:
+                fresh = map(self._validate_counting, misses)
+            else:
+                pool = ProcessPoolExecutor(
+                    max_workers=jobs,
+                    initializer=_init_worker,
+                    initargs=(self.elevate_ui_path, self.rules, self.time_rules)
+                )
+                # Batch several files per task to amortize pickling round trips
+                chunksize = max(1, len(misses) // (jobs * 4))
+                fresh = pool.map(_validate_in_worker, misses, chunksize=chunksize)
+
+            for path in paths:
+                if path in cached:
+                    issues, line_count = cached[path]
+                else:
+                    issues, line_count, rule_stats = next(fresh)
+                    if rule_stats is not None:
+                        self.stats.add_rule_stats(path, rule_stats)
+                    if self.cache:
+                        self.cache.put(path, hashes[path], issues, line_count)
 
-    def validate_all_components(self) -> Dict[str, List[ComplianceIssue]]:
+                self.stats.files += 1
+                self.stats.lines += line_count
+                self.stats.issues += len(issues)
+                self.stats.seconds = time.perf_counter() - started
+                yield path, issues
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+            if self.cache:
+                self.cache.save()
+
+    def _validate_counting(self, path: Path) -> Tuple[List[ComplianceIssue], int, Optional[Dict[str, RuleStats]]]:
+        source = SourceFile.read(path)
+        rule_stats = {} if self.time_rules else None
+        return self.validate_source(source, rule_stats=rule_stats), len(source.lines), rule_stats
+
+    def fix_file(self, path: Path, ranges: Optional[List[Tuple[int, int]]] = None) -> FixResult:
+        """
+        Validate a file and apply the edits of all its fixable issues in a
+        single rewrite of the file it was validated from.
+
+        Args:
+            ranges: Only fix issues on lines inside these sorted line ranges
+                    (e.g., the hunks of git_changed_lines)
+        """
+        source = SourceFile.read(path)
+        issues = self.validate_source(source)
+        if ranges is not None:
+            issues = filter_issues_to_ranges(issues, ranges)
+        fixable = [issue for issue in issues if issue.auto_fixable]
+        result = FixResult(path)
+        if not fixable:
+            return result
+
+        # Issues are fixed whole: one whose edits overlap an accepted fix is skipped
+        text = source.text
+        edits = []
+        position = 0
+        for issue in sorted(fixable, key=lambda issue: min(issue.edits)):
+            issue_edits = sorted(set(issue.edits) - set(edits))
+            if issue_edits and issue_edits[0].start < position:
+                result.skipped += 1
+                continue
+            edits.extend(issue_edits)
+            position = max([position, *(edit.end for edit in issue_edits)])
+            result.fixed += 1
+
+        fixed_text, _ = apply_edits(text, edits)
+        if fixed_text != text:
+            write_text_atomic(path, fixed_text)
+        return result
+
+    def fix_files(
+        self,
+        paths: List[Path],
+        jobs: int = 1,
+        changed: Optional[Dict[Path, List[Tuple[int, int]]]] = None
+    ) -> List[FixResult]:
+        """
+        Auto-fix many files, optionally in a process pool (one read and at
+        most one write per file).
+
+        Args:
+            changed: If given, only fix issues in these line ranges per path
+                     (as returned by git_changed_lines)
+
+        Returns:
+            FixResult per path, in input order
+        """
+        ranges = [changed.get(path, []) if changed is not None else None for path in paths]
+        jobs = max(1, min(jobs, len(paths)))
+        if jobs == 1:
+            return [self.fix_file(path, path_ranges) for path, path_ranges in zip(paths, ranges)]
+
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(self.elevate_ui_path, self.rules)
+        ) as pool:
+            chunksize = max(1, len(paths) // (jobs * 4))
+            return list(pool.map(_fix_in_worker, paths, ranges, chunksize=chunksize))
+
+    def component_files(self) -> List[Path]:
+        """All SwiftUI component files (empty if the directory is missing)."""
+        return sorted(self.components_dir.glob("Elevate*+SwiftUI.swift"))
+
+    def validate_all_components(self, jobs: int = 1) -> Dict[str, List[ComplianceIssue]]:
         """
         Validate all SwiftUI components.
 
+        Args:
+            jobs: Worker processes
+
         Returns:
             Dict mapping component name to list of issues
         """
@@ -256,8 +1582,7 @@ class iOSHIGValidator:
             print(f"❌ Components directory not found: {self.components_dir}")
             return results
 
-        for component_file in self.components_dir.glob("Elevate*+SwiftUI.swift"):
-            issues = self.validate_component(component_file)
+        for component_file, issues in self.validate_files(self.component_files(), jobs).items():
             if issues:
                 results[component_file.stem] = issues
 
@@ -269,17 +1594,17 @@ class iOSHIGValidator:
         """
         lines = []
 
-        total_issues = sum(len(issues) for issues in results.values())
-        fail_count = sum(1 for issues in results.values() for i in issues if i.level == ComplianceLevel.FAIL)
-        warn_count = sum(1 for issues in results.values() for i in issues if i.level == ComplianceLevel.WARNING)
+        summary = IssueSummary()
+        for issues in results.values():
+            summary.add(issues)
 
         lines.append("=" * 70)
         lines.append("iOS HIG Compliance Validation Report")
         lines.append("=" * 70)
         lines.append("")
-        lines.append(f"Total Issues: {total_issues}")
-        lines.append(f"  ❌ Failures: {fail_count}")
-        lines.append(f"  ⚠️  Warnings: {warn_count}")
+        lines.append(f"Total Issues: {summary.total}")
+        lines.append(f"  ❌ Failures: {summary.failures}")
+        lines.append(f"  ⚠️  Warnings: {summary.warnings}")
         lines.append("")
 
         if not results:
@@ -308,6 +1633,387 @@ class iOSHIGValidator:
         return "\n".join(lines)
 
 
+# Validator of a pool worker process (set by _init_worker)
+_worker_validator = None
+
+
+def _init_worker(elevate_ui_path: Path, rules: List[ValidationRule], time_rules: bool = False):
+    global _worker_validator
+    _worker_validator = iOSHIGValidator(elevate_ui_path, rules, time_rules=time_rules)
+
+
+def _validate_in_worker(path: Path) -> Tuple[List[ComplianceIssue], int, Optional[Dict[str, RuleStats]]]:
+    return _worker_validator._validate_counting(path)
+
+
+def _fix_in_worker(path: Path, ranges: Optional[List[Tuple[int, int]]] = None) -> FixResult:
+    return _worker_validator.fix_file(path, ranges)
+
+
+def write_text_atomic(path: Path, text: str):
+    """Replace (or create) a file's content atomically, keeping its permissions."""
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        if path.exists():
+            shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+@dataclass
+class OpenDocument:
+    """A file held by the server: its token stream and last results"""
+    path: Path
+    stream: TokenStream
+    content_hash: str = ""
+    issues: List[ComplianceIssue] = field(default_factory=list)
+
+
+class ValidatorServer:
+    """
+    Long-running validator for editors, speaking line-delimited JSON over
+    stdin/stdout: one request object per line, one response per request.
+
+    Requests:
+        {"id": 1, "method": "validate", "params": {"path": "...", "text": "..."}}
+            Validate a buffer (the file on disk if "text" is omitted).
+            Result: {"issues": [...], "cached": bool, "lexed": n, "ms": t}
+        {"id": 2, "method": "close", "params": {"path": "..."}}
+        {"id": 3, "method": "stats"}
+            Result: {"documents": n, "requests": n, "validations": n}, plus
+            per-rule "rules" totals and the "rule_report" text with --stats
+        {"id": 4, "method": "shutdown"}
+
+    Errors are returned as {"id": ..., "error": {"code": ..., "message": ...}}
+    with JSON-RPC error codes. Rules, the typography table and each open
+    document's token stream stay in memory; an edited buffer is re-lexed
+    from its first changed line, and an unchanged one is answered from the
+    last result.
+    """
+
+    PARSE_ERROR = -32700
+    INVALID_REQUEST = -32600
+    METHOD_NOT_FOUND = -32601
+    INVALID_PARAMS = -32602
+    INTERNAL_ERROR = -32603
+
+    class InvalidParams(Exception):
+        """Raised by a method whose params have the wrong type or value"""
+
+    METHODS = {"validate": "_validate", "close": "_close", "stats": "_stats", "shutdown": "_shutdown"}
+
+    def __init__(self, validator: "iOSHIGValidator", stdin: IO[str] = None, stdout: IO[str] = None):
+        self.validator = validator
+        self.stdin = stdin or sys.stdin
+        self.stdout = stdout or sys.stdout
+        self.documents: Dict[Path, OpenDocument] = {}
+        self.requests = 0
+        self.validations = 0
+        self.running = False
+
+    def serve(self) -> int:
+        """Answer requests until shutdown or end of input."""
+        self.running = True
+        for line in self.stdin:
+            if not line.strip():
+                continue
+            self.stdout.write(json.dumps(self.handle_line(line), ensure_ascii=False) + "\n")
+            self.stdout.flush()
+            if not self.running:
+                break
+        return 0
+
+    def handle_line(self, line: str) -> Dict:
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return self._error(None, self.PARSE_ERROR, f"Invalid JSON: {e}")
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            request_id = request.get("id") if isinstance(request, dict) else None
+            return self._error(request_id, self.INVALID_REQUEST, "Expected an object with a method")
+        return self.handle(request)
+
+    def handle(self, request: Dict) -> Dict:
+        """Response to one request; never raises, so one bad request cannot stop the server."""
+        self.requests += 1
+        request_id = request.get("id")
+        handler = getattr(self, self.METHODS[request["method"]], None) if request["method"] in self.METHODS else None
+        if handler is None:
+            return self._error(request_id, self.METHOD_NOT_FOUND, f"Unknown method: {request['method']}")
+
+        params = request.get("params", {})
+        try:
+            if not isinstance(params, dict):
+                raise self.InvalidParams("params must be an object")
+            inspect.signature(handler).bind(**params)
+        except (TypeError, self.InvalidParams) as e:
+            return self._error(request_id, self.INVALID_PARAMS, f"Invalid params: {e}")
+
+        try:
+            return {"id": request_id, "result": handler(**params)}
+        except self.InvalidParams as e:
+            return self._error(request_id, self.INVALID_PARAMS, f"Invalid params: {e}")
+        except (OSError, UnicodeDecodeError) as e:
+            return self._error(request_id, self.INVALID_PARAMS, str(e))
+        except Exception as e:
+            return self._error(request_id, self.INTERNAL_ERROR, f"Internal error: {type(e).__name__}: {e}")
+
+    @staticmethod
+    def _error(request_id, code: int, message: str) -> Dict:
+        return {"id": request_id, "error": {"code": code, "message": message}}
+
+    def _validate(self, path: str, text: Optional[str] = None) -> Dict:
+        started = time.perf_counter()
+        if not isinstance(path, str) or not path:
+            raise self.InvalidParams("path must be a non-empty string")
+        if text is not None and not isinstance(text, str):
+            raise self.InvalidParams("text must be a string")
+        path = Path(path)
+        if text is None:
+            with open(path, encoding='utf-8', newline='') as f:
+                text = f.read()
+
+        content_hash = hashlib.md5(text.encode('utf-8')).hexdigest()
+        document = self.documents.get(path)
+        lexed = 0
+        cached = document is not None and document.content_hash == content_hash
+        if not cached:
+            lines = text.splitlines(keepends=True)
+            if document is None:
+                document = self.documents[path] = OpenDocument(path, TokenStream(lines))
+                lexed = len(lines)
+            else:
+                lexed = document.stream.update(lines)
+            source = SourceFile(path=path, lines=lines, stream=document.stream)
+            if self.validator.time_rules:
+                rule_stats = {}
+                document.issues = self.validator.validate_source(source, rule_stats=rule_stats)
+                self.validator.stats.add_rule_stats(path, rule_stats)
+            else:
+                document.issues = self.validator.validate_source(source)
+            document.content_hash = content_hash
+            self.validations += 1
+
+        return {
+            "issues": [issue.to_dict() for issue in document.issues],
+            "cached": cached,
+            "lexed": lexed,
+            "ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+
+    def _close(self, path: str) -> Dict:
+        if not isinstance(path, str):
+            raise self.InvalidParams("path must be a string")
+        return {"closed": self.documents.pop(Path(path), None) is not None}
+
+    def _stats(self) -> Dict:
+        stats = {"documents": len(self.documents), "requests": self.requests, "validations": self.validations}
+        if self.validator.time_rules:
+            stats["rules"] = {name: asdict(rule) for name, rule in self.validator.stats.rules.items()}
+            stats["rule_report"] = self.validator.stats.rule_report()
+        return stats
+
+    def _shutdown(self) -> Dict:
+        self.running = False
+        return {}
+
+
+class IssueWriter(abc.ABC):
+    """
+    Streams issues to a text stream as files are validated.
+
+    Nothing but the running IssueSummary is kept in memory, so output size
+    is not bounded by the number of issues.
+    """
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+        self.summary = IssueSummary()
+
+    def begin(self):
+        pass
+
+    def write(self, path: Path, issues: List[ComplianceIssue]):
+        """Write the issues of one file."""
+        self.summary.add(issues)
+        for issue in issues:
+            self.write_issue(path, issue)
+
+    @abc.abstractmethod
+    def write_issue(self, path: Path, issue: ComplianceIssue):
+        """Write a single issue of path."""
+
+    def end(self):
+        pass
+
+    @staticmethod
+    def relative(path: Path) -> Path:
+        """Path relative to the working directory if inside it (as CI annotations expect)."""
+        path = path.resolve()
+        try:
+            return path.relative_to(Path.cwd())
+        except ValueError:
+            return path
+
+
+class NDJSONWriter(IssueWriter):
+    """One JSON object per line: an "issue" record per issue, then a "summary" record."""
+
+    def write_issue(self, path, issue):
+        record = {"type": "issue", "file": self.relative(path).as_posix(), **issue.to_dict()}
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def end(self):
+        self.stream.write(json.dumps({"type": "summary", **self.summary.to_dict()}) + "\n")
+        self.stream.flush()
+
+
+class SARIFWriter(IssueWriter):
+    """
+    SARIF 2.1.0 log with one run.
+
+    Results are written as they arrive; the tool's rule descriptors and the
+    summary follow the results array, since they are only known at the end.
+    """
+
+    SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+    LEVELS = {ComplianceLevel.FAIL: "error", ComplianceLevel.WARNING: "warning", ComplianceLevel.PASS: "note"}
+
+    def __init__(self, stream: IO[str]):
+        super().__init__(stream)
+        self.rule_ids: Dict[str, str] = {}  # Rule name → id, in order of first use
+        self.written = 0
+
+    def begin(self):
+        self.stream.write(f'{{"version": "2.1.0", "$schema": "{self.SCHEMA}", "runs": [{{"results": [')
+
+    def write_issue(self, path, issue):
+        rule_id = self.rule_ids.setdefault(issue.rule, re.sub(r'[^a-z0-9]+', '-', issue.rule.lower()).strip('-'))
+        path = self.relative(path)
+        location = {"artifactLocation": {"uri": path.as_uri() if path.is_absolute() else path.as_posix()}}
+        if issue.line_number > 0:  # File-level issues have no region
+            location["region"] = {"startLine": issue.line_number, "snippet": {"text": issue.current_value}}
+        result = {
+            "ruleId": rule_id,
+            "ruleIndex": list(self.rule_ids).index(issue.rule),
+            "level": self.LEVELS[issue.level],
+            "message": {"text": f"{issue.description}. Recommended: {issue.recommended_value}"},
+            "locations": [{"physicalLocation": location}],
+            "properties": {"autoFixable": issue.auto_fixable},
+        }
+        self.stream.write(f"{',' if self.written else ''}\n{json.dumps(result, ensure_ascii=False)}")
+        self.written += 1
+
+    def end(self):
+        driver = {
+            "name": "validate-ios-compliance",
+            "rules": [
+                {"id": rule_id, "name": rule, "shortDescription": {"text": rule}}
+                for rule, rule_id in self.rule_ids.items()
+            ],
+        }
+        self.stream.write(
+            f'\n], "tool": {json.dumps({"driver": driver})}, '
+            f'"properties": {{"summary": {json.dumps(self.summary.to_dict())}}}}}]}}\n'
+        )
+        self.stream.flush()
+
+
+# Machine-readable --format choices
+OUTPUT_FORMATS = {"ndjson": NDJSONWriter, "sarif": SARIFWriter}
+
+
+def collect_swift_files(paths: List[Path]) -> List[Path]:
+    """
+    Expand files and directories into a sorted list of Swift files.
+
+    Hidden directories (.build, .git, ...) are skipped.
+    """
+    files = set()
+    for path in paths:
+        if path.is_dir():
+            files.update(
+                f for f in path.rglob("*.swift")
+                if not any(part.startswith('.') for part in f.relative_to(path).parts)
+            )
+        elif path.suffix == ".swift":
+            files.add(path)
+    return sorted(files)
+
+
+HUNK_HEADER = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+
+def git_changed_lines(repo_path: Path, revision: str) -> Dict[Path, List[Tuple[int, int]]]:
+    """
+    Swift files changed since a revision (including uncommitted edits) with
+    the line ranges of their added/modified hunks.
+
+    Args:
+        repo_path: Any path inside the git work tree
+        revision: Base revision (e.g., origin/main, HEAD~3)
+
+    Returns:
+        Dict mapping absolute file path to sorted inclusive (first, last) line ranges
+    """
+    def git(*args):
+        return subprocess.run(
+            ["git", "-c", "core.quotePath=false", *args],
+            cwd=repo_path if repo_path.is_dir() else repo_path.parent,
+            capture_output=True, text=True, check=True
+        ).stdout
+
+    toplevel = Path(git("rev-parse", "--show-toplevel").strip())
+    diff = git("diff", "-U0", "--no-color", "--no-ext-diff", "--diff-filter=ACMR", revision, "--", "*.swift")
+
+    changed: Dict[Path, List[Tuple[int, int]]] = {}
+    current = None
+    for line in diff.splitlines():
+        if line.startswith('+++ '):
+            current = toplevel / line[len('+++ b/'):] if line.startswith('+++ b/') else None
+        elif line.startswith('@@') and current is not None:
+            match = HUNK_HEADER.match(line)
+            if not match:
+                continue
+            start = int(match.group(1))
+            count = int(match.group(2)) if match.group(2) is not None else 1
+            if count:  # Pure deletions add no lines
+                changed.setdefault(current, []).append((start, start + count - 1))
+
+    return changed
+
+
+def filter_issues_to_ranges(issues: List[ComplianceIssue], ranges: List[Tuple[int, int]]) -> List[ComplianceIssue]:
+    """
+    Keep issues on lines inside the given sorted, non-overlapping ranges.
+
+    File-level issues (line 0) are dropped: they cannot be attributed to a change.
+    """
+    starts = [first for first, _ in ranges]
+    kept = []
+    for issue in issues:
+        position = bisect.bisect_right(starts, issue.line_number) - 1
+        if position >= 0 and issue.line_number <= ranges[position][1]:
+            kept.append(issue)
+    return kept
+
+
+def _profiled(stream, profile_file: Path):
+    """Run a result stream under cProfile and dump the profile when it is exhausted."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield from stream
+    finally:
+        profiler.disable()
+        profiler.dump_stats(str(profile_file))
+        print(f"📝 Profile saved to: {profile_file} (python3 -m pstats {profile_file})", file=sys.stderr)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate iOS HIG compliance for ElevateUI components"
@@ -319,7 +2025,8 @@ def main():
     parser.add_argument(
         "--fix",
         action="store_true",
-        help="Auto-fix issues where possible (not yet implemented)"
+        help="Apply auto-fixes (e.g. missing 44pt minimum frames) before validating; "
+             "with --changed-since only in changed lines"
     )
     parser.add_argument(
         "--output",
@@ -327,27 +2034,193 @@ def main():
         type=Path,
         help="Output report to file"
     )
+    parser.add_argument(
+        "--format",
+        choices=["text", *OUTPUT_FORMATS],
+        default="text",
+        help="Report format: human-readable text, or SARIF / NDJSON streamed as files are validated"
+    )
+    parser.add_argument(
+        "--paths",
+        nargs="+",
+        type=Path,
+        help="Validate these Swift files/directories instead of the ElevateUI components"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of files validated in parallel (0: one per CPU)"
+    )
+    parser.add_argument(
+        "--contrast",
+        action="store_true",
+        help="Check WCAG contrast of all text/fill design token pairs instead of Swift sources"
+    )
+    parser.add_argument(
+        "--tokens-path",
+        type=Path,
+        help="With --contrast: ELEVATE SCSS root (default: ELEVATE_TOKENS_PATH of the token generator)"
+    )
+    parser.add_argument(
+        "--min-contrast",
+        type=float,
+        default=ContrastEngine.MIN_TEXT_CONTRAST,
+        help="With --contrast: required ratio (default: 4.5, WCAG AA)"
+    )
+    parser.add_argument(
+        "--no-theme",
+        action="store_true",
+        help="With --contrast: ignore the .elevate-themes/ios overlay"
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REV",
+        help="Only validate Swift files changed since REV and report issues in changed lines"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Revalidate every file instead of reusing cached results"
+    )
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help="Serve validate requests as line-delimited JSON on stdin/stdout (for editors)"
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Report time, lines examined and issues per rule and the slowest files "
+             "(with --server: in the stats response)"
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="FILE",
+        help="Dump a cProfile profile of the validation run to FILE (use --jobs 1 to include rule code)"
+    )
 
     args = parser.parse_args()
+    if args.contrast and args.format != "text":
+        parser.error("--contrast writes a text report; --format sarif/ndjson only apply to Swift validation")
 
     elevate_ui_path = Path("/Users/wrede/Documents/GitHub/elevate-ios/ElevateUI")
-    validator = iOSHIGValidator(elevate_ui_path)
+    cache_dir = None if args.no_cache else Path.home() / ".elevate-cache"
+    cache_file = cache_dir / "hig-validation.json" if cache_dir else None
+    # Typography sizes are resolved once, when TypographyRule first needs them;
+    # worker processes receive the table with the rules
+    TypographyTable.configure(args.tokens_path, cache_dir / "typography-table.json" if cache_dir else None)
+    jobs = args.jobs or os.cpu_count() or 1
+
+    if args.server:
+        # The server keeps its own per-document results instead of the file cache
+        return ValidatorServer(iOSHIGValidator(elevate_ui_path, time_rules=args.stats)).serve()
+
+    # Machine-readable output owns stdout; progress goes to stderr
+    streaming = args.format != "text"
+    log = functools.partial(print, file=sys.stderr) if streaming else print
+
+    log("🔍 iOS HIG Compliance Validator")
+    log("=" * 50)
+    log()
+
+    if args.contrast:
+        tokens_path = args.tokens_path or load_token_generator().ELEVATE_TOKENS_PATH
+        if not tokens_path.exists():
+            print(f"❌ ELEVATE tokens path does not exist: {tokens_path}")
+            return 1
 
-    print("🔍 iOS HIG Compliance Validator")
-    print("=" * 50)
-    print()
+        started = time.perf_counter()
+        engine = ContrastEngine.from_scss(tokens_path, theme=not args.no_theme, minimum=args.min_contrast)
+        contrast_results = engine.evaluate()
+        pair_count = sum(len(pairs) for pairs in contrast_results.values())
+        print(f"⚡ Evaluated {pair_count} pairs in {time.perf_counter() - started:.2f}s "
+              f"({'NumPy' if np is not None else 'pure Python'})")
 
+        report = generate_contrast_report(contrast_results)
+        print(report)
+        if args.output:
+            args.output.write_text(report)
+            print(f"\n📝 Report saved to: {args.output}")
+        return 1 if any(not p.passes for pairs in contrast_results.values() for p in pairs) else 0
+
+    validator = iOSHIGValidator(elevate_ui_path, cache_file=cache_file, time_rules=args.stats)
+    changed = None
     if args.component:
         component_file = elevate_ui_path / "Sources" / "SwiftUI" / "Components" / f"Elevate{args.component}+SwiftUI.swift"
         if not component_file.exists():
-            print(f"❌ Component not found: {component_file}")
+            log(f"❌ Component not found: {component_file}")
+            return 1
+
+        swift_files = [component_file]
+        label = lambda path: args.component
+    elif args.changed_since:
+        roots = [path.resolve() for path in (args.paths or [elevate_ui_path])]
+        try:
+            changed = git_changed_lines(roots[0], args.changed_since)
+        except subprocess.CalledProcessError as e:
+            log(f"❌ git diff against {args.changed_since} failed: {e.stderr.strip()}")
             return 1
 
-        issues = validator.validate_component(component_file)
-        results = {args.component: issues} if issues else {}
+        swift_files = [
+            path for path in sorted(changed)
+            if path.exists() and any(root == path or root in path.parents for root in roots)
+        ]
+        label = str
+        log(f"Validating {len(swift_files)} Swift files changed since {args.changed_since}...")
+    elif args.paths:
+        swift_files = collect_swift_files(args.paths)
+        label = str
+        log(f"Validating {len(swift_files)} Swift files...")
     else:
-        print("Validating all components...")
-        results = validator.validate_all_components()
+        if not validator.components_dir.exists():
+            log(f"❌ Components directory not found: {validator.components_dir}")
+        swift_files = validator.component_files()
+        label = lambda path: path.stem
+        log("Validating all components...")
+
+    if args.fix:
+        fixes = validator.fix_files(swift_files, jobs, changed)
+        fixed_files = [fix for fix in fixes if fix.fixed]
+        log(f"🔧 Fixed {sum(fix.fixed for fix in fixes)} issues in {len(fixed_files)} files"
+            + (f" ({sum(fix.skipped for fix in fixes)} overlapping fixes skipped)" if any(fix.skipped for fix in fixes) else ""))
+        for fix in fixed_files:
+            log(f"   {fix.path}: {fix.fixed}")
+        log()
+
+    stream = validator.iter_files(swift_files, jobs)
+    if changed is not None:
+        stream = ((path, filter_issues_to_ranges(issues, changed[path])) for path, issues in stream)
+    if args.profile:
+        stream = _profiled(stream, args.profile)
+
+    if streaming:
+        output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+        try:
+            writer = OUTPUT_FORMATS[args.format](output)
+            writer.begin()
+            for path, issues in stream:
+                writer.write(path, issues)
+            writer.end()
+        finally:
+            if args.output:
+                output.close()
+        log(validator.stats)
+        if args.stats:
+            log(validator.stats.rule_report())
+        log(f"📊 {writer.summary.total} issues ({writer.summary.failures} failures, "
+            f"{writer.summary.warnings} warnings) in {writer.summary.files} files")
+        if args.output:
+            log(f"📝 {args.format.upper()} report saved to: {args.output}")
+        return 1 if writer.summary.failures else 0
+
+    results = {label(path): issues for path, issues in stream if issues}
+    if not args.component:
+        print(validator.stats)
+    if args.stats:
+        print(validator.stats.rule_report())
 
     report = validator.generate_report(results)
     print(report)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test suite for iOS adaptation template rendering
+
+Tests core functionality:
+- Rendering the knowledge base templates
+- Batch rendering with shared defaults
+- Compiled template cache keyed by template content
+"""
+
+import unittest
+import sys
+from pathlib import Path
+import tempfile
+import importlib.util
+import json
+import shutil
+
+if importlib.util.find_spec('jinja2') is None:
+    raise unittest.SkipTest('jinja2 is not installed')
+
+# Load the generator script as a module
+script_path = Path(__file__).parent.parent / 'scripts' / 'generate-ios-adaptation.py'
+spec = importlib.util.spec_from_file_location("generate_ios_adaptation", script_path)
+generator_module = importlib.util.module_from_spec(spec)
+sys.modules['generate_ios_adaptation'] = generator_module
+spec.loader.exec_module(generator_module)
+
+# Import required classes
+AdaptationRenderer = generator_module.AdaptationRenderer
+RenderJob = generator_module.RenderJob
+load_batch = generator_module.load_batch
+
+
+class TestAdaptationRenderer(unittest.TestCase):
+    """Test template rendering"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache_dir = self.temp_dir / 'cache'
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_touch_target_template(self):
+        """Test the 44pt frame is only added for small visual sizes"""
+        renderer = AdaptationRenderer(cache_dir=self.cache_dir)
+        small, large = renderer.render_batch([
+            RenderJob('touch-target-44pt', 'Chip', {'visual_size': {'width': 24, 'height': 24}, 'content_view': 'icon'}),
+            RenderJob('touch-target-44pt', 'Card', {'visual_size': {'width': 64, 'height': 64}, 'content_view': 'card'}),
+        ])
+
+        self.assertIn('.frame(minWidth: 44, minHeight: 44)', small.code)
+        self.assertNotIn('minWidth', large.code)
+        self.assertIn('    .accessibilityAddTraits(.isButton)\n', large.code)
+
+    def test_missing_input_is_reported(self):
+        """Test undefined template inputs fail the job instead of rendering blanks"""
+        renderer = AdaptationRenderer(cache_dir=self.cache_dir)
+        result = renderer.render(RenderJob('typography-ios-scaled', 'Chip', {}))
+
+        self.assertIsNone(result.code)
+        self.assertIn('base_size', result.error)
+
+    def test_compiled_templates_are_cached_by_content(self):
+        """Test a second renderer loads compiled templates without compiling"""
+        templates = self.temp_dir / 'templates'
+        templates.mkdir()
+        (templates / 'greeting.swift.jinja2').write_text('Text("{{ component_name }} {{ label }}")\n')
+
+        jobs = [RenderJob('greeting', f'Component{i}', {'label': 'hi'}) for i in range(20)]
+
+        first = AdaptationRenderer(templates, self.cache_dir)
+        compiled = []
+        original = first.env.compile
+        first.env.compile = lambda *args, **kwargs: compiled.append(args[1]) or original(*args, **kwargs)
+        results = first.render_batch(jobs)
+
+        self.assertEqual(compiled, ['greeting.swift.jinja2'])
+        self.assertEqual(results[3].code, 'Text("Component3 hi")\n')
+        self.assertEqual(len(list(self.cache_dir.glob('*.cache'))), 1)
+
+        second = AdaptationRenderer(templates, self.cache_dir)
+        second.env.compile = lambda *args, **kwargs: self.fail('template was recompiled')
+        self.assertEqual(second.render(jobs[0]).code, 'Text("Component0 hi")\n')
+
+        # Editing the template changes its key
+        (templates / 'greeting.swift.jinja2').write_text('Text("{{ label }}")\n')
+        third = AdaptationRenderer(templates, self.cache_dir)
+        self.assertEqual(third.render(jobs[0]).code, 'Text("hi")\n')
+        self.assertEqual(len(list(self.cache_dir.glob('*.cache'))), 2)
+
+    def test_load_batch_defaults(self):
+        """Test shared defaults are merged under each job's context"""
+        batch = self.temp_dir / 'batch.json'
+        batch.write_text(json.dumps({
+            'defaults': {'enable_haptics': True, 'state': 'fill'},
+            'jobs': [{'template': 'hover-to-press', 'component': 'Button', 'context': {'state': 'text'}}],
+        }))
+
+        jobs = load_batch(batch)
+
+        self.assertEqual(jobs[0].context, {'enable_haptics': True, 'state': 'text'})
+
+
+if __name__ == '__main__':
+    unittest.main()
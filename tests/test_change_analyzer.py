@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Test suite for the ELEVATE change analyzer
+
+Tests core functionality:
+- Two-version change reports
+- Multi-version change matrix
+- Reading versions straight from git objects
+- Streaming NDJSON report output
+- Light, dark and theme-merged diffing
+- Token → Swift call site index
+"""
+
+import unittest
+import sys
+from pathlib import Path
+import tempfile
+import importlib.util
+import io
+import json
+import shutil
+import subprocess
+
+# Load the analyzer script as a module
+script_path = Path(__file__).parent.parent / 'scripts' / 'analyze-elevate-changes.py'
+spec = importlib.util.spec_from_file_location("analyze_elevate_changes", script_path)
+analyzer_module = importlib.util.module_from_spec(spec)
+sys.modules['analyze_elevate_changes'] = analyzer_module
+spec.loader.exec_module(analyzer_module)
+
+# Import required classes
+ElevateChangeAnalyzer = analyzer_module.ElevateChangeAnalyzer
+ChangeType = analyzer_module.ChangeType
+GitObjectReader = analyzer_module.GitObjectReader
+NDJSONReportWriter = analyzer_module.NDJSONReportWriter
+SwiftUsageIndex = analyzer_module.SwiftUsageIndex
+
+
+def write_version(root: Path, version: str, light: str, components: dict) -> Path:
+    """Create a minimal ELEVATE SCSS tree for one version"""
+    version_path = root / version
+    (version_path / 'values').mkdir(parents=True)
+    (version_path / 'tokens' / 'component').mkdir(parents=True)
+    (version_path / 'values' / '_light.scss').write_text(light)
+    for name, content in components.items():
+        (version_path / 'tokens' / 'component' / f'_{name}.scss').write_text(content)
+    return version_path
+
+
+class TestVersionComparison(unittest.TestCase):
+    """Test two-version and multi-version comparisons"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.analyzer = ElevateChangeAnalyzer(self.temp_dir)
+        self.v1 = write_version(self.temp_dir, 'v1', '$color-a: #000;\n', {
+            'button': '$height-m: 2rem;\n',
+        })
+        self.v2 = write_version(self.temp_dir, 'v2', '$color-a: #111;\n', {
+            'button': '$height-m: 2rem;\n$gap-m: 0.5rem;\n',
+            'chip': '$height-m: 1.5rem;\n',
+        })
+        self.v3 = write_version(self.temp_dir, 'v3', '$color-a: #111;\n$color-b: #fff;\n', {
+            'chip': '$height-m: 1.5rem;\n',
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_generate_report(self):
+        """Test a two-version report covers light and component tokens"""
+        report = self.analyzer.generate_report('v1', 'v2', self.v1, self.v2)
+
+        self.assertEqual(len(report.token_changes), 1)
+        self.assertEqual(report.token_changes[0].change_type, ChangeType.MODIFIED_TOKEN)
+        self.assertEqual(report.new_components, ['_chip'])
+        self.assertEqual([c.component_name for c in report.component_changes], ['button'])
+
+    def test_matrix_report(self):
+        """Test consecutive pairs and the optional first-to-last span"""
+        matrix = self.analyzer.generate_matrix_report(
+            [('v1', self.v1), ('v2', self.v2), ('v3', self.v3)],
+            include_span=True
+        )
+
+        self.assertEqual(matrix.versions, ['v1', 'v2', 'v3'])
+        self.assertEqual(
+            [(r.from_version, r.to_version) for r in matrix.pair_reports],
+            [('v1', 'v2'), ('v2', 'v3')]
+        )
+        self.assertEqual(matrix.pair_reports[1].removed_components, ['_button'])
+        self.assertEqual((matrix.span_report.from_version, matrix.span_report.to_version), ('v1', 'v3'))
+
+    def test_matrix_parses_each_version_once(self):
+        """Test that parsed tables are shared between pairs"""
+        parsed_files = []
+        original = self.analyzer.parse_scss_tokens
+
+        def counting_parse(scss_file):
+            parsed_files.append(scss_file)
+            return original(scss_file)
+
+        self.analyzer.parse_scss_tokens = counting_parse
+        self.analyzer.generate_matrix_report(
+            [('v1', self.v1), ('v2', self.v2), ('v3', self.v3)],
+            include_span=True
+        )
+
+        self.assertEqual(len(parsed_files), len(set(parsed_files)))
+
+    def test_stream_report_matches_full_report(self):
+        """Test that NDJSON records and trailer agree with the in-memory report"""
+        old = self.analyzer.parse_version('v1', self.v1)
+        new = self.analyzer.parse_version('v2', self.v2)
+        report = self.analyzer.compare_versions(old, new)
+
+        stream = io.StringIO()
+        self.analyzer.stream_report(old, new, NDJSONReportWriter(stream))
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+
+        self.assertEqual(records[0]['record'], 'report')
+        self.assertEqual(
+            [r['record'] for r in records[1:-1]],
+            ['token_change', 'new_component', 'component_change']
+        )
+        summary = records[-1]
+        self.assertEqual(summary['record'], 'summary')
+        self.assertEqual(summary['token_changes'], len(report.token_changes))
+        self.assertEqual(summary['estimated_total_effort_minutes'], report.estimated_total_effort_minutes)
+        self.assertEqual(summary['automation_coverage_percent'], report.automation_coverage_percent)
+        self.assertEqual(summary['summary'], report.summary)
+
+    def test_every_record_is_flushed(self):
+        """Test a piped consumer receives each record as soon as it is written"""
+        class FlushRecorder(io.StringIO):
+            def __init__(self):
+                super().__init__()
+                self.flushed = []
+
+            def flush(self):
+                self.flushed.append(self.getvalue().count('\n'))
+
+        stream = FlushRecorder()
+        self.analyzer.stream_report(
+            self.analyzer.parse_version('v1', self.v1),
+            self.analyzer.parse_version('v2', self.v2),
+            NDJSONReportWriter(stream)
+        )
+
+        # Every record is flushed right after it is written
+        self.assertEqual(stream.flushed, [1, 2, 3, 4, 5])
+
+    def test_mode_aware_token_changes(self):
+        """Test that each change reports the light/dark/theme modes it affects"""
+        (self.v1 / 'values' / '_dark.scss').write_text('$color-a: #fff;\n$color-c: #222;\n')
+        (self.v2 / 'values' / '_dark.scss').write_text('$color-a: #fff;\n$color-c: #333;\n')
+        theme_dir = self.temp_dir / 'theme'
+        theme_dir.mkdir()
+        (theme_dir / 'primitives.css').write_text('$color-c: #999;\n')
+        theme = self.analyzer.parse_theme_overlay(theme_dir)
+
+        report = self.analyzer.compare_versions(
+            self.analyzer.parse_version('v1', self.v1, theme),
+            self.analyzer.parse_version('v2', self.v2, theme)
+        )
+        modes = {change.token_name: change.modes for change in report.token_changes}
+
+        # Light-only change is also visible in the theme-merged light view
+        self.assertEqual(modes['color-a'], ['light', 'theme-light'])
+        # Dark change is masked by the iOS theme primitive override
+        self.assertEqual(modes['color-c'], ['dark'])
+
+    def test_matrix_requires_two_versions(self):
+        """Test that a single version is rejected"""
+        with self.assertRaises(ValueError):
+            self.analyzer.generate_matrix_report([('v1', self.v1)])
+
+
+class TestSwiftUsageIndex(unittest.TestCase):
+    """Test the token → Swift call site index"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.sources = self.temp_dir / 'Sources'
+        (self.sources / 'SwiftUI').mkdir(parents=True)
+        (self.sources / 'Generated').mkdir(parents=True)
+        self.button_file = self.sources / 'SwiftUI' / 'ElevateButton+SwiftUI.swift'
+        self.button_file.write_text(
+            'struct ElevateButton: View {\n'
+            '    let gap = ButtonComponentTokens.gap_m\n'
+            '    let height = ButtonComponentTokens.height_m\n'
+            '    let fill = ElevateAliases.Action.StrongPrimary.fill_default\n'
+            '    let padding = ButtonComponentTokens.gap_m * 2\n'
+            '}\n'
+        )
+        (self.sources / 'Generated' / 'ButtonComponentTokens.swift').write_text(
+            'public static let gap_m = ElevateAliases.Action.StrongPrimary.fill_default\n'
+        )
+        self.cache_file = self.temp_dir / 'index.json'
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_lookup(self):
+        """Test references are indexed per line, skipping generated files"""
+        index = SwiftUsageIndex(self.sources, self.cache_file).build()
+
+        self.assertEqual(
+            index.lookup(['ButtonComponentTokens.gap_m']),
+            ['ElevateButton+SwiftUI.swift:2', 'ElevateButton+SwiftUI.swift:5']
+        )
+        self.assertEqual(
+            index.lookup(['ElevateAliases.Action.StrongPrimary.fill_default']),
+            ['ElevateButton+SwiftUI.swift:4']
+        )
+
+    def test_cache_by_file_hash(self):
+        """Test unchanged files are served from the cache and edits are rescanned"""
+        SwiftUsageIndex(self.sources, self.cache_file).build()
+
+        cached = SwiftUsageIndex(self.sources, self.cache_file).build()
+        self.assertEqual((cached.files_scanned, cached.files_cached), (0, 1))
+
+        self.button_file.write_text('let gap = ButtonComponentTokens.gap_m\n')
+        rescanned = SwiftUsageIndex(self.sources, self.cache_file).build()
+        self.assertEqual(rescanned.files_scanned, 1)
+        self.assertEqual(rescanned.lookup(['ButtonComponentTokens.height_m']), [])
+
+    def test_component_changes_report_call_sites(self):
+        """Test component token changes carry call sites and usage-based effort"""
+        index = SwiftUsageIndex(self.sources, self.cache_file).build()
+        analyzer = ElevateChangeAnalyzer(self.temp_dir, usage_index=index)
+
+        _, _, extended = analyzer._diff_component_tables(
+            {'_button': {'gap-m': '0.5rem', 'height-m': '2rem'}},
+            {'_button': {'gap-m': '0.75rem'}}
+        )
+        changes = {c.token_name: c for c in extended[0].token_changes}
+
+        self.assertEqual(len(changes['gap-m'].call_sites), 2)
+        self.assertEqual(changes['height-m'].call_sites, ['ElevateButton+SwiftUI.swift:3'])
+        # 2 call sites to re-check + 1 removed call site to migrate (5 min)
+        self.assertEqual(extended[0].estimated_effort_minutes, 2 + 5)
+
+
+class TestGitVersions(unittest.TestCase):
+    """Test comparing git revisions without checking them out"""
+
+    def setUp(self):
+        self.repo = Path(tempfile.mkdtemp())
+        self.git('init', '-q')
+        self.commit_version('v1', '$color-a: #000;\n', {'button': '$height-m: 2rem;\n', 'chip': '$gap: 1px;\n'})
+        self.commit_version('v2', '$color-a: #000;\n', {'button': '$height-m: 3rem;\n', 'chip': '$gap: 1px;\n'})
+        self.commit_version('v3', '$color-a: #fff;\n', {'button': '$height-m: 3rem;\n', 'chip': '$gap: 1px;\n'})
+        self.analyzer = ElevateChangeAnalyzer(self.repo)
+        self.reader = GitObjectReader(self.repo)
+
+    def tearDown(self):
+        self.reader.close()
+        shutil.rmtree(self.repo, ignore_errors=True)
+
+    def git(self, *args):
+        subprocess.run(
+            ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+            cwd=self.repo, check=True, capture_output=True
+        )
+
+    def commit_version(self, tag, light, components):
+        scss = self.repo / 'src' / 'scss'
+        (scss / 'values').mkdir(parents=True, exist_ok=True)
+        (scss / 'tokens' / 'component').mkdir(parents=True, exist_ok=True)
+        (scss / 'values' / '_light.scss').write_text(light)
+        for name, content in components.items():
+            (scss / 'tokens' / 'component' / f'_{name}.scss').write_text(content)
+        self.git('add', '-A')
+        self.git('commit', '-q', '-m', tag)
+        self.git('tag', tag)
+
+    def test_read_tree_and_missing_objects(self):
+        """Test tree listing and missing revisions through cat-file"""
+        tree = self.reader.read_tree('v1:src/scss/tokens/component')
+        self.assertIsNotNone(tree)
+        self.assertEqual(sorted(tree[1]), ['_button.scss', '_chip.scss'])
+        self.assertIsNone(self.reader.read_object('v9:src/scss/values/_light.scss'))
+
+    def test_unknown_revision_raises(self):
+        """Test a mistyped tag fails instead of parsing as empty token tables"""
+        self.assertIsNotNone(self.reader.resolve_commit('v1'))
+        self.assertIsNone(self.reader.resolve_commit('v9'))
+        with self.assertRaises(ValueError):
+            self.analyzer.parse_git_version(self.reader, 'v9')
+
+    def test_non_git_directory(self):
+        """Test a reader on a directory outside any git repository"""
+        plain_dir = Path(tempfile.mkdtemp())
+        try:
+            with GitObjectReader(plain_dir) as reader:
+                reader._process.wait()
+                self.assertIsNone(reader.resolve_commit('HEAD'))
+        finally:
+            shutil.rmtree(plain_dir, ignore_errors=True)
+
+    def test_git_report(self):
+        """Test a report built from git revisions"""
+        report = self.analyzer.compare_versions(
+            self.analyzer.parse_git_version(self.reader, 'v1'),
+            self.analyzer.parse_git_version(self.reader, 'v2')
+        )
+
+        self.assertEqual(report.token_changes, [])
+        self.assertEqual([c.component_name for c in report.component_changes], ['button'])
+
+    def test_unchanged_objects_are_shared(self):
+        """Test that identical blobs and trees are parsed once and shared"""
+        v1 = self.analyzer.parse_git_version(self.reader, 'v1')
+        v2 = self.analyzer.parse_git_version(self.reader, 'v2')
+        v3 = self.analyzer.parse_git_version(self.reader, 'v3')
+
+        self.assertIs(v1.light_tokens, v2.light_tokens)
+        self.assertIs(v1.component_tokens['_chip'], v2.component_tokens['_chip'])
+        self.assertIs(v2.component_tokens, v3.component_tokens)
+
+    def test_concurrent_revisions_share_objects(self):
+        """Test revisions parsed on a thread pool still share identical objects"""
+        parsed = []
+        original = self.analyzer.parse_scss_content
+        self.analyzer.parse_scss_content = lambda content: parsed.append(content) or original(content)
+
+        v1, v2 = self.analyzer.parse_git_versions(self.reader, ['v1', 'v2'], max_workers=2)
+
+        self.assertIs(v1.light_tokens, v2.light_tokens)
+        self.assertIs(v1.component_tokens['_chip'], v2.component_tokens['_chip'])
+        self.assertEqual(len(parsed), 4)  # light, button v1/v2, chip
+
+    def test_git_matrix_report(self):
+        """Test the version matrix over git revisions"""
+        matrix = self.analyzer.generate_git_matrix_report(self.reader, ['v1', 'v2', 'v3'])
+
+        self.assertEqual(len(matrix.pair_reports[0].component_changes), 1)
+        self.assertEqual(len(matrix.pair_reports[1].token_changes), 1)
+        self.assertEqual(matrix.pair_reports[1].component_changes, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,1009 @@
+#!/usr/bin/env python3
+"""
+Test suite for the iOS HIG compliance validator
+
+Tests core functionality:
+- Single-pass rule engine
+- Touch target, typography, color and accessibility rules
+- Line index window queries
+- Parallel validation with deterministic merge
+- Persisted result cache
+- Changed-lines filtering against a git revision
+- Streaming SARIF / NDJSON output
+- Per-rule timing
+- Swift lexer and incremental token streams
+- Batched auto-fixes
+- Line-delimited JSON server mode
+- WCAG contrast of design token pairs
+- Symbolic typography sizes resolved from tokens
+"""
+
+import unittest
+import sys
+from pathlib import Path
+import tempfile
+import importlib.util
+import shutil
+import subprocess
+import io
+import json
+import pickle
+import pstats
+
+# Load the validator script as a module
+script_path = Path(__file__).parent.parent / 'scripts' / 'validate-ios-compliance.py'
+spec = importlib.util.spec_from_file_location("validate_ios_compliance", script_path)
+validator_module = importlib.util.module_from_spec(spec)
+sys.modules['validate_ios_compliance'] = validator_module
+spec.loader.exec_module(validator_module)
+
+# Import required classes
+iOSHIGValidator = validator_module.iOSHIGValidator
+ValidationRule = validator_module.ValidationRule
+ComplianceIssue = validator_module.ComplianceIssue
+ComplianceLevel = validator_module.ComplianceLevel
+SourceFile = validator_module.SourceFile
+LineIndex = validator_module.LineIndex
+collect_swift_files = validator_module.collect_swift_files
+git_changed_lines = validator_module.git_changed_lines
+filter_issues_to_ranges = validator_module.filter_issues_to_ranges
+ContrastEngine = validator_module.ContrastEngine
+TypographyTable = validator_module.TypographyTable
+TypographyRule = validator_module.TypographyRule
+NDJSONWriter = validator_module.NDJSONWriter
+SARIFWriter = validator_module.SARIFWriter
+SwiftLexer = validator_module.SwiftLexer
+TokenStream = validator_module.TokenStream
+TextEdit = validator_module.TextEdit
+apply_edits = validator_module.apply_edits
+ValidatorServer = validator_module.ValidatorServer
+
+SAMPLE_COMPONENT = '''import SwiftUI
+
+struct ElevateSample: View {
+    var body: some View {
+        Button(action: {}) {
+            Image(systemName: "xmark")
+        }
+        .frame(width: 24, height: 24)
+        Text("Body")
+            .font(Font.custom("Inter", size: 14)) // body
+        Text("Tiny")
+            .font(.system(size: 9))
+            .foregroundColor(Color(red: 1, green: 0, blue: 0))
+        Toggle("On", isOn: .constant(true))
+            .frame(minWidth: 44, minHeight: 44)
+    }
+}
+'''
+
+
+class ValidatorTestCase(unittest.TestCase):
+    """Temporary ElevateUI tree with one component"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.components = self.temp_dir / 'Sources' / 'SwiftUI' / 'Components'
+        self.components.mkdir(parents=True)
+        self.component_file = self.components / 'ElevateSample+SwiftUI.swift'
+        self.component_file.write_text(SAMPLE_COMPONENT)
+        self.validator = iOSHIGValidator(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+class TestRuleEngine(ValidatorTestCase):
+    """Test the single-pass rule engine"""
+
+    def test_file_is_read_once(self):
+        """Test all rules share one read of the file"""
+        reads = []
+        original = SourceFile.read.__func__
+        SourceFile.read = classmethod(lambda cls, path: reads.append(path) or original(cls, path))
+        self.addCleanup(setattr, SourceFile, 'read', classmethod(original))
+
+        issues = self.validator.validate_component(self.component_file)
+
+        self.assertEqual(reads, [self.component_file])
+        self.assertEqual(
+            sorted((i.line_number, i.rule) for i in issues),
+            [
+                (0, 'Color Token Usage'),
+                (5, 'HIG Touch Target Size'),
+                (6, 'Accessibility Label'),
+                (8, 'HIG Touch Target Size'),
+                (10, 'HIG Typography - Body Text'),
+                (12, 'Typography Token Usage'),
+            ]
+        )
+
+    def test_custom_rule(self):
+        """Test registered rules only see lines containing their triggers"""
+        seen = []
+
+        class TodoRule(ValidationRule):
+            name = 'todo'
+            triggers = ('Text(',)
+
+            def check_line(self, source, i, line):
+                seen.append(i)
+                return [ComplianceIssue(source.path, i, 'Todo', ComplianceLevel.WARNING, '', line.strip(), '')]
+
+        validator = iOSHIGValidator(self.temp_dir, rules=[TodoRule()])
+        issues = validator.validate_component(self.component_file)
+
+        self.assertEqual(seen, [9, 11])
+        self.assertEqual([i.rule for i in issues], ['Todo', 'Todo'])
+
+    def test_single_rule_entry_points(self):
+        """Test the per-rule methods only report their own rule"""
+        self.assertEqual(
+            {i.rule for i in self.validator.validate_typography(self.component_file)},
+            {'HIG Typography - Body Text', 'Typography Token Usage'}
+        )
+        self.assertEqual(
+            [i.line_number for i in self.validator.validate_color_contrast(self.component_file)],
+            [0]
+        )
+
+    def test_validate_all_components(self):
+        """Test components are keyed by file stem"""
+        results = self.validator.validate_all_components()
+        self.assertEqual(list(results), ['ElevateSample+SwiftUI'])
+
+
+class TestLineIndex(ValidatorTestCase):
+    """Test window queries on the per-file line index"""
+
+    def test_any_between(self):
+        """Test inclusive window bounds"""
+        index = LineIndex(('minWidth',))
+        for i, line in enumerate(['Button', 'x', 'x', 'x', 'x', '.frame(minWidth: 44)'], 1):
+            index.add(i, line)
+
+        self.assertTrue(index.any_between('minWidth', 2, 6))
+        self.assertTrue(index.any_between('minWidth', 6, 6))
+        self.assertFalse(index.any_between('minWidth', 1, 5))
+        self.assertFalse(index.any_between('minWidth', 7, 12))
+
+    def test_look_ahead_window(self):
+        """Test minWidth five lines below an interactive element still counts"""
+        self.component_file.write_text(
+            'Button("a") {}\n' + 'x\n' * 4 + '.frame(minWidth: 44)\n'
+            'Button("b") {}\n' + 'x\n' * 5 + '.frame(minWidth: 44)\n'
+        )
+
+        warnings = [i.line_number for i in self.validator.validate_touch_targets(self.component_file)]
+
+        self.assertEqual(warnings, [7])
+
+    def test_label_window(self):
+        """Test accessibilityLabel within four lines above an icon counts"""
+        self.component_file.write_text(
+            '.accessibilityLabel("Close")\n' + 'x\n' * 3 + 'Button { Image("a") }\n' + 'x\n' * 6
+            + 'Button { Image("b") }\n'
+        )
+
+        warnings = [i.line_number for i in self.validator.validate_accessibility(self.component_file)]
+
+        self.assertEqual(warnings, [12])
+
+
+class TestParallelValidation(ValidatorTestCase):
+    """Test process pool validation"""
+
+    def setUp(self):
+        super().setUp()
+        for i in range(12):
+            (self.components / f'ElevateItem{i:02d}+SwiftUI.swift').write_text(
+                SAMPLE_COMPONENT.replace('ElevateSample', f'ElevateItem{i:02d}') + '\n' * i
+            )
+
+    def test_jobs_produce_identical_results(self):
+        """Test results and their order do not depend on the number of jobs"""
+        key = lambda results: [
+            (name, [(i.line_number, i.rule, i.current_value) for i in issues])
+            for name, issues in results.items()
+        ]
+
+        serial = self.validator.validate_all_components(jobs=1)
+        parallel = self.validator.validate_all_components(jobs=4)
+
+        self.assertEqual(key(parallel), key(serial))
+        self.assertEqual(list(parallel), sorted(parallel))
+        self.assertEqual(self.validator.stats.files, 13)
+        self.assertEqual(self.validator.stats.jobs, 4)
+        self.assertEqual(self.validator.stats.issues, sum(len(v) for v in parallel.values()))
+
+    def test_collect_swift_files(self):
+        """Test directories are expanded recursively without hidden directories"""
+        (self.temp_dir / '.build').mkdir()
+        (self.temp_dir / '.build' / 'Generated.swift').write_text('')
+        (self.temp_dir / 'README.md').write_text('')
+
+        files = collect_swift_files([self.temp_dir, self.component_file])
+
+        self.assertEqual(len(files), 13)
+        self.assertTrue(all(f.suffix == '.swift' and '.build' not in f.parts for f in files))
+
+
+class TestValidationCache(ValidatorTestCase):
+    """Test the persisted per-file result cache"""
+
+    def setUp(self):
+        super().setUp()
+        self.cache_file = self.temp_dir / 'cache' / 'hig-validation.json'
+
+    def validate(self, rules=None):
+        validator = iOSHIGValidator(self.temp_dir, rules=rules, cache_file=self.cache_file)
+        results = validator.validate_files([self.component_file])
+        return validator.stats.cached, results[self.component_file]
+
+    def test_unchanged_file_is_served_from_cache(self):
+        """Test cached issues round-trip unchanged"""
+        cached, first = self.validate()
+        self.assertEqual(cached, 0)
+
+        cached, second = self.validate()
+        self.assertEqual(cached, 1)
+        self.assertEqual(second, first)
+
+    def test_edited_file_is_revalidated(self):
+        """Test a content change misses the cache"""
+        self.validate()
+        self.component_file.write_text(SAMPLE_COMPONENT.replace('size: 14', 'size: 18'))
+
+        cached, issues = self.validate()
+
+        self.assertEqual(cached, 0)
+        self.assertNotIn('HIG Typography - Body Text', {i.rule for i in issues})
+
+    def test_interrupted_save_keeps_previous_cache(self):
+        """Test the cache is replaced atomically, never left truncated"""
+        self.validate()
+        before = self.cache_file.read_text()
+        self.component_file.write_text(SAMPLE_COMPONENT.replace('size: 14', 'size: 18'))
+
+        original = validator_module.os.replace
+        def interrupted(*args):
+            raise KeyboardInterrupt
+        validator_module.os.replace = interrupted
+        try:
+            with self.assertRaises(KeyboardInterrupt):
+                self.validate()
+        finally:
+            validator_module.os.replace = original
+
+        self.assertEqual(self.cache_file.read_text(), before)
+        self.assertEqual(list(self.cache_file.parent.glob('*.tmp')), [])
+        self.component_file.write_text(SAMPLE_COMPONENT)
+        self.assertEqual(self.validate()[0], 1)  # Previous results are still served
+
+    def test_rule_change_invalidates_cache(self):
+        """Test a different rule set or rule version discards cached results"""
+        self.validate()
+
+        class BumpedTypographyRule(validator_module.TypographyRule):
+            version = '2'
+
+        cached, issues = self.validate(rules=[BumpedTypographyRule()])
+
+        self.assertEqual(cached, 0)
+        self.assertEqual({i.rule for i in issues}, {'HIG Typography - Body Text', 'Typography Token Usage'})
+
+
+class TestChangedSince(ValidatorTestCase):
+    """Test --changed-since hunk filtering"""
+
+    def setUp(self):
+        super().setUp()
+        self.git('init', '-q')
+        self.git('add', '-A')
+        self.git('commit', '-q', '-m', 'Add sample')
+        self.base = self.git('rev-parse', 'HEAD').strip()
+
+    def git(self, *args):
+        return subprocess.run(
+            ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+            cwd=self.temp_dir, check=True, capture_output=True, text=True
+        ).stdout
+
+    def test_changed_lines(self):
+        """Test committed and uncommitted hunks are reported; deletions are not"""
+        lines = SAMPLE_COMPONENT.splitlines(keepends=True)
+        lines[9] = '            .font(Font.custom("Inter", size: 12)) // body\n'
+        del lines[12]
+        self.component_file.write_text(''.join(lines))
+        self.git('commit', '-q', '-am', 'Shrink body font')
+        (self.components / 'ElevateNew+SwiftUI.swift').write_text('Button("x") {}\n')
+        self.git('add', '-A')
+
+        changed = git_changed_lines(self.temp_dir, self.base)
+
+        self.assertEqual(changed, {
+            self.component_file.resolve(): [(10, 10)],
+            (self.components / 'ElevateNew+SwiftUI.swift').resolve(): [(1, 1)],
+        })
+
+    def test_issues_filtered_to_hunks(self):
+        """Test only issues on changed lines survive"""
+        issues = self.validator.validate_component(self.component_file)
+
+        kept = filter_issues_to_ranges(issues, [(1, 5), (10, 11)])
+
+        self.assertEqual(
+            sorted((i.line_number, i.rule) for i in kept),
+            [(5, 'HIG Touch Target Size'), (10, 'HIG Typography - Body Text')]
+        )
+
+    def test_cli(self):
+        """Test the CLI validates only changed files and lines"""
+        self.component_file.write_text(SAMPLE_COMPONENT.replace('size: 9', 'size: 8'))
+
+        output = subprocess.run(
+            [sys.executable, str(script_path), '--paths', str(self.temp_dir),
+             '--changed-since', 'HEAD', '--no-cache'],
+            capture_output=True, text=True
+        ).stdout
+
+        self.assertIn('Validating 1 Swift files changed since HEAD', output)
+        self.assertIn('Total Issues: 1', output)
+        self.assertIn(':12 - Using hardcoded system font', output)
+
+
+class TestStreamingOutput(ValidatorTestCase):
+    """Test machine-readable writers fed file by file"""
+
+    def write(self, writer_type):
+        stream = io.StringIO()
+        writer = writer_type(stream)
+        writer.begin()
+        for path, issues in self.validator.iter_files([self.component_file, self.component_file]):
+            writer.write(path, issues)
+        writer.end()
+        return writer, stream.getvalue()
+
+    def test_iter_files_streams_results(self):
+        """Test each file's result is yielded before the next file is validated"""
+        second = self.components / 'ElevateOther+SwiftUI.swift'
+        second.write_text(SAMPLE_COMPONENT)
+        validated = []
+        original = self.validator._validate_counting
+        self.validator._validate_counting = lambda path: validated.append(path) or original(path)
+
+        stream = self.validator.iter_files([self.component_file, second])
+        path, issues = next(stream)
+
+        self.assertEqual((path, validated), (self.component_file, [self.component_file]))
+        self.assertEqual(self.validator.stats.issues, len(issues))
+        self.assertEqual([p for p, _ in stream], [second])
+        self.assertEqual(self.validator.stats.files, 2)
+
+    def test_ndjson(self):
+        """Test one record per issue followed by a summary from the counters"""
+        writer, output = self.write(NDJSONWriter)
+        records = [json.loads(line) for line in output.splitlines()]
+        issues = self.validator.validate_component(self.component_file)
+
+        self.assertEqual(len(records), 2 * len(issues) + 1)
+        self.assertEqual(records[0]['type'], 'issue')
+        self.assertEqual(records[0]['line_number'], issues[0].line_number)
+        self.assertTrue(records[0]['file'].endswith('ElevateSample+SwiftUI.swift'))
+        self.assertEqual(records[-1], {'type': 'summary', **writer.summary.to_dict()})
+        self.assertEqual(records[-1]['total'], 2 * len(issues))
+        self.assertEqual(records[-1]['files'], 2)
+
+    def test_sarif(self):
+        """Test the streamed SARIF log is valid JSON with rules and locations"""
+        writer, output = self.write(SARIFWriter)
+        run = json.loads(output)['runs'][0]
+        rules = run['tool']['driver']['rules']
+
+        self.assertEqual(len(run['results']), writer.summary.total)
+        self.assertEqual(len(rules), len(writer.summary.rules))
+        for result in run['results']:
+            self.assertEqual(rules[result['ruleIndex']]['id'], result['ruleId'])
+            self.assertIn(result['level'], ('error', 'warning'))
+
+        color = next(r for r in run['results'] if r['ruleId'] == 'color-token-usage')
+        self.assertNotIn('region', color['locations'][0]['physicalLocation'])
+        body = next(r for r in run['results'] if r['ruleId'] == 'hig-typography-body-text')
+        self.assertEqual(body['locations'][0]['physicalLocation']['region']['startLine'], 10)
+
+    def test_cli(self):
+        """Test SARIF goes to stdout and progress to stderr"""
+        result = subprocess.run(
+            [sys.executable, str(script_path), '--paths', str(self.temp_dir), '--format', 'sarif', '--no-cache'],
+            capture_output=True, text=True
+        )
+
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(json.loads(result.stdout)['version'], '2.1.0')
+        self.assertIn('Validating 1 Swift files', result.stderr)
+
+
+class TestRuleStats(ValidatorTestCase):
+    """Test per-rule and per-file timing"""
+
+    def test_rule_stats_match_issues(self):
+        """Test timing does not change results and counts what each rule did"""
+        plain = self.validator.validate_component(self.component_file)
+        rule_stats = {}
+        timed = self.validator.validate_source(SourceFile.read(self.component_file), rule_stats=rule_stats)
+
+        self.assertEqual([(i.line_number, i.rule) for i in timed], [(i.line_number, i.rule) for i in plain])
+        self.assertEqual(set(rule_stats), {'touch-targets', 'typography', 'color-contrast', 'accessibility'})
+        self.assertEqual(sum(stats.issues for stats in rule_stats.values()), len(plain))
+        self.assertEqual(rule_stats['typography'].lines, 2)  # Font.custom and .font(.system(size:
+        self.assertEqual(rule_stats['typography'].issues, 2)
+        self.assertTrue(all(stats.seconds > 0 for stats in rule_stats.values()))
+
+    def test_stats_collected_from_workers(self):
+        """Test worker processes report their rule timing per file"""
+        other = self.components / 'ElevateOther+SwiftUI.swift'
+        other.write_text(SAMPLE_COMPONENT)
+        validator = iOSHIGValidator(self.temp_dir, time_rules=True)
+
+        results = validator.validate_files([self.component_file, other], jobs=2)
+        stats = validator.stats
+
+        self.assertEqual(set(stats.file_rules), {self.component_file, other})
+        self.assertEqual(sum(rule.issues for rule in stats.rules.values()), sum(map(len, results.values())))
+        self.assertEqual(stats.rules['typography'].lines, 4)
+        report = stats.rule_report()
+        self.assertIn('touch-targets', report)
+        self.assertIn('ElevateOther+SwiftUI.swift', report)
+
+    def test_cli_profile(self):
+        """Test --stats prints the rule table and --profile dumps a loadable profile"""
+        profile = self.temp_dir / 'hig.prof'
+        output = subprocess.run(
+            [sys.executable, str(script_path), '--paths', str(self.temp_dir), '--no-cache',
+             '--stats', '--profile', str(profile)],
+            capture_output=True, text=True
+        ).stdout
+
+        self.assertIn('📊 Rule timing (1 files timed', output)
+        functions = {name for _, _, name in pstats.Stats(str(profile)).stats}
+        self.assertIn('check_line', functions)
+
+
+class TestSwiftLexer(ValidatorTestCase):
+    """Test comment/string-aware lexing and rule false positives"""
+
+    def test_lex_line(self):
+        """Test comments and string contents are blanked without moving columns"""
+        line = 'Button("Close // x") { Icon() } // Button'
+        tokens, code, state = SwiftLexer().lex_line(line)
+
+        self.assertEqual(code, 'Button("' + ' ' * 10 + '") { Icon() }' + ' ' * 10)
+        self.assertEqual(len(code), len(line))
+        self.assertEqual(state, SwiftLexer.INITIAL)
+        self.assertEqual([t.kind for t in tokens[:3]], ['identifier', 'punct', 'string'])
+        self.assertEqual(tokens[-1], validator_module.Token('comment', '// Button', 32))
+
+    def test_multiline_state(self):
+        """Test nested block comments and multi-line strings carry across lines"""
+        stream = TokenStream([
+            'let a = 1 /* Button /* nested */\n',
+            'still Button */ let b = Toggle()\n',
+            'let s = """\n',
+            'Picker(\n',
+            '"""; Picker("x")\n',
+        ])
+
+        self.assertEqual(stream.line_identifiers(0), {'let', 'a'})
+        self.assertEqual(stream.line_identifiers(1), {'let', 'b', 'Toggle'})
+        self.assertEqual(stream.line_identifiers(3), frozenset())
+        self.assertEqual(stream.line_calls(4), ('Picker',))
+        self.assertEqual(stream.states[1], (1, False))
+        self.assertEqual(stream.states[3], (0, True))
+        self.assertEqual(stream.find_identifiers(1, ('Button', 'Toggle')), {'Toggle'})
+
+    def test_incremental_update(self):
+        """Test only edited lines are re-lexed unless the lexing state changes"""
+        lines = [f'let value{i} = Button("{i}")\n' for i in range(50)]
+        stream = TokenStream(lines)
+
+        edited = list(lines)
+        edited[10] = 'let value10 = Toggle("10")\n'
+        self.assertEqual(stream.update(edited), 1)
+        self.assertEqual(stream.line_identifiers(10), {'let', 'value10', 'Toggle'})
+
+        # Opening a block comment changes the state of every following line
+        commented = list(edited)
+        commented[20] = '/*\n'
+        self.assertEqual(stream.update(commented), 30)
+        self.assertEqual(stream.line_identifiers(30), frozenset())
+        self.assertEqual(stream.update(edited), 30)
+
+        # Inserted lines shift the unchanged tail, which is reused
+        inserted = edited[:5] + ['// note\n'] + edited[5:]
+        self.assertEqual(stream.update(inserted), 1)
+        fresh = TokenStream(inserted)
+        self.assertEqual(stream.code, fresh.code)
+        self.assertEqual(stream.states, fresh.states)
+
+    def test_false_positives_removed(self):
+        """Test identifiers containing Button, comments and strings do not trigger rules"""
+        self.component_file.write_text(
+            'let shape: ButtonTokens.Shape = .default\n'
+            '// MARK: - Scroll-to-Top Button\n'
+            'Text("Button").frame(width: 20) // .frame(width: 10)\n'
+            'ElevateIconButton(icon: "x") { Image("a") }\n'
+            'Button(action: {}) { Text("Go") }\n'
+        )
+
+        issues = self.validator.validate_component(self.component_file)
+
+        self.assertEqual(
+            [(i.line_number, i.description) for i in issues],
+            [
+                (3, 'Touch target too small (20.0pt < 44pt minimum)'),
+                (5, 'Interactive element may not have 44pt minimum touch target'),
+                (4, 'Icon button missing .accessibilityLabel()'),
+            ]
+        )
+
+
+FIXABLE_COMPONENT = '''struct ElevateFixable: View {
+    var body: some View {
+        VStack {
+            Toggle("On", isOn: $isOn).tint(.blue) // inline
+            Button(action: {
+                save()
+            }) {
+                Text("Save")
+            }
+            .buttonStyle(.plain)
+            Button { close() } label: {
+                Image(systemName: "xmark")
+            }
+            .padding()
+            .frame(minWidth: 44, minHeight: 44)
+        }
+    }
+}
+
+extension Button {
+}
+'''
+
+
+class TestAutoFix(ValidatorTestCase):
+    """Test collecting fixes and applying them in one rewrite per file"""
+
+    def setUp(self):
+        super().setUp()
+        self.component_file.write_text(FIXABLE_COMPONENT)
+
+    def test_apply_edits(self):
+        """Test edits are applied in offset order and overlapping edits are skipped"""
+        text, applied = apply_edits('abcdef', [
+            TextEdit(4, 4, 'X'), TextEdit(0, 2, 'AB'), TextEdit(1, 3, 'no'), TextEdit(4, 4, 'Y'),
+        ])
+
+        self.assertEqual(text, 'ABcdXYef')
+        self.assertEqual(applied, 3)
+
+    def test_call_end_and_modifiers(self):
+        """Test call expressions span arguments and (labeled) trailing closures"""
+        stream = TokenStream(FIXABLE_COMPONENT.splitlines(keepends=True))
+
+        self.assertEqual(stream.call_end(4, 18), (8, 13))  # Button(action: {...}) {...}
+        self.assertEqual(stream.call_end(10, 18), (12, 13))  # Button { } label: { }
+        self.assertEqual(stream.call_end(3, 18), (3, 37))  # Toggle(...)
+        self.assertIsNone(TokenStream(['Button("x") {\n', '    Text("}")\n']).call_end(0, 6))  # Unterminated
+        self.assertEqual(
+            [name for name, _ in stream.modifiers(12, 13)],
+            ['padding', 'frame']
+        )
+
+    def test_fix_file(self):
+        """Test missing minimum frames are inserted once and fixing is idempotent"""
+        issues = self.validator.validate_component(self.component_file)
+        warnings = [i for i in issues if i.description.startswith('Interactive element')]
+        self.assertEqual([(i.line_number, i.auto_fixable) for i in warnings], [(4, True), (5, True), (20, False)])
+
+        writes = []
+        original = validator_module.write_text_atomic
+        validator_module.write_text_atomic = lambda path, text: writes.append(path) or original(path, text)
+        self.addCleanup(setattr, validator_module, 'write_text_atomic', original)
+
+        result = self.validator.fix_file(self.component_file)
+
+        self.assertEqual((result.fixed, result.skipped, writes), (2, 0, [self.component_file]))
+        fixed = self.component_file.read_text().splitlines()
+        self.assertEqual(fixed[8:11], [
+            '            }',
+            '            .frame(minWidth: 44, minHeight: 44)',
+            '            .buttonStyle(.plain)',
+        ])
+        self.assertEqual(
+            fixed[3],
+            '            Toggle("On", isOn: $isOn).frame(minWidth: 44, minHeight: 44).tint(.blue) // inline'
+        )
+
+        again = self.validator.fix_file(self.component_file)
+        self.assertEqual((again.fixed, writes), (0, [self.component_file]))
+
+    def test_every_element_on_a_line_is_fixed(self):
+        """Test a frame added to one element does not count for its neighbours"""
+        self.component_file.write_text(
+            'HStack { Button("A") { a() }; Toggle("t", isOn: $x) }\n'
+            'HStack { Button("B") { b() }.frame(minWidth: 44, minHeight: 44); Toggle("u", isOn: $y) }\n'
+        )
+
+        issues = self.validator.validate_component(self.component_file)
+        self.assertEqual(
+            [(i.line_number, i.description) for i in issues],
+            [
+                (1, 'Interactive element (Button) may not have 44pt minimum touch target'),
+                (1, 'Interactive element (Toggle) may not have 44pt minimum touch target'),
+                (2, 'Interactive element (Toggle) may not have 44pt minimum touch target'),
+            ]
+        )
+
+        result = self.validator.fix_file(self.component_file)
+
+        self.assertEqual(result.fixed, 3)
+        self.assertEqual(self.component_file.read_text().splitlines()[0], (
+            'HStack { Button("A") { a() }.frame(minWidth: 44, minHeight: 44); '
+            'Toggle("t", isOn: $x).frame(minWidth: 44, minHeight: 44) }'
+        ))
+        self.assertEqual(self.validator.validate_component(self.component_file), [])
+
+    def test_fix_limited_to_ranges(self):
+        """Test only issues on the given (changed) lines are fixed"""
+        result = self.validator.fix_file(self.component_file, ranges=[(5, 9)])
+
+        self.assertEqual(result.fixed, 1)
+        fixed = self.component_file.read_text().splitlines()
+        self.assertEqual(fixed[3], FIXABLE_COMPONENT.splitlines()[3])
+        self.assertEqual(fixed[9], '            .frame(minWidth: 44, minHeight: 44)')
+
+    def test_line_endings_preserved(self):
+        """Test CRLF files keep their line endings"""
+        self.component_file.write_bytes(FIXABLE_COMPONENT.replace('\n', '\r\n').encode('utf-8'))
+
+        self.validator.fix_file(self.component_file)
+
+        data = self.component_file.read_bytes()
+        self.assertIn(b'}\r\n            .frame(minWidth: 44, minHeight: 44)\r\n', data)
+        self.assertEqual(data.count(b'\n'), data.count(b'\r\n'))
+
+    def test_fix_files_in_parallel(self):
+        """Test worker processes fix files with the same result"""
+        others = []
+        for i in range(3):
+            other = self.components / f'ElevateFixable{i}+SwiftUI.swift'
+            other.write_text(FIXABLE_COMPONENT)
+            others.append(other)
+
+        results = self.validator.fix_files([self.component_file, *others], jobs=2)
+
+        self.assertEqual([r.path for r in results], [self.component_file, *others])
+        self.assertEqual([r.fixed for r in results], [2, 2, 2, 2])
+        self.assertEqual({path.read_text() for path in [self.component_file, *others]}, {self.component_file.read_text()})
+
+    def test_cli(self):
+        """Test --fix applies fixes before the report is built"""
+        output = subprocess.run(
+            [sys.executable, str(script_path), '--paths', str(self.temp_dir), '--fix', '--no-cache'],
+            capture_output=True, text=True
+        ).stdout
+
+        self.assertIn('🔧 Fixed 2 issues in 1 files', output)
+        self.assertIn('Total Issues: 2', output)  # extension Button, Image label
+
+
+class TestValidatorServer(ValidatorTestCase):
+    """Test the editor server protocol"""
+
+    def serve(self, *requests):
+        stdin = io.StringIO(''.join(json.dumps(r) + '\n' if isinstance(r, dict) else r for r in requests))
+        stdout = io.StringIO()
+        server = ValidatorServer(self.validator, stdin, stdout)
+        self.assertEqual(server.serve(), 0)
+        return server, [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    def test_buffers_are_revalidated_incrementally(self):
+        """Test unsaved buffers are validated, unchanged ones answered from memory"""
+        path = str(self.component_file)
+        edited = SAMPLE_COMPONENT.replace('size: 9', 'size: 8')
+        server, responses = self.serve(
+            {'id': 1, 'method': 'validate', 'params': {'path': path}},
+            {'id': 2, 'method': 'validate', 'params': {'path': path, 'text': SAMPLE_COMPONENT}},
+            {'id': 3, 'method': 'validate', 'params': {'path': path, 'text': edited}},
+            {'id': 4, 'method': 'stats'},
+        )
+
+        expected = [i.to_dict() for i in self.validator.validate_component(self.component_file)]
+        self.assertEqual(responses[0]['result']['issues'], expected)
+        self.assertEqual([r['result']['cached'] for r in responses[:3]], [False, True, False])
+        self.assertEqual([r['result']['lexed'] for r in responses[:3]], [17, 0, 1])
+        self.assertIn('.font(.system(size: 8))', [i['current_value'] for i in responses[2]['result']['issues']])
+        self.assertEqual(responses[3]['result'], {'documents': 1, 'requests': 4, 'validations': 2})
+        self.assertEqual(server.documents[self.component_file].stream.lines, edited.splitlines(keepends=True))
+
+    def test_stats_include_rule_timing(self):
+        """Test per-rule timing is collected and returned when rule timing is on"""
+        self.validator.time_rules = True
+        _, responses = self.serve(
+            {'id': 1, 'method': 'validate', 'params': {'path': str(self.component_file)}},
+            {'id': 2, 'method': 'stats'},
+        )
+
+        stats = responses[1]['result']
+        issues = len(responses[0]['result']['issues'])
+        self.assertEqual(sum(rule['issues'] for rule in stats['rules'].values()), issues)
+        self.assertIn('touch-targets', stats['rules'])
+        self.assertTrue(stats['rule_report'].startswith('📊 Rule timing (1 files timed'))
+
+        self.validator.time_rules = False
+        _, responses = self.serve({'id': 1, 'method': 'stats'})
+        self.assertNotIn('rules', responses[0]['result'])
+
+    def test_errors(self):
+        """Test malformed requests get JSON-RPC errors and the server keeps going"""
+        server, responses = self.serve(
+            'not json\n',
+            '\n',
+            {'id': 1, 'method': 'format'},
+            {'id': 2, 'method': '_error'},
+            {'id': 3, 'method': 'validate', 'params': {}},
+            {'id': 4, 'method': 'validate', 'params': {'path': str(self.temp_dir / 'Missing.swift')}},
+            {'id': 5, 'method': 'close', 'params': {'path': 'Missing.swift'}},
+        )
+
+        self.assertEqual(
+            [(r['id'], r['error']['code']) for r in responses[:5]],
+            [(None, -32700), (1, -32601), (2, -32601), (3, -32602), (4, -32602)]
+        )
+        self.assertEqual(responses[5], {'id': 5, 'result': {'closed': False}})
+
+    def test_bad_params_and_internal_errors(self):
+        """Test wrongly typed params and failing rules are answered, not fatal"""
+        self.validator.validate_source = lambda source: 1 / 0
+        server, responses = self.serve(
+            {'id': 1, 'method': 'validate', 'params': {'path': 'x.swift', 'text': 5}},
+            {'id': 2, 'method': 'validate', 'params': {'path': 5}},
+            {'id': 3, 'method': 'validate', 'params': ['x.swift']},
+            {'id': 4, 'method': 'stats', 'params': {'verbose': True}},
+            {'id': 5},
+            {'id': 6, 'method': 'validate', 'params': {'path': 'x.swift', 'text': 'Button("x") {}\n'}},
+            {'id': 7, 'method': 'stats'},
+        )
+
+        self.assertEqual(
+            [(r['id'], r['error']['code']) for r in responses[:6]],
+            [(1, -32602), (2, -32602), (3, -32602), (4, -32602), (5, -32600), (6, -32603)]
+        )
+        self.assertIn('ZeroDivisionError', responses[5]['error']['message'])
+        self.assertEqual(responses[6]['result']['requests'], 6)
+
+    def test_cli_shutdown(self):
+        """Test the --server process answers requests and exits on shutdown"""
+        requests = [
+            {'id': 1, 'method': 'validate', 'params': {'path': str(self.component_file)}},
+            {'id': 2, 'method': 'shutdown'},
+            {'id': 3, 'method': 'stats'},
+        ]
+        result = subprocess.run(
+            [sys.executable, str(script_path), '--server', '--no-cache'],
+            input=''.join(json.dumps(r) + '\n' for r in requests),
+            capture_output=True, text=True, timeout=60
+        )
+
+        responses = [json.loads(line) for line in result.stdout.splitlines()]
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual([r['id'] for r in responses], [1, 2])
+        self.assertEqual(len(responses[0]['result']['issues']), 6)
+
+
+LIGHT_SCSS = """$elvt-primitives-color-gray-900: rgb(17 17 17);
+$elvt-primitives-color-gray-400: rgb(150 150 150);
+$elvt-primitives-color-white: rgb(255 255 255);
+$elvt-alias-layout-layer-appBackground: var(--elvt-primitives-color-white, rgb(255 255 255));
+$elvt-alias-action-neutral-fill-default: var(--elvt-primitives-color-white, rgb(255 255 255));
+$elvt-alias-action-neutral-text-default: var(--elvt-primitives-color-gray-900, rgb(17 17 17));
+$elvt-alias-action-neutral-text-disabled: var(--elvt-primitives-color-gray-400, rgb(150 150 150));
+$elvt-component-chip-fill-default: var(--elvt-primitives-color-white, rgb(255 255 255));
+$elvt-component-chip-text-color-default: var(--elvt-primitives-color-gray-400, rgb(150 150 150));
+$elvt-component-chip-text-hover: rgb(0 0 0);
+"""
+
+DARK_SCSS = """$elvt-primitives-color-gray-900: rgb(17 17 17);
+$elvt-alias-action-neutral-fill-default: var(--elvt-primitives-color-gray-900, rgb(17 17 17));
+$elvt-alias-action-neutral-text-default: rgba(255 255 255 0.5);
+"""
+
+
+class TestContrastEngine(unittest.TestCase):
+    """Test WCAG contrast of text/fill token pairs"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        (self.temp_dir / 'values').mkdir()
+        (self.temp_dir / 'values' / '_light.scss').write_text(LIGHT_SCSS)
+        (self.temp_dir / 'values' / '_dark.scss').write_text(DARK_SCSS)
+        self.engine = ContrastEngine.from_scss(self.temp_dir, theme=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_text_fill_pairs(self):
+        """Test text tokens pair with the fill of the same state, disabled states are exempt"""
+        pairs = ContrastEngine.text_fill_pairs(self.engine.modes['light'])
+
+        self.assertEqual(pairs, [
+            ('elvt-alias-action-neutral-text-default', 'elvt-alias-action-neutral-fill-default'),
+            ('elvt-component-chip-text-color-default', 'elvt-component-chip-fill-default'),
+        ])
+
+    def test_failing_pairs_per_mode(self):
+        """Test ratios per mode, including translucent text in dark mode"""
+        results = self.engine.evaluate()
+
+        light = {pair.text_token: pair.ratio for pair in results['light']}
+        self.assertEqual(light['elvt-alias-action-neutral-text-default'], 18.88)
+        self.assertEqual(light['elvt-component-chip-text-color-default'], 2.96)
+
+        failing = self.engine.failing_pairs()
+        self.assertEqual([p.text_token for p in failing['light']], ['elvt-component-chip-text-color-default'])
+        # 50% white over gray-900 composites to a mid gray
+        self.assertEqual([p.ratio for p in results['dark']], [5.33])
+        self.assertEqual(failing['dark'], [])
+
+    def test_shared_generator_loader(self):
+        """Test the v4 generator is loaded once and shared with the other scripts"""
+        generator = validator_module.load_token_generator()
+
+        self.assertIs(generator, sys.modules['update_design_tokens_v4'])
+        self.assertIs(validator_module.load_token_generator(), generator)
+        self.assertIs(validator_module.load_token_generator, sys.modules['elevate_token_generator'].load_token_generator)
+
+    def test_cli_rejects_machine_formats(self):
+        """Test --contrast with SARIF/NDJSON fails instead of mixing text into stdout"""
+        result = subprocess.run(
+            [sys.executable, str(script_path), '--contrast', '--format', 'sarif'],
+            capture_output=True, text=True, timeout=60
+        )
+
+        self.assertEqual(result.returncode, 2)
+        self.assertEqual(result.stdout, '')
+        self.assertIn('--contrast', result.stderr)
+
+    def test_numpy_and_python_agree(self):
+        """Test the vectorized path matches the pure-Python fallback"""
+        text = [(0.0, 0.0, 0.0, 1.0), (0.47, 0.47, 0.47, 1.0), (1.0, 1.0, 1.0, 0.5)]
+        fill = [(1.0, 1.0, 1.0, 1.0), (1.0, 1.0, 1.0, 1.0), (0.2, 0.4, 0.6, 0.8)]
+
+        python = [ContrastEngine._contrast_ratio(t, f, (1.0, 1.0, 1.0)) for t, f in zip(text, fill)]
+        self.assertAlmostEqual(python[0], 21.0)
+
+        if validator_module.np is None:
+            self.skipTest('numpy is not installed')
+        vectorized = ContrastEngine._contrast_ratios_numpy(text, fill, (1.0, 1.0, 1.0)).tolist()
+        for a, b in zip(python, vectorized):
+            self.assertAlmostEqual(a, b)
+
+
+THEME_PRIMITIVES = """$ios-typography-scale: 1.25;
+$elvt-typography-body-medium: 17.5px;
+$elvt-typography-label-xsmall: 13.75px;
+$elvt-typography-caption: 8px;
+"""
+
+TYPOGRAPHY_SWIFT = """public enum ElevateTypographyiOS {
+    public static let bodyMedium = Font.custom(fontFamilyPrimary, size: ElevateTypography.Sizes.bodyMedium * iosScaleFactor)
+    public static let bodySmall = Font.custom(fontFamilyPrimary, size: ElevateTypography.Sizes.bodySmall * iosScaleFactor)
+    public static let caption = Font.custom(fontFamilyPrimary, size: Sizes.caption * iosScaleFactor + 1)
+    public static let custom = Font.custom(fontFamilyPrimary, size: customSize)
+}
+"""
+
+
+class TestTypographyTable(unittest.TestCase):
+    """Test symbolic font sizes evaluated against the token table"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.theme_file = self.temp_dir / 'primitives.css'
+        self.theme_file.write_text(THEME_PRIMITIVES)
+        (self.temp_dir / 'values').mkdir()
+        (self.temp_dir / 'values' / '_light.scss').write_text(
+            "$elvt-typography-body-small: 0.75rem;\n$elvt-typography-label-xsmall: 11px;\n"
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def load(self, **kwargs):
+        return TypographyTable.load(self.temp_dir, self.theme_file, **kwargs)
+
+    def test_sizes_and_scale(self):
+        """Test base sizes come from ELEVATE tokens, or the theme divided by its scale"""
+        table = self.load()
+
+        self.assertEqual(table.scale, 1.25)
+        self.assertEqual(table.size('bodySmall'), 12.0)
+        self.assertEqual(table.size('bodyMedium'), 14.0)
+        self.assertEqual(table.size('labelXSmall'), 11.0)
+
+    def test_evaluate(self):
+        """Test expressions of sizes, the scale factor and arithmetic"""
+        table = self.load()
+
+        self.assertEqual(table.evaluate('ElevateTypography.Sizes.bodyMedium * iosScaleFactor'), 17.5)
+        self.assertEqual(table.evaluate('(Sizes.caption + 1) * ElevateTypographyiOS.iosScaleFactor'), 9.25)
+        self.assertEqual(table.evaluate('12 / 2'), 6.0)
+        self.assertIsNone(table.evaluate('Sizes.unknown * iosScaleFactor'))
+        self.assertIsNone(table.evaluate('customSize'))
+        self.assertIsNone(table.evaluate('max(Sizes.bodySmall, 17)'))
+
+    def test_rule_checks_symbolic_sizes(self):
+        """Test HIG minimum sizes apply to generated typography"""
+        path = self.temp_dir / 'ElevateTypographyiOS.swift'
+        path.write_text(TYPOGRAPHY_SWIFT)
+        validator = iOSHIGValidator(self.temp_dir, rules=[TypographyRule(self.load())])
+
+        issues = validator.validate_source(SourceFile.read(path))
+
+        self.assertEqual(
+            [(i.line_number, i.rule, i.description) for i in issues],
+            [
+                (3, 'HIG Typography - Body Text', 'Body text too small (15.0pt < 17pt minimum)'),
+                (4, 'HIG Typography - Minimum Size', 'Text too small (9.0pt < 11pt absolute minimum)'),
+            ]
+        )
+
+    def test_font_size_literal_and_expression(self):
+        """Test a leading literal in an expression is evaluated, not taken as the size"""
+        rule = TypographyRule(self.load())
+
+        self.assertEqual(rule.font_size('Font.custom("X", size: 10 * iosScaleFactor)'), 12.5)
+        self.assertEqual(rule.font_size('Font.custom("X", size: 10 * iosScaleFactor, relativeTo: .body)'), 12.5)
+        self.assertEqual(rule.font_size('Font.custom("X", size: 10)'), 10.0)
+        self.assertEqual(rule.font_size('Font.custom("X", size: 10.5, relativeTo: .body)'), 10.5)
+
+    def test_shared_table_is_loaded_on_first_use(self):
+        """Test the default table is only built when the rule needs it, and travels to workers"""
+        TypographyTable.configure(self.temp_dir)
+        self.addCleanup(TypographyTable.configure)
+        rule = TypographyRule()
+        self.assertIsNone(TypographyTable._shared)
+
+        worker_rule = pickle.loads(pickle.dumps(rule))
+
+        self.assertIsNotNone(TypographyTable._shared)
+        self.assertEqual(worker_rule.table.sizes, TypographyTable._shared.sizes)
+
+    def test_table_is_cached_and_versioned(self):
+        """Test the table is persisted by source hash and feeds the rule version"""
+        cache_file = self.temp_dir / 'typography-table.json'
+        first = self.load(cache_file=cache_file)
+        self.assertTrue(cache_file.exists())
+
+        parsed = []
+        parser = validator_module.load_token_generator().SCSSUniversalParser
+        original = parser.extract_all_tokens
+        parser.extract_all_tokens = lambda self: parsed.append(self.scss_path) or original(self)
+        try:
+            second = self.load(cache_file=cache_file)
+            self.assertEqual(parsed, [])
+            self.assertEqual(second.sizes, first.sizes)
+
+            self.theme_file.write_text(THEME_PRIMITIVES.replace('1.25', '1.5'))
+            third = self.load(cache_file=cache_file)
+        finally:
+            parser.extract_all_tokens = original
+
+        self.assertEqual(len(parsed), 2)
+        self.assertEqual(third.evaluate('Sizes.bodySmall * iosScaleFactor'), 18.0)
+        self.assertNotEqual(TypographyRule(first).version, TypographyRule(third).version)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Test suite for git history pattern extraction
+
+Tests core functionality:
+- Streaming `git log -p` history scan
+- Hover-to-press pattern detection
+- Touch target detection with per-file blame
+- Incremental scans from persisted watermarks
+- Pattern registry with a single multi-pattern scan
+- Batched knowledge base updates
+- Concurrent memory-mapped source tree scanning
+"""
+
+import unittest
+import sys
+from pathlib import Path
+import tempfile
+import importlib.util
+import shutil
+import subprocess
+import json
+import stat
+
+# Load the extractor script as a module
+script_path = Path(__file__).parent.parent / 'scripts' / 'extract-patterns-from-history.py'
+spec = importlib.util.spec_from_file_location("extract_patterns_from_history", script_path)
+extractor_module = importlib.util.module_from_spec(spec)
+sys.modules['extract_patterns_from_history'] = extractor_module
+spec.loader.exec_module(extractor_module)
+
+# Import required classes
+PatternExtractor = extractor_module.PatternExtractor
+PatternScanner = extractor_module.PatternScanner
+get_pattern = extractor_module.get_pattern
+PatternOccurrence = extractor_module.PatternOccurrence
+SourceTreeScanner = extractor_module.SourceTreeScanner
+
+COMPONENTS = Path('ElevateUI') / 'Sources' / 'SwiftUI' / 'Components'
+
+
+class GitRepoTestCase(unittest.TestCase):
+    """Temporary git repository with an ElevateUI component layout"""
+
+    def setUp(self):
+        self.repo = Path(tempfile.mkdtemp())
+        self.git('init', '-q')
+        (self.repo / COMPONENTS).mkdir(parents=True)
+        self.extractor = PatternExtractor(self.repo)
+
+    def tearDown(self):
+        shutil.rmtree(self.repo, ignore_errors=True)
+
+    def git(self, *args):
+        return subprocess.run(
+            ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+            cwd=self.repo, check=True, capture_output=True, text=True
+        ).stdout
+
+    def commit_file(self, name, content, message):
+        (self.repo / COMPONENTS / name).write_text(content)
+        self.git('add', '-A')
+        self.git('commit', '-q', '-m', message)
+        return self.git('rev-parse', 'HEAD').strip()
+
+
+class TestHistoryScan(GitRepoTestCase):
+    """Test the streaming history scanner"""
+
+    def test_iter_log_patch(self):
+        """Test commit headers and diff lines are streamed in order"""
+        first = self.commit_file('ElevateChip+SwiftUI.swift', 'struct Chip {}\n', 'Add chip')
+        second = self.commit_file('ElevateChip+SwiftUI.swift', 'struct Chip { let id = 1 }\n', 'Update chip')
+
+        events = list(self.extractor.iter_log_patch([]))
+        headers = [commit['hash'] for commit, line in events if line is None]
+
+        self.assertEqual(headers, [second, first])
+        self.assertIn('+struct Chip { let id = 1 }', [line for _, line in events])
+
+    def test_hover_to_press_pattern(self):
+        """Test only hover commits with @GestureState isPressed are reported"""
+        self.commit_file('ElevateButton+SwiftUI.swift', 'struct Button {}\n', 'Add button')
+        body = ''.join(f'    // line {i}\n' for i in range(20))
+        hover_hash = self.commit_file(
+            'ElevateButton+SwiftUI.swift',
+            'struct Button {\n' + body + '    @GestureState private var isPressed = false\n' + body + '}\n',
+            'Replace hover with press state'
+        )
+        self.commit_file('ElevateLink+SwiftUI.swift', 'struct Link {}\n', 'Fix hover docs')
+
+        occurrences = self.extractor.extract_hover_to_press_pattern()
+
+        self.assertEqual(len(occurrences), 1)
+        self.assertEqual(occurrences[0].commit_hash, hover_hash[:8])
+        snippet_lines = occurrences[0].code_snippet.split('\n')
+        self.assertEqual(len(snippet_lines), 20)
+        self.assertIn('@GestureState private var isPressed', snippet_lines[5])
+
+
+class TestWatermarks(GitRepoTestCase):
+    """Test incremental history ranges"""
+
+    def test_linear_history(self):
+        """Test the scan resumes after the watermark"""
+        last = self.commit_file('ElevateChip+SwiftUI.swift', 'a\n', 'one')
+        head = self.commit_file('ElevateChip+SwiftUI.swift', 'b\n', 'two')
+        watermarks = {'hover-state-removal': {'commit': last}}
+
+        self.assertEqual(
+            self.extractor.resolve_history_range('hover-state-removal', head, watermarks),
+            f'{last}..{head}'
+        )
+        self.assertIsNone(self.extractor.resolve_history_range('touch-target-expansion', head, watermarks))
+
+    def test_rewritten_history_falls_back_to_merge_base(self):
+        """Test a rebased-away watermark rescans from the merge base"""
+        base = self.commit_file('ElevateChip+SwiftUI.swift', 'a\n', 'one')
+        last = self.commit_file('ElevateChip+SwiftUI.swift', 'b\n', 'two')
+        self.git('reset', '-q', '--hard', base)
+        head = self.commit_file('ElevateChip+SwiftUI.swift', 'c\n', 'two (rewritten)')
+        watermarks = {'hover-state-removal': {'commit': last}}
+
+        self.assertEqual(
+            self.extractor.resolve_history_range('hover-state-removal', head, watermarks),
+            f'{base}..{head}'
+        )
+
+    def test_unknown_watermark_rescans_everything(self):
+        """Test a watermark missing from the repository triggers a full scan"""
+        head = self.commit_file('ElevateChip+SwiftUI.swift', 'a\n', 'one')
+        watermarks = {'hover-state-removal': {'commit': '0' * 40}}
+
+        self.assertIsNone(self.extractor.resolve_history_range('hover-state-removal', head, watermarks))
+
+    def test_analyze_patterns_persists_watermark(self):
+        """Test a run records HEAD and the next run only scans new commits"""
+        first = self.commit_file('ElevateChip+SwiftUI.swift', 'a\n', 'one')
+
+        self.extractor.analyze_patterns()
+        self.assertEqual(self.extractor.load_watermarks()['hover-state-removal']['commit'], first)
+
+        second = self.commit_file('ElevateChip+SwiftUI.swift', 'b\n', 'two')
+        scanned = []
+        self.extractor.scan_history = lambda patterns, revision_range=None, since=None: \
+            scanned.append(revision_range) or {p.pattern_id: [] for p in patterns}
+        self.extractor.analyze_patterns()
+
+        self.assertEqual(scanned, [f'{first}..{second}'])
+
+    def test_since_scan_keeps_watermark(self):
+        """Test a --since run does not hide older commits from the next incremental run"""
+        first = self.commit_file('ElevateChip+SwiftUI.swift', 'a\n', 'one')
+        self.extractor.analyze_patterns()
+        self.commit_file('ElevateChip+SwiftUI.swift', 'b\n', 'two')
+        head = self.commit_file('ElevateChip+SwiftUI.swift', 'c\n', 'three')
+
+        self.extractor.analyze_patterns(since='2999-01-01')
+        self.assertEqual(self.extractor.load_watermarks()['hover-state-removal']['commit'], first)
+
+        scanned = []
+        self.extractor.scan_history = lambda patterns, revision_range=None, since=None: \
+            scanned.append(revision_range) or {p.pattern_id: [] for p in patterns}
+        self.extractor.analyze_patterns()
+
+        self.assertEqual(scanned, [f'{first}..{head}'])
+        self.assertEqual(self.extractor.load_watermarks()['hover-state-removal']['commit'], head)
+
+    def test_failed_scan_keeps_watermark(self):
+        """Test a failing git log leaves the watermark in place"""
+        first = self.commit_file('ElevateChip+SwiftUI.swift', 'a\n', 'one')
+        self.extractor.analyze_patterns()
+        self.commit_file('ElevateChip+SwiftUI.swift', 'b\n', 'two')
+
+        def failing_scan(patterns, revision_range=None, since=None):
+            raise subprocess.CalledProcessError(128, ['git', 'log'])
+        self.extractor.scan_history = failing_scan
+        self.extractor.analyze_patterns()
+
+        self.assertEqual(self.extractor.load_watermarks()['hover-state-removal']['commit'], first)
+
+    def test_iter_log_patch_raises_on_git_error(self):
+        """Test an unknown revision surfaces as an error instead of an empty history"""
+        self.commit_file('ElevateChip+SwiftUI.swift', 'a\n', 'one')
+        with self.assertRaises(subprocess.CalledProcessError):
+            list(self.extractor.iter_log_patch(['0' * 40 + '..HEAD']))
+
+
+class TestTouchTargetPattern(GitRepoTestCase):
+    """Test touch target detection"""
+
+    def test_blame_once_per_file(self):
+        """Test every match is attributed while each file is blamed once"""
+        first = self.commit_file(
+            'ElevateChip+SwiftUI.swift',
+            'Text("a")\n    .frame(minWidth: 44)\n',
+            'Add chip'
+        )
+        second = self.commit_file(
+            'ElevateChip+SwiftUI.swift',
+            'Text("a")\n    .frame(minWidth: 44)\nText("b")\n    .frame(minHeight: 44)\n',
+            'Add second chip label'
+        )
+
+        blamed = []
+        original = self.extractor.blame_file
+
+        def counting_blame(relative_path):
+            blamed.append(relative_path)
+            return original(relative_path)
+
+        self.extractor.blame_file = counting_blame
+        occurrences = self.extractor.extract_touch_target_pattern()
+
+        self.assertEqual(blamed, [(COMPONENTS / 'ElevateChip+SwiftUI.swift').as_posix()])
+        self.assertEqual(
+            [(o.line_range, o.commit_hash) for o in occurrences],
+            [('2', first[:8]), ('4', second[:8])]
+        )
+        self.assertRegex(occurrences[0].commit_date, r'^\d{4}-\d{2}-\d{2}$')
+
+
+class TestPatternRegistry(GitRepoTestCase):
+    """Test multi-pattern scanning"""
+
+    def test_scanner_prefilter(self):
+        """Test one line can match several patterns and regexes confirm literals"""
+        scanner = PatternScanner([
+            get_pattern('touch-target-expansion'),
+            get_pattern('typography-scaling'),
+            get_pattern('hover-state-removal'),
+        ])
+
+        ids = lambda line: [p.pattern_id for p in scanner.match_line(line)]
+        self.assertEqual(
+            ids('Text(t).font(ElevateTypographyiOS.bodyMedium).frame(minWidth: 44)'),
+            ['touch-target-expansion', 'typography-scaling']
+        )
+        self.assertEqual(ids('@GestureState private var dragOffset = 0'), [])
+        self.assertEqual(ids('@GestureState private var isPressed = false'), ['hover-state-removal'])
+        self.assertEqual(ids('let plain = 1'), [])
+
+    def test_scan_tree_single_pass(self):
+        """Test all tree patterns are reported from one pass with one blame per file"""
+        self.commit_file(
+            'ElevateMenu+SwiftUI.swift',
+            'Picker("x", selection: $s) {}\n.font(ElevateTypographyiOS.labelSmall)\n.frame(minHeight: 44)\n',
+            'Add menu'
+        )
+
+        blamed = []
+        original = self.extractor.blame_file
+        self.extractor.blame_file = lambda path: blamed.append(path) or original(path)
+
+        patterns = [p for p in extractor_module.PATTERN_REGISTRY if p.source == 'tree']
+        occurrences = self.extractor.scan_tree(patterns)
+
+        self.assertEqual(len(blamed), 1)
+        self.assertEqual([o.line_range for o in occurrences['dropdown-native-picker']], ['1'])
+        self.assertEqual([o.line_range for o in occurrences['typography-scaling']], ['2'])
+        self.assertEqual([o.line_range for o in occurrences['touch-target-expansion']], ['3'])
+        self.assertEqual(occurrences['icon-positioning'], [])
+
+
+class TestSourceTreeScanner(GitRepoTestCase):
+    """Test the concurrent source tree scanner"""
+
+    def test_iter_matches(self):
+        """Test matching files stream back in order and others are skipped"""
+        components = self.repo / COMPONENTS
+        (components / 'A.swift').write_text('one\n.frame(minWidth: 44)\nthree\n')
+        (components / 'B.swift').write_text('')
+        (components / 'C.swift').write_text('struct C {}\n')
+        (components / 'D.swift').write_text('Picker("x") {}\r\n.frame(minHeight: 44)\n')
+
+        scanner = SourceTreeScanner(extractor_module.PatternScanner([
+            get_pattern('touch-target-expansion'),
+            get_pattern('dropdown-native-picker'),
+        ]), max_workers=2)
+        results = list(scanner.iter_matches(sorted(components.glob('*.swift'))))
+
+        self.assertEqual([path.name for path, _ in results], ['A.swift', 'D.swift'])
+        self.assertEqual(
+            [(p.pattern_id, i) for p, i, _ in results[1][1]],
+            [('dropdown-native-picker', 1), ('touch-target-expansion', 2)]
+        )
+        self.assertEqual(results[0][1][0][2], 'one\n.frame(minWidth: 44)\nthree\n')
+
+
+class TestKnowledgeBaseUpdates(GitRepoTestCase):
+    """Test batched knowledge base writes"""
+
+    def setUp(self):
+        super().setUp()
+        self.kb_path = self.repo / 'patterns.json'
+        self.kb_path.write_text(json.dumps({'patterns': [
+            {'id': 'icon-positioning', 'examples': ['ElevateChip.swift:3 (aaaaaaaa)'], 'last_seen': '2025-01-01'},
+            {'id': 'touch-target-expansion'},
+        ]}))
+        self.extractor.knowledge_base_path = self.kb_path
+
+    def occurrence(self, line, commit_hash, commit_date):
+        return PatternOccurrence('ElevateChip.swift', line, commit_hash, commit_date, '', '')
+
+    def test_single_write_for_all_patterns(self):
+        """Test all patterns are merged, de-duplicated and written in one go"""
+        writes = []
+        original = extractor_module.write_json_atomic
+        extractor_module.write_json_atomic = lambda path, data, **kw: writes.append(path) or original(path, data, **kw)
+        self.addCleanup(setattr, extractor_module, 'write_json_atomic', original)
+
+        self.extractor.update_knowledge_base({
+            'icon-positioning': [
+                self.occurrence('3', 'aaaaaaaa', '2024-06-01'),
+                self.occurrence('9', 'bbbbbbbb', '2024-06-01'),
+            ],
+            'touch-target-expansion': [self.occurrence('4', 'cccccccc', '2025-03-02')],
+            'unknown-pattern': [self.occurrence('1', 'dddddddd', '2025-03-02')],
+        })
+
+        self.assertEqual(writes, [self.kb_path])
+        patterns = {p['id']: p for p in json.loads(self.kb_path.read_text())['patterns']}
+        self.assertEqual(
+            patterns['icon-positioning']['examples'],
+            ['ElevateChip.swift:3 (aaaaaaaa)', 'ElevateChip.swift:9 (bbbbbbbb)']
+        )
+        # last_seen never moves backwards
+        self.assertEqual(patterns['icon-positioning']['last_seen'], '2025-01-01')
+        self.assertEqual(patterns['touch-target-expansion']['last_seen'], '2025-03-02')
+        self.assertEqual(list(self.repo.glob('.patterns.json.*')), [])
+
+    def test_write_keeps_permissions(self):
+        """Test the atomic rewrite does not tighten the file mode to 0600"""
+        self.kb_path.chmod(0o644)
+        self.extractor.update_knowledge_base({
+            'touch-target-expansion': [self.occurrence('4', 'cccccccc', '2025-03-02')],
+        })
+        self.assertEqual(stat.S_IMODE(self.kb_path.stat().st_mode), 0o644)
+
+    def test_missing_knowledge_base_keeps_watermarks(self):
+        """Test occurrences that could not be stored are scanned again next run"""
+        self.commit_file('ElevateChip+SwiftUI.swift', 'a\n', 'one')
+        self.extractor.knowledge_base_path = self.repo / 'missing.json'
+        self.extractor.scan_history = lambda patterns, revision_range=None, since=None: \
+            {p.pattern_id: [self.occurrence('N/A', 'aaaaaaaa', '2025-03-02')] for p in patterns}
+
+        self.extractor.analyze_patterns()
+
+        self.assertEqual(self.extractor.load_watermarks(), {})
+
+    def test_unchanged_knowledge_base_is_not_rewritten(self):
+        """Test known examples do not trigger a write"""
+        before = self.kb_path.read_text()
+        self.extractor.update_knowledge_base({
+            'icon-positioning': [self.occurrence('3', 'aaaaaaaa', '2024-06-01')],
+        })
+        self.assertEqual(self.kb_path.read_text(), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ Tests core functionality:
 - Token type detection (color, spacing, dimension)
 - Swift name sanitization
 - Cache invalidation logic
+- Build stamp manifest
 - Token deduplication
 """
 
@@ -19,6 +20,8 @@ import json
 import hashlib
 import importlib.util
 import shutil
+import subprocess
+import time
 
 # Load the token generator script as a module
 script_path = Path(__file__).parent.parent / 'scripts' / 'update-design-tokens-v4.py'
@@ -241,6 +244,52 @@ class TestTokenCache(unittest.TestCase):
         self.assertTrue(self.cache.needs_regeneration([source_file], output_file))
 
 
+class TestTokenStamp(unittest.TestCase):
+    """Test the stamp manifest read by regenerate-tokens-if-needed.sh"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.stamp_file = self.temp_dir / '.token_stamp'
+        self.source = self.temp_dir / '_light.scss'
+        self.output = self.temp_dir / 'ElevatePrimitives.swift'
+        self.source.write_text('$test: #fff;')
+        self.output.write_text('let test = Color.white')
+        past = time.time() - 10
+        os.utime(self.source, (past, past))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_stamp_matches_stat(self):
+        """Test the stamp body is exactly what stat prints for the same paths"""
+        written = token_gen_module.write_token_stamp(
+            self.stamp_file, self.temp_dir, [self.source, self.temp_dir / 'missing.css'], [self.output]
+        )
+
+        self.assertTrue(written)
+        header, *lines = self.stamp_file.read_text().splitlines()
+        self.assertEqual(header, f'# elevate-token-stamp 1 {self.temp_dir}')
+        self.assertEqual(len(lines), 2)  # Missing files are not listed
+
+        paths = [line.split(' ', 2)[2] for line in lines]
+        stat = subprocess.run(['stat', '-c', '%Y %s %n', *paths], capture_output=True, text=True)
+        if stat.returncode != 0:
+            self.skipTest('GNU stat is not available')
+        self.assertEqual(stat.stdout.splitlines(), lines)
+
+    def test_recently_modified_input_skips_stamp(self):
+        """Test an input touched within the current second leaves no stamp"""
+        self.stamp_file.write_text('stale')
+        self.source.touch()
+
+        written = token_gen_module.write_token_stamp(
+            self.stamp_file, self.temp_dir, [self.source], [self.output]
+        )
+
+        self.assertFalse(written)
+        self.assertFalse(self.stamp_file.exists())
+
+
 class TestTokenGeneration(unittest.TestCase):
     """Integration tests for token generation"""
 